@@ -2,6 +2,6 @@
 
 from . import minilzo
 from .cli import app
-from .core import Eco2, Eco2Xml, Header
+from .core import Eco2, Eco2Bytes, Eco2Xml, Header
 
-__all__ = ['Eco2', 'Eco2Xml', 'Header', 'app', 'minilzo']
+__all__ = ['Eco2', 'Eco2Bytes', 'Eco2Xml', 'Header', 'app', 'minilzo']
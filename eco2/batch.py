@@ -0,0 +1,258 @@
+"""
+수정 명세 (TOML, JSON)에 따라 여러 ECO2 파일 일괄 수정.
+
+```toml
+[[operations]]
+op = "set_walls"
+uvalue = 0.15
+surface_type = "외벽(지붕)"
+
+[[operations]]
+op = "set_windows"
+uvalue = 1.2
+shgc = 0.4
+if_empty = "raise"
+
+[[operations]]
+op = "set_elements"
+path = "tbl_zone/침기율"
+value = "0.5"
+edit_none = true
+```
+
+명세의 `operations`를 순서대로 `eco2.editor.Eco2Xml`의 같은 이름 method로
+적용.
+"""
+
+from __future__ import annotations
+
+import csv
+import dataclasses as dc
+import inspect
+import json
+import tomllib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, Self
+
+from eco2 import parallel
+from eco2.editor import Eco2Editor, Eco2Xml
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+
+class EditSpecError(ValueError):  # ruff: ignore[undocumented-public-class]
+    pass
+
+
+@dc.dataclass(frozen=True)
+class Operation:
+    """수정 작업 하나 (`Eco2Xml` method와 인자)."""
+
+    op: str
+    kwargs: dict[str, Any] = dc.field(default_factory=dict)
+
+    OPERATIONS: ClassVar[frozenset[str]] = frozenset({
+        'set_elements',
+        'set_surfaces',
+        'set_walls',
+        'set_windows',
+    })
+
+    @classmethod
+    def create(cls, data: Mapping[str, Any]) -> Self:
+        """
+        명세 항목 (`op`와 인자)으로부터 생성. 인자는 method signature로 검사.
+
+        Parameters
+        ----------
+        data : Mapping[str, Any]
+
+        Returns
+        -------
+        Self
+
+        Raises
+        ------
+        EditSpecError
+            지원하지 않는 작업이거나 인자가 맞지 않는 경우.
+        """
+        kwargs = dict(data)
+        op = kwargs.pop('op', None)
+
+        if op not in cls.OPERATIONS:
+            msg = f'지원하지 않는 작업: {op!r} (지원: {sorted(cls.OPERATIONS)})'
+            raise EditSpecError(msg)
+
+        try:
+            inspect.signature(getattr(Eco2Xml, op)).bind(None, **kwargs)
+        except TypeError as e:
+            msg = f'{op} 인자 오류: {e}'
+            raise EditSpecError(msg) from e
+
+        return cls(op, kwargs)
+
+    def apply(self, xml: Eco2Xml) -> None:
+        """
+        작업 적용.
+
+        Parameters
+        ----------
+        xml : Eco2Xml
+        """
+        getattr(xml, self.op)(**self.kwargs)
+
+
+@dc.dataclass(frozen=True)
+class EditSpec:
+    """
+    수정 명세.
+
+    Parameters
+    ----------
+    operations : tuple[Operation, ...]
+        순서대로 적용할 작업.
+    dsr : bool | None, optional
+        결과 (DSR) 저장 여부. `None`이면 `.eco`, `.ecox`만 제외.
+    """
+
+    operations: tuple[Operation, ...]
+    dsr: bool | None = None
+
+    @classmethod
+    def create(cls, data: Mapping[str, Any]) -> Self:
+        """
+        명세 데이터로부터 생성.
+
+        Parameters
+        ----------
+        data : Mapping[str, Any]
+
+        Returns
+        -------
+        Self
+
+        Raises
+        ------
+        EditSpecError
+        """
+        if unknown := set(data) - {'operations', 'dsr'}:
+            msg = f'알 수 없는 명세 항목: {sorted(unknown)}'
+            raise EditSpecError(msg)
+
+        if not (operations := data.get('operations')):
+            msg = '수정 작업 (`operations`)이 없음'
+            raise EditSpecError(msg)
+
+        return cls(
+            operations=tuple(Operation.create(x) for x in operations),
+            dsr=data.get('dsr'),
+        )
+
+    @classmethod
+    def read(cls, path: str | Path) -> Self:
+        """
+        TOML 또는 JSON 명세 파일 읽기.
+
+        Parameters
+        ----------
+        path : str | Path
+
+        Returns
+        -------
+        Self
+        """
+        path = Path(path)
+        text = path.read_text('UTF-8')
+
+        if path.suffix.lower() == '.json':
+            return cls.create(json.loads(text))
+
+        return cls.create(tomllib.loads(text))
+
+    def apply(self, xml: Eco2Xml) -> Eco2Xml:
+        """
+        모든 작업을 순서대로 적용.
+
+        Parameters
+        ----------
+        xml : Eco2Xml
+
+        Returns
+        -------
+        Eco2Xml
+        """
+        for operation in self.operations:
+            operation.apply(xml)
+
+        return xml
+
+    def edit(self, src: str | Path, dst: str | Path) -> None:
+        """
+        파일 수정 후 저장.
+
+        Parameters
+        ----------
+        src : str | Path
+        dst : str | Path
+        """
+        editor = Eco2Editor(src)
+        self.apply(editor.xml)
+        editor.write(dst, dsr=self.dsr)
+
+
+@dc.dataclass(frozen=True)
+class EditResult:
+    """파일별 수정 결과."""
+
+    src: Path
+    dst: Path
+    error: str | None = None
+
+
+def _edit(spec: EditSpec, src: Path, dst: Path) -> EditResult:
+    def edit() -> None:
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        spec.edit(src, dst)
+
+    return EditResult(src, dst, parallel.attempt(edit, dst))
+
+
+def edit_files(
+    spec: EditSpec,
+    files: Sequence[tuple[Path, Path]],
+    *,
+    workers: int | None = None,
+) -> Iterable[EditResult]:
+    """
+    여러 파일 수정. 입력 순서대로 결과 반환.
+
+    Parameters
+    ----------
+    spec : EditSpec
+    files : Sequence[tuple[Path, Path]]
+        (원본, 저장 경로) 목록.
+    workers : int | None, optional
+        Process 수. 1이면 현재 process에서 수정, `None`이면 CPU 수.
+
+    Yields
+    ------
+    EditResult
+    """
+    yield from parallel.run(_edit, spec, files, workers=workers)
+
+
+def write_summary(results: Iterable[EditResult], path: Path) -> None:
+    """
+    파일별 수정 결과 저장 (csv).
+
+    Parameters
+    ----------
+    results : Iterable[EditResult]
+    path : Path
+    """
+    with path.open('w', encoding='UTF-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['src', 'dst', 'error'])
+        for r in results:
+            writer.writerow([r.src.as_posix(), r.dst.as_posix(), r.error or ''])
@@ -1,23 +1,37 @@
 # ruff: file-ignore[undocumented-public-method, undocumented-magic-method]
 from __future__ import annotations
 
+import csv
 import dataclasses as dc
 import functools
+import json
 from collections.abc import (
     Sequence,  # ruff: ignore[typing-only-standard-library-import]
 )
-from pathlib import Path  # ruff: ignore[typing-only-standard-library-import]
+from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, ClassVar, Literal
 
 import cyclopts
 import structlog
 from cyclopts import App, Group, Parameter
-
-from eco2.core import Eco2, Eco2Xml, Header
+from rich.console import Console
+from rich.table import Table
+
+from eco2.core import (
+    DiskCache,
+    Eco2,
+    Eco2Xml,
+    Header,
+    decrypt_xml,
+    encrypt_xml,
+    get_disk_cache,
+    read_header,
+    transcode,
+)
 from eco2.utils import setup_logger, track
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
 
 def _all_unique[T](iterable: Iterable[T]) -> bool:
@@ -108,9 +122,7 @@ class Convert:
                 continue
 
             logger.info(src.as_posix(), dst=dst.as_posix())
-
-            eco = Eco2.read(src)
-            eco.write(dst)
+            transcode(src, dst)
 
 
 @dc.dataclass
@@ -142,6 +154,9 @@ class Decrypt:
     encoding: str = 'UTF-8'
     """Header (json), 데이터 (xml) 저장 인코딩."""
 
+    stream: bool = False
+    """파일 전체를 메모리에 올리지 않고 chunk 단위로 변환 (대용량 파일)."""
+
     ext: _Ext = dc.field(default_factory=_Ext)
 
     def __post_init__(self) -> None:
@@ -180,12 +195,15 @@ class Decrypt:
             xml=xml.as_posix(),
         )
 
-        eco = Eco2.read(src)
+        if self.stream:
+            data = decrypt_xml(src, xml, encoding=self.encoding)
+        else:
+            eco = Eco2.read(src)
+            data = eco.header
+            xml.write_text(eco.xml, encoding=self.encoding)
 
         if header:
-            header.write_text(eco.header.dump(), encoding=self.encoding)
-
-        xml.write_text(eco.xml, encoding=self.encoding)
+            header.write_text(data.dump(), encoding=self.encoding)
 
     def decrypt_eco2od(self, src: Path) -> None:
         name = src.stem if self.unique_stem else src.name
@@ -249,6 +267,9 @@ class Encrypt:
     dsr: bool | None = None
     """결과부 (`<DSR>`) 포함 여부. 포함 시 ECO2에서 불러올 때 오류 발생 가능."""
 
+    stream: bool = False
+    """파일 전체를 메모리에 올리지 않고 chunk 단위로 변환 (대용량 파일)."""
+
     DSR: ClassVar[str] = '<DSR xmlns'
 
     def __post_init__(self) -> None:
@@ -296,6 +317,10 @@ class Encrypt:
         logger.info(xml.as_posix())
         logger.debug('encrypt', header=header, output=output.as_posix())
 
+        if self.stream:
+            encrypt_xml(xml, output, header, encoding=self.encoding, dsr=self.dsr)
+            return
+
         ds, dsr = self._read_xml(xml)
         eco = Eco2(header=header, ds=ds, dsr=dsr)
         eco.write(output, dsr=self.dsr)
@@ -337,6 +362,9 @@ class Prune:
     ext: Sequence[str] = ('.eco', '.ecox', '.tpl', '.tplx')
     """대상 ECO2 파일 확장자 (대소문자 미구분)."""
 
+    tags: Sequence[str] | None = None
+    """제외할 최상위 table. 미지정 시 weather 등 공용 정보 (`TAGS`)."""
+
     TAGS: ClassVar[tuple[str, ...]] = (
         'tbl_buha',
         'tbl_common',
@@ -372,14 +400,12 @@ class Prune:
 
         return paths
 
-    def prune(self, src: Path) -> str:
-        xml = Eco2Xml.read(src)
-
-        for e in tuple(xml.ds.iter()):
-            if e.tag in self.TAGS:
-                xml.ds.remove(e)
+    def iter_prune(self, src: Path) -> Iterator[str]:
+        tags = self.TAGS if self.tags is None else self.tags
+        return Eco2Xml.iter_pruned(src, tags, 'DS')
 
-        return xml.tostring('DS')
+    def prune(self, src: Path) -> str:
+        return ''.join(self.iter_prune(src))
 
     def __call__(self) -> None:
         for src in track(self.input_, description='Pruning...'):
@@ -389,8 +415,358 @@ class Prune:
                 logger.error('파일이 이미 존재합니다', path=dst.as_posix())
                 continue
 
-            xml = self.prune(src)
-            dst.write_text(xml, encoding=self.encoding)
+            try:
+                with dst.open('w', encoding=self.encoding) as f:
+                    f.writelines(self.iter_prune(src))
+            except BaseException:
+                dst.unlink(missing_ok=True)
+                raise
+
+
+@app.command
+@dc.dataclass
+class Ls:
+    """ECO2 저장 파일의 header (프로젝트명, 버전, 작성 시간 등) 목록 출력."""
+
+    input_: Annotated[tuple[Path, ...], Parameter(negative=[])] = (Path(),)
+    """대상 파일 또는 폴더. 폴더는 하위 폴더까지 탐색."""
+
+    _: dc.KW_ONLY
+
+    format_: Annotated[Literal['table', 'json'] | None, Parameter(name='--format')] = (
+        None
+    )
+    """출력 형식. 미지정 시 화면에는 `table`, 파일에는 `json`."""
+
+    output: Path | None = None
+    """결과 저장 경로. 미지정 시 화면에 출력."""
+
+    ext: Sequence[str] = ('.eco', '.ecox', '.tpl', '.tplx', '.ecl2')
+    """대상 ECO2 파일 확장자 (대소문자 미구분)."""
+
+    COLUMNS: ClassVar[tuple[str, ...]] = (
+        'Name',
+        'Desc',
+        'UIVersion',
+        'LGVersion',
+        'MakeTime',
+        'EditTime',
+    )
+
+    def paths(self) -> Iterable[Path]:
+        ext = {x.lower() for x in self.ext}
+
+        for path in self.input_:
+            if not path.is_dir():
+                yield path
+                continue
+
+            yield from sorted(
+                x for x in path.rglob('*') if x.suffix.lower() in ext and x.is_file()
+            )
+
+    def headers(self) -> Iterable[tuple[Path, Header]]:
+        for path in self.paths():
+            try:
+                yield path, read_header(path)
+            except (ValueError, OSError):
+                logger.exception(path.as_posix())
+
+    def _json(self) -> str:
+        data = [
+            {'path': path.as_posix(), **header.asdict()}
+            for path, header in self.headers()
+        ]
+        return json.dumps(data, ensure_ascii=False, indent=2)
+
+    def _table(self) -> Table:
+        table = Table('Path', *self.COLUMNS)
+
+        for path, header in self.headers():
+            data = header.asdict()
+            table.add_row(path.as_posix(), *(data[x] for x in self.COLUMNS))
+
+        return table
+
+    def __call__(self) -> None:
+        format_ = self.format_ or ('table' if self.output is None else 'json')
+
+        if self.output is None:
+            console = Console()
+            if format_ == 'json':
+                console.out(self._json(), highlight=False)
+            else:
+                console.print(self._table())
+        elif format_ == 'json':
+            self.output.write_text(self._json(), encoding='UTF-8')
+        else:
+            with self.output.open('w', encoding='UTF-8') as f:
+                Console(file=f, width=240).print(self._table())
+
+
+@app.command
+@dc.dataclass
+class Cache:
+    """
+    복호화 결과 disk cache 정보 출력 및 정리.
+
+    Cache 폴더는 `ECO2_CACHE_DIR` 환경 변수로 지정.
+    """
+
+    action: Literal['info', 'prune', 'clear'] = 'info'
+    """`info`: 정보 출력, `prune`: `--max-size` 이하로 정리, `clear`: 전체 삭제."""
+
+    _: dc.KW_ONLY
+
+    dir_: Annotated[Path | None, Parameter(name='--dir')] = None
+    """Cache 폴더. 미지정 시 `ECO2_CACHE_DIR` 환경 변수."""
+
+    max_size: int | None = None
+    """최대 크기 [MiB] (`prune`). 미지정 시 `ECO2_CACHE_SIZE` 환경 변수."""
+
+    @functools.cached_property
+    def cache(self) -> DiskCache:
+        if self.dir_ is not None:
+            return DiskCache(self.dir_)
+
+        if (cache := get_disk_cache()) is None:
+            msg = 'cache 폴더를 지정하지 않음 (`--dir`, `ECO2_CACHE_DIR`).'
+            raise ValueError(msg)
+
+        return cache
+
+    def _max_size(self) -> int:
+        if self.max_size is not None:
+            return self.max_size << 20
+
+        return self.cache.max_size or 0
+
+    def _table(self) -> Table:
+        entries = self.cache.entries()
+        table = Table('Dir', 'Files', 'Size [MiB]', 'Max [MiB]')
+        table.add_row(
+            self.cache.root.as_posix(),
+            str(len(entries)),
+            f'{sum(x.size for x in entries) / (1 << 20):.1f}',
+            '-' if self.cache.max_size is None else f'{self.cache.max_size >> 20}',
+        )
+        return table
+
+    def __call__(self) -> None:
+        match self.action:
+            case 'info':
+                Console().print(self._table())
+                return
+            case 'prune':
+                removed = self.cache.prune(self._max_size())
+            case 'clear':
+                removed = self.cache.prune(0)
+
+        logger.info(
+            'cache 정리',
+            files=len(removed),
+            size=f'{sum(x.size for x in removed) / (1 << 20):.1f} MiB',
+        )
+
+
+@app.command
+@dc.dataclass
+class Variant:
+    """
+    기준 ECO2 파일의 설계 변수를 바꾼 변형 파일 일괄 생성.
+
+    변수는 `이름=값` 형식으로 지정. 이름은 `wall_uvalue`, `roof_uvalue`,
+    `floor_uvalue`, `window_uvalue`, `window_shgc` 또는 element 경로
+    (e.g. `tbl_zone/침기율`).
+
+    - 전체 조합: `--param wall_uvalue=0.15,0.2 --param window_shgc=0.4,0.5`
+    - Latin hypercube: `--param wall_uvalue=0.1:0.3 --samples 100`
+    - 목록: `--table variants.csv` (열 이름이 변수 이름인 csv)
+    """
+
+    input_: Path
+    """기준 ECO2 저장 파일."""
+
+    _: dc.KW_ONLY
+
+    param: Sequence[str] = ()
+    """변수별 값 목록 (`이름=값,값,...`) 또는 범위 (`이름=최솟값:최댓값`)."""
+
+    samples: int | None = None
+    """Latin hypercube 표본 수. 지정 시 `--param`은 범위로 해석."""
+
+    seed: int | None = None
+    """Latin hypercube 난수 seed."""
+
+    table: Path | None = None
+    """변형별 변수 목록 csv."""
+
+    output: Path | None = None
+    """저장 폴더. 미지정 시 `{기준 파일 이름}_variants`."""
+
+    suffix: str | None = None
+    """변형 파일 확장자. 미지정 시 기준 파일과 같은 확장자."""
+
+    workers: int | None = None
+    """Process 수. 미지정 시 CPU 수."""
+
+    template: bool = True
+    """변수 조합별 byte template으로 저장 (변형마다 xml을 다시 직렬화하지 않음)."""
+
+    @staticmethod
+    def _value(value: str) -> float | str:
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
+    def _split(self) -> dict[str, str]:
+        params: dict[str, str] = {}
+        for p in self.param:
+            name, sep, value = p.partition('=')
+            if not sep:
+                msg = f'변수는 `이름=값` 형식으로 지정: {p!r}'
+                raise ValueError(msg)
+
+            params[name.strip()] = value.strip()
+
+        return params
+
+    def variants(self) -> list[dict[str, float | str]]:
+        from eco2 import variant  # ruff: ignore[import-outside-top-level]
+
+        if self.table is not None:
+            with self.table.open(encoding='UTF-8-SIG', newline='') as f:
+                return [
+                    {k: self._value(v) for k, v in row.items()}
+                    for row in csv.DictReader(f)
+                ]
+
+        params = self._split()
+        if self.samples is None:
+            return variant.grid({
+                k: [self._value(x) for x in v.split(',')] for k, v in params.items()
+            })
+
+        bounds: dict[str, tuple[float, float]] = {}
+        for k, v in params.items():
+            lower, _, upper = v.partition(':')
+            bounds[k] = (float(lower), float(upper))
+
+        return variant.lhs(bounds, self.samples, seed=self.seed)
+
+    def __call__(self) -> None:
+        from eco2 import variant  # ruff: ignore[import-outside-top-level]
+
+        output = self.output or self.input_.parent / f'{self.input_.stem}_variants'
+        if (output / variant.VariantGenerator.MANIFEST).exists():
+            logger.error('파일이 이미 존재합니다', path=output.as_posix())
+            return
+
+        variants = self.variants()
+        logger.info(self.input_.as_posix(), variants=len(variants))
+
+        generator = variant.VariantGenerator(
+            self.input_, suffix=self.suffix, template=self.template
+        )
+        result = generator.generate(variants, output, workers=self.workers)
+
+        if errors := sum(x.error is not None for x in result):
+            logger.warning('변형 파일 생성 실패', count=errors)
+
+        logger.info('변형 파일 생성 완료', output=output.as_posix(), count=len(result))
+
+
+@app.command
+@dc.dataclass
+class Edit:
+    """
+    수정 명세 (TOML, JSON)에 따라 ECO2 파일 일괄 수정.
+
+    명세의 `operations`를 순서대로 적용 (`set_elements`, `set_walls`,
+    `set_windows`, `set_surfaces`). 결과 폴더에 파일별 성공·실패 목록
+    (`summary.csv`) 저장.
+    """
+
+    spec: Path
+    """수정 명세 파일 (`.toml`, `.json`)."""
+
+    input_: Annotated[tuple[Path, ...], Parameter(negative=[])]
+    """대상 파일 또는 폴더. 폴더는 하위 폴더까지 탐색."""
+
+    _: dc.KW_ONLY
+
+    output: Path
+    """저장 폴더. 입력 폴더의 하위 폴더 구조 유지."""
+
+    ext: Sequence[str] = ('.eco', '.ecox', '.tpl', '.tplx')
+    """대상 ECO2 파일 확장자 (대소문자 미구분)."""
+
+    suffix: str | None = None
+    """저장 파일 확장자 (e.g. `.tplx`, `tplx`). 미지정 시 원본과 같은 확장자."""
+
+    workers: int | None = None
+    """Process 수. 미지정 시 CPU 수."""
+
+    overwrite: bool = False
+    """기존 파일 덮어쓰기 여부."""
+
+    SUMMARY: ClassVar[str] = 'summary.csv'
+
+    def files(self) -> list[tuple[Path, Path]]:
+        ext = {x.lower() for x in self.ext}
+        files: list[tuple[Path, Path]] = []
+
+        for path in self.input_:
+            if not path.is_dir():
+                files.append((path, Path(path.name)))
+                continue
+
+            files.extend(
+                (x, x.relative_to(path))
+                for x in sorted(path.rglob('*'))
+                if x.suffix.lower() in ext and x.is_file()
+            )
+
+        suffix = f'.{self.suffix.removeprefix(".")}' if self.suffix else None
+        return [
+            (src, (self.output / rel).with_suffix(suffix or src.suffix))
+            for src, rel in files
+        ]
+
+    def __call__(self) -> int:
+        from eco2 import batch  # ruff: ignore[import-outside-top-level]
+
+        spec = batch.EditSpec.read(self.spec)
+        files = self.files()
+
+        if not self.overwrite and (exists := [d for _, d in files if d.exists()]):
+            for dst in exists:
+                logger.error('파일이 이미 존재합니다', path=dst.as_posix())
+
+            files = [(s, d) for s, d in files if not d.exists()]
+
+        self.output.mkdir(parents=True, exist_ok=True)
+        results = list(
+            track(
+                batch.edit_files(spec, files, workers=self.workers),
+                description='Editing...',
+                total=len(files),
+            )
+        )
+        batch.write_summary(results, self.output / self.SUMMARY)
+
+        failed = [x for x in results if x.error is not None]
+        table = Table('Files', 'Succeeded', 'Failed')
+        table.add_row(
+            str(len(results)), str(len(results) - len(failed)), str(len(failed))
+        )
+        Console().print(table)
+
+        for result in failed:
+            logger.error(result.src.as_posix(), error=result.error)
+
+        return 1 if failed else 0
 
 
 if __name__ == '__main__':
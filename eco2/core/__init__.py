@@ -1,6 +1,37 @@
 """ECO2 저장 파일 해석."""
 
-from .data import Eco2, Header
+from .cache import CacheStats, TreeCache, get_tree_cache, set_tree_cache
+from .data import SECTIONS, Eco2, Eco2Bytes, Header, Section, transcode
+from .diskcache import DiskCache, get_disk_cache, set_disk_cache
+from .stream import (
+    Eco2Reader,
+    Eco2Writer,
+    decrypt_xml,
+    encrypt_xml,
+    iter_tables,
+    read_header,
+)
 from .xml import Eco2Xml
 
-__all__ = ['Eco2', 'Eco2Xml', 'Header']
+__all__ = [
+    'SECTIONS',
+    'CacheStats',
+    'DiskCache',
+    'Eco2',
+    'Eco2Bytes',
+    'Eco2Reader',
+    'Eco2Writer',
+    'Eco2Xml',
+    'Header',
+    'Section',
+    'TreeCache',
+    'decrypt_xml',
+    'encrypt_xml',
+    'get_disk_cache',
+    'get_tree_cache',
+    'iter_tables',
+    'read_header',
+    'set_disk_cache',
+    'set_tree_cache',
+    'transcode',
+]
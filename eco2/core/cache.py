@@ -0,0 +1,259 @@
+"""
+해석한 `Eco2Xml` tree의 메모리 LRU cache.
+
+같은 ECO2 저장 파일을 반복해서 해석하는 서비스를 위한 선택 기능.
+`set_tree_cache`로 지정하면 `Eco2Xml.read`, `Eco2Editor`가 사용.
+
+Examples
+--------
+>>> cache = set_tree_cache(TreeCache(budget=1 << 30))  # doctest: +SKIP
+>>> xml = Eco2Xml.read('project.tpl')  # doctest: +SKIP
+>>> cache.stats  # doctest: +SKIP
+CacheStats(hits=0, misses=1, evictions=0)
+"""
+
+from __future__ import annotations
+
+import copy
+import dataclasses as dc
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import structlog
+
+from .data import SECTIONS, Eco2Bytes, Section
+from .lazy import Deferred
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from lxml.etree import _Element
+
+    from .xml import Eco2Xml
+
+logger = structlog.stdlib.get_logger()
+
+type _Key = tuple[Path, int, int, tuple[Section, ...], bool]
+type _Section = _Element | Deferred[_Element] | None
+
+
+@dc.dataclass
+class CacheStats:
+    """Cache 사용 통계."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+@dc.dataclass(frozen=True)
+class _Entry:
+    raw: Eco2Bytes
+    ds: _Element | Deferred[_Element]
+    dsr: _Section
+    size: int
+
+
+def _copy[S](section: S) -> S:
+    # 해석한 tree는 복사, 지연된 영역은 공유 (접근할 때마다 새로 해석)
+    if section is None or isinstance(section, Deferred):
+        return section
+
+    return copy.deepcopy(section)
+
+
+class TreeCache:
+    """
+    `Eco2Xml` tree LRU cache.
+
+    (경로, 수정 시간, 크기, 해석 영역)별로 원본 bytes와 tree를 보관하며,
+    추정 메모리 사용량이 `budget`을 넘으면 오래 사용하지 않은 항목부터 삭제.
+    항상 tree 복사본을 반환하므로 반환한 tree를 수정해도 cache는 유지.
+
+    Parameters
+    ----------
+    budget : int, optional
+        메모리 한도 [bytes].
+    """
+
+    NODE_SIZE = 120
+    """Node (element, text) 하나의 추정 메모리 [bytes] (libxml2 `xmlNode`)."""
+
+    def __init__(self, budget: int = 512 << 20) -> None:
+        self.budget = budget
+        self.stats = CacheStats()
+        self._entries: OrderedDict[_Key, _Entry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:  # ruff: ignore[undocumented-magic-method]
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """추정 메모리 사용량 [bytes]."""
+        return self._size
+
+    @staticmethod
+    def _key(
+        src: str | Path,
+        sections: Sequence[Section],
+        cls: type[Eco2Xml],
+    ) -> _Key:
+        path = Path(src).resolve()
+        stat = path.stat()
+        parsed = tuple(x for x in SECTIONS if x in sections)
+        return (path, stat.st_mtime_ns, stat.st_size, parsed, cls.REMOVE_BLANK_TEXT)
+
+    @classmethod
+    def estimate(cls, raw: Eco2Bytes, *sections: _Section) -> int:
+        """
+        추정 메모리 사용량.
+
+        원본 bytes와, 해석한 영역의 node 수에 `NODE_SIZE`를 곱한 값과 원본
+        길이 (text)의 합.
+
+        Parameters
+        ----------
+        raw : Eco2Bytes
+        *sections : _Section
+            해석한 영역 (지연된 영역은 제외).
+
+        Returns
+        -------
+        int
+        """
+        size = len(raw.raw_ds) + len(raw.raw_dsr or b'')
+
+        for section in sections:
+            if section is None or isinstance(section, Deferred):
+                continue
+
+            nodes = section.xpath('count(//node())')
+            size += int(nodes) * cls.NODE_SIZE
+            size += len(raw.raw_ds if section.tag == 'DS' else raw.raw_dsr or b'')
+
+        return size
+
+    def clear(self) -> None:
+        """전체 삭제."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _get(self, key: _Key) -> _Entry | None:
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                self.stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry
+
+    def _put(self, key: _Key, entry: _Entry) -> None:
+        if entry.size > self.budget:
+            logger.debug('cache 한도 초과', path=key[0].as_posix(), size=entry.size)
+            return
+
+        with self._lock:
+            # 같은 파일의 이전 버전 삭제
+            for k in [
+                k for k in self._entries if k[0] == key[0] and k[1:3] != key[1:3]
+            ]:
+                self._size -= self._entries.pop(k).size
+
+            if (old := self._entries.pop(key, None)) is not None:
+                self._size -= old.size
+
+            self._entries[key] = entry
+            self._size += entry.size
+
+            while self._size > self.budget:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+                self.stats.evictions += 1
+
+    def load[T: Eco2Xml](
+        self,
+        cls: type[T],
+        src: str | Path,
+        sections: Sequence[Section] = SECTIONS,
+    ) -> tuple[Eco2Bytes, T]:
+        """
+        ECO2 저장 파일 해석. Cache에 없으면 해석 후 저장.
+
+        Parameters
+        ----------
+        cls : type[T]
+            `Eco2Xml` 또는 하위 class.
+        src : str | Path
+            ECO2 저장 파일 (`.eco`, `.ecox`, `.tpl`, `.tplx`, `.ecl2`).
+        sections : Sequence[Section], optional
+            바로 해석할 영역.
+
+        Returns
+        -------
+        tuple[Eco2Bytes, T]
+            원본 데이터 (공유)와 tree 복사본.
+
+        Raises
+        ------
+        ValueError
+            ECO2 저장 파일이 아닌 경우.
+        """
+        key = self._key(src, sections, cls)
+
+        if (entry := self._get(key)) is None:
+            raw = Eco2Bytes.read(src)
+            if not raw.raw_ds.startswith(b'<DS'):
+                msg = f'ECO2 저장 파일이 아님: {src}'
+                raise ValueError(msg)
+
+            xml = cls.create(raw, sections=sections)
+            ds = vars(xml)['ds']
+            dsr = vars(xml)['dsr']
+            entry = _Entry(
+                raw=raw,
+                ds=_copy(ds),
+                dsr=_copy(dsr),
+                size=self.estimate(raw, ds, dsr),
+            )
+            self._put(key, entry)
+            return raw, xml
+
+        return entry.raw, cls(ds=_copy(entry.ds), dsr=_copy(entry.dsr))
+
+
+_CACHE: TreeCache | None = None
+
+
+def get_tree_cache() -> TreeCache | None:
+    """
+    현재 사용하는 tree cache.
+
+    Returns
+    -------
+    TreeCache | None
+    """
+    return _CACHE
+
+
+def set_tree_cache(cache: TreeCache | None) -> TreeCache | None:
+    """
+    Tree cache 지정. `None`이면 사용하지 않음.
+
+    Parameters
+    ----------
+    cache : TreeCache | None
+
+    Returns
+    -------
+    TreeCache | None
+        지정한 cache.
+    """
+    global _CACHE  # ruff: ignore[global-statement]
+    _CACHE = cache
+    return cache
@@ -1,28 +1,193 @@
 from __future__ import annotations
 
+import contextlib
 import dataclasses as dc
+import functools
 import io
 import json
+import mmap
 import struct
-from itertools import cycle
+from itertools import cycle, islice
 from pathlib import Path
-from typing import IO, TYPE_CHECKING, ClassVar, Self
+from typing import IO, TYPE_CHECKING, ClassVar, Literal, Self
 
 import structlog
 
 from eco2 import minilzo
 
+from .diskcache import get_disk_cache
+from .lazy import Deferred, LazyField, is_deferred
+
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Buffer, Generator, Sequence
 
 logger = structlog.stdlib.get_logger()
 
+PREFIX = struct.Struct('<q')
+"""DS, DSR 길이 prefix (int64)."""
+
+XOR_BLOCK = 1 << 18
+"""`xor_into` 한 번에 처리하는 byte 수 (key 길이의 배수)."""
+
+Section = Literal['DS', 'DSR']
+SECTIONS: tuple[Section, ...] = ('DS', 'DSR')
+
 
 def _lf2crlf(text: str) -> str:
     return text.replace('\r\n', '\n').replace('\n', '\r\n')
 
 
-@dc.dataclass
+def _options(path: Path) -> tuple[bool, bool]:
+    # 확장자에 따른 (xor, MiniLZO 압축) 여부
+    suffix = path.suffix.lower()
+    return suffix.startswith('.eco'), suffix.endswith('x')
+
+
+def _encode(  # ruff: ignore[too-many-arguments]
+    header: Header,
+    ds: bytes,
+    dsr: bytes,
+    *,
+    xor: bool,
+    compress: bool,
+    level: minilzo.Level,
+) -> bytes:
+    # Header, UTF-8 (CRLF) DS, DSR을 ECO2 저장 형식으로 결합
+    header = dc.replace(header, SFType='10' if xor else '00')
+    data = b''.join([
+        header.encode(),
+        PREFIX.pack(len(ds)),
+        ds,
+        PREFIX.pack(len(dsr)),
+        dsr,
+    ])
+
+    if compress:
+        data = minilzo.compress(data, level=level)
+    if xor:
+        data = Eco2.xor(data)
+
+    return data
+
+
+def _decode(data: Buffer, tag: str) -> str:
+    text = str(data, 'UTF-8')
+
+    if not text.startswith(f'<{tag}'):
+        logger.warning('Unexpected %s start', tag, first_line=text[: text.find('\n')])
+
+    return text
+
+
+def _decode_lf(data: Buffer, tag: str) -> str:
+    return _decode(data, tag).replace('\r\n', '\n')
+
+
+def _section(
+    data: memoryview, tag: Section, sections: Sequence[Section]
+) -> str | Deferred[str]:
+    # 대상이 아닌 영역은 bytes만 복사하고 처음 접근할 때 decode
+    if tag in sections:
+        return _decode(data, tag)
+
+    return Deferred(functools.partial(_decode_lf, bytes(data), tag))
+
+
+@contextlib.contextmanager
+def _buffer(data: Buffer | IO[bytes]) -> Generator[memoryview]:
+    # bytes-like 객체 또는 파일의 memoryview.
+    # 실제 파일은 복사 없이 mmap으로 읽고, 그 외 stream은 남은 내용을 읽음.
+    if not hasattr(data, 'read'):
+        with memoryview(data) as view:
+            yield view if view.format == 'B' else view.cast('B')
+        return
+
+    stream: IO[bytes] = data  # type: ignore[assignment]
+    try:
+        fileno = stream.fileno()
+        offset = stream.tell()
+        mm = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # BytesIO 등 fileno가 없는 stream, 빈 파일
+        with memoryview(stream.read()) as view:
+            yield view
+        return
+
+    with mm, memoryview(mm) as view, view[offset:] as sliced:
+        yield sliced
+
+
+def _decrypt(raw: bytearray, *, xor: bool, decompress: bool) -> Buffer:
+    if xor:
+        xor_into(raw, bytes(Eco2.KEY))
+
+    return minilzo.decompress(raw) if decompress else raw
+
+
+@contextlib.contextmanager
+def _plain(src: Path) -> Generator[memoryview]:
+    # xor 복호화, MiniLZO 압축 해제한 ECO2 저장 파일 내용.
+    # Disk cache를 지정한 경우 원본 hash로 cache 확인.
+    xor, decompress = _options(src)
+
+    with src.open('rb') as f:
+        if not (xor or decompress):
+            with _buffer(f) as buffer:
+                yield buffer
+            return
+
+        raw = bytearray(src.stat().st_size)
+        f.readinto(raw)
+
+    if (cache := get_disk_cache()) is None:
+        with _buffer(_decrypt(raw, xor=xor, decompress=decompress)) as buffer:
+            yield buffer
+        return
+
+    key = cache.key(raw, xor=xor, decompress=decompress)
+    with cache.open(key) as cached:
+        if cached is not None:
+            yield cached
+            return
+
+    data = _decrypt(raw, xor=xor, decompress=decompress)
+    cache.put(key, data)
+    with _buffer(data) as buffer:
+        yield buffer
+
+
+def xor_into(buffer: bytearray | memoryview, key: bytes, offset: int = 0) -> None:
+    """
+    Buffer 전체에 반복 key xor 적용 (in-place).
+
+    key를 block 길이로 이어 붙여 하나의 정수로 만든 뒤 block 단위로 xor.
+
+    Parameters
+    ----------
+    buffer : bytearray | memoryview
+        쓰기 가능한 buffer.
+    key : bytes
+    offset : int, optional
+        `buffer[0]`의 전체 stream 내 위치.
+        나눠 읽은 chunk의 key 위상을 맞추기 위해 지정.
+    """
+    view = memoryview(buffer).cast('B')
+    if not (size := len(view)):
+        return
+
+    shift = offset % len(key)
+    block = min(size, XOR_BLOCK - XOR_BLOCK % len(key))
+    tiled = (key[shift:] + key[:shift]) * (block // len(key) + 1)
+    mask = int.from_bytes(tiled[:block], 'little')
+
+    for start in range(0, size, block):
+        chunk = view[start : start + block]
+        length = len(chunk)
+        m = mask if length == block else mask & ((1 << (8 * length)) - 1)
+        chunk[:] = (int.from_bytes(chunk, 'little') ^ m).to_bytes(length, 'little')
+
+
+@dc.dataclass(slots=True)
 class Header:
     """프로젝트 메타 정보."""
 
@@ -47,6 +212,25 @@ class Header:
         (19, 'EditTime'),
     )
 
+    SIZE: ClassVar[int] = sum(x[0] for x in KEYS)
+    """ECO2 저장 파일 내 header 크기 [bytes]."""
+
+    @classmethod
+    def decode(cls, data: Buffer) -> Self:
+        """
+        Decode from buffer.
+
+        Parameters
+        ----------
+        data : Buffer
+            Header로 시작하는 buffer.
+
+        Returns
+        -------
+        Self
+        """
+        return cls.read(io.BytesIO(bytes(memoryview(data)[: cls.SIZE])))
+
     @classmethod
     def read(cls, stream: IO[bytes]) -> Self:
         """
@@ -94,8 +278,17 @@ class Header:
         -------
         str
         """
-        data = {k: v.rstrip('\x00') for k, v in dc.asdict(self).items()}
-        return json.dumps(data, ensure_ascii=False, indent=indent)
+        return json.dumps(self.asdict(), ensure_ascii=False, indent=indent)
+
+    def asdict(self) -> dict[str, str]:
+        """
+        Header 항목 dict (끝의 null 문자 제외).
+
+        Returns
+        -------
+        dict[str, str]
+        """
+        return {key: getattr(self, key).rstrip('\x00') for _, key in self.KEYS}
 
     def _encode(self) -> Generator[bytes]:
         for width, key in self.KEYS:
@@ -120,18 +313,20 @@ class Eco2:
     header: Header
     """프로젝트 메타 정보 (ECO2 버전, 프로젝트명 등)"""
 
-    ds: str
+    ds: LazyField[str] = LazyField()
     """설계 정보 및 계산 데이터베이스"""
 
-    dsr: str | None
+    dsr: LazyField[str | None] = LazyField()
     """계산 결과"""
 
     KEY: ClassVar[tuple[int, ...]] = (172, 41, 85, 66)
     EMPTY_DSR: ClassVar[str] = '<DSR xmlns="http://tempuri.org/DSR.xsd"></DSR>'
 
     def __post_init__(self) -> None:  # ruff: ignore[undocumented-magic-method]
-        self.ds = self.ds.replace('\r\n', '\n')
-        if self.dsr is not None:
+        # 지연 decode 영역은 decode할 때 변환
+        if not is_deferred(self, 'ds'):
+            self.ds = self.ds.replace('\r\n', '\n')
+        if not is_deferred(self, 'dsr') and self.dsr is not None:
             self.dsr = self.dsr.replace('\r\n', '\n')
 
     @property
@@ -143,72 +338,164 @@ class Eco2:
         return f'{self.ds}\n{self.dsr}'
 
     @classmethod
-    def xor(cls, data: bytes) -> bytes:
+    def xor_reference(cls, data: bytes, offset: int = 0) -> bytes:
         """
-        ECO2 `Pub.cs`의 decrypt, encrypt 재현.
+        ECO2 `Pub.cs`의 decrypt, encrypt 재현 (byte 단위 참조 구현).
 
         Parameters
         ----------
         data : bytes
+        offset : int, optional
+            `data[0]`의 전체 stream 내 위치.
 
         Returns
         -------
         bytes
         """
-        return bytes(d ^ k for d, k in zip(data, cycle(cls.KEY), strict=False))
+        key = islice(cycle(cls.KEY), offset % len(cls.KEY), None)
+        return bytes(d ^ k for d, k in zip(data, key, strict=False))
 
     @classmethod
-    def parse(cls, data: bytes | IO[bytes]) -> tuple[Header, str, str | None]:
+    def xor_into(cls, buffer: bytearray | memoryview, offset: int = 0) -> None:
         """
-        ECO2 저장 파일을 Header, DS(설계), DSR(해석 결과)로 나눠 해석.
+        ECO2 xor을 buffer에 직접 적용 (in-place).
 
         Parameters
         ----------
-        data : bytes
+        buffer : bytearray | memoryview
+        offset : int, optional
+            `buffer[0]`의 전체 stream 내 위치.
+        """
+        xor_into(buffer, bytes(cls.KEY), offset)
+
+    @classmethod
+    def xor(cls, data: Buffer, offset: int = 0) -> bytes:
+        """
+        ECO2 `Pub.cs`의 decrypt, encrypt 재현.
+
+        Parameters
+        ----------
+        data : Buffer
+        offset : int, optional
+            `data[0]`의 전체 stream 내 위치.
 
         Returns
         -------
-        tuple[Header, str, str | None]
-            Header, DS, DSR
+        bytes
         """
-        stream = data if isinstance(data, IO) else io.BytesIO(data)
-        assert isinstance(stream, io.IOBase)
+        buffer = bytearray(data)
+        cls.xor_into(buffer, offset)
+        return bytes(buffer)
 
-        # header
-        header = Header.read(stream)
+    @classmethod
+    def split(cls, data: Buffer) -> tuple[Header, memoryview, memoryview | None]:
+        """
+        복사 없이 Header, DS, DSR 영역으로 분할.
 
-        # DS
-        length = struct.unpack('<q', stream.read(8))[0]
-        ds = stream.read(length).decode()
+        DSR 존재 여부는 DS 뒤 남은 길이와 int64 길이 prefix로 판단.
 
-        if not ds.startswith('<DS'):
-            logger.warning('Unexpected DS start', first_line=ds.split('\n')[0])
+        Parameters
+        ----------
+        data : Buffer
 
-        # DSR
-        if b'</DSR>' not in data:
+        Returns
+        -------
+        tuple[Header, memoryview, memoryview | None]
+            Header, DS, DSR. DS와 DSR은 `data`의 memoryview.
+
+        Raises
+        ------
+        ValueError
+            Header 또는 DS 길이가 잘못된 경우.
+        """
+        # 반환하는 DS, DSR slice는 원본 buffer를 직접 참조 (view 해제와 무관)
+        with memoryview(data) as base, base.cast('B') as view:
+            size = len(view)
+
+            if size < Header.SIZE + PREFIX.size:
+                msg = f'Data too short for ECO2 file: {size} bytes'
+                raise ValueError(msg)
+
+            header = Header.decode(view)
+
+            # DS
+            offset = Header.SIZE
+            length = PREFIX.unpack_from(view, offset)[0]
+            offset += PREFIX.size
+            if not 0 <= length <= size - offset:
+                msg = f'Invalid DS length: {length} (remaining {size - offset} bytes)'
+                raise ValueError(msg)
+
+            ds = view[offset : offset + length]
+            offset += length
+
+            # DSR
             dsr = None
-        else:
-            length = struct.unpack('<q', stream.read(8))[0]
-            dsr = stream.read(length).decode()
+            if size - offset >= PREFIX.size:
+                length = PREFIX.unpack_from(view, offset)[0]
+                offset += PREFIX.size
+                if 0 <= length <= size - offset:
+                    dsr = view[offset : offset + length]
+
+            return header, ds, dsr
+
+    @classmethod
+    def parse(
+        cls,
+        data: Buffer | IO[bytes],
+        sections: Sequence[Section] = SECTIONS,
+    ) -> tuple[Header, str | Deferred[str], str | Deferred[str] | None]:
+        """
+        ECO2 저장 파일을 Header, DS(설계), DSR(해석 결과)로 나눠 해석.
 
-            if not dsr.startswith('<DSR'):
-                logger.warning('Unexpected DSR start', first_line=dsr.split('\n')[0])
+        파일 객체는 mmap으로 읽어 원본 크기의 복사 없이 DS, DSR을 decode.
 
-        return header, ds, dsr
+        Parameters
+        ----------
+        data : Buffer | IO[bytes]
+            압축 해제, xor 복호화한 데이터 또는 `.tpl` 등의 파일 객체.
+        sections : Sequence[Section], optional
+            바로 decode할 영역. 나머지 영역은 처음 접근할 때 decode.
+
+        Returns
+        -------
+        tuple[Header, str | Deferred[str], str | Deferred[str] | None]
+            Header, DS, DSR
+        """
+        with _buffer(data) as buffer:
+            header, ds, dsr = cls.split(buffer)
+
+            with ds:
+                text = _section(ds, 'DS', sections)
+
+            if dsr is None:
+                return header, text, None
+
+            with dsr:
+                return header, text, _section(dsr, 'DSR', sections)
 
     @classmethod
-    def decrypt(cls, data: bytes, *, xor: bool, decompress: bool) -> Self:
+    def decrypt(
+        cls,
+        data: Buffer,
+        *,
+        xor: bool,
+        decompress: bool,
+        sections: Sequence[Section] = SECTIONS,
+    ) -> Self:
         """
         ECO2 저장 파일 (`.eco`, `.ecox`, `.tpl`, `.tplx`) 데이터 복호화.
 
         Parameters
         ----------
-        data : bytes
+        data : Buffer
             Raw data.
         xor : bool
             xor 적용 여부. `.eco` 또는 `.ecox` 파일이면 `True`.
         decompress : bool
             MiniLZO 압축 해제 여부. `.ecox` 또는 `.tplx` 파일이면 `True`.
+        sections : Sequence[Section], optional
+            바로 decode할 영역. 나머지 영역은 처음 접근할 때 decode.
 
         Returns
         -------
@@ -219,10 +506,10 @@ class Eco2:
         if decompress:
             data = minilzo.decompress(data)
 
-        return cls(*cls.parse(data))
+        return cls(*cls.parse(data, sections))
 
     @classmethod
-    def read(cls, src: str | Path) -> Self:
+    def read(cls, src: str | Path, sections: Sequence[Section] = SECTIONS) -> Self:
         """
         ECO2 저장 파일 (`.eco`, `.ecox`, `.tpl`, `.tplx`) 복호화.
 
@@ -230,21 +517,23 @@ class Eco2:
         ----------
         src : str | Path
             대상 파일 경로
+        sections : Sequence[Section], optional
+            바로 decode할 영역. 나머지 영역은 처음 접근할 때 decode.
 
         Returns
         -------
         Self
         """
-        src = Path(src)
-
-        suffix = src.suffix.lower()
-        xor = suffix.startswith('.eco')
-        decompress = suffix.endswith('x')
-
-        raw = src.read_bytes()
-        return cls.decrypt(raw, xor=xor, decompress=decompress)
-
-    def encrypt(self, *, xor: bool, compress: bool = False) -> bytes:
+        with _plain(Path(src)) as buffer:
+            return cls(*cls.parse(buffer, sections))
+
+    def encrypt(
+        self,
+        *,
+        xor: bool,
+        compress: bool = False,
+        level: minilzo.Level = 'fast',
+    ) -> bytes:
         """
         ECO2 파일로 저장하기 위해 암호화.
 
@@ -253,34 +542,255 @@ class Eco2:
         xor : bool
             xor 적용 여부. `.eco`로 저장할 경우 적용.
         compress : bool, optional
-            MiniLZO 압축 여부. `.ecox`, `.tplx`로 저장할 경우 적용 (오류 발생 가능).
+            MiniLZO 압축 여부. `.ecox`, `.tplx`로 저장할 경우 적용.
+        level : minilzo.Level, optional
+            MiniLZO 압축 모드. `'fast'` 또는 `'best'` (압축률 우선).
 
         Returns
         -------
         bytes
         """
-        # header
-        header = dc.replace(self.header, SFType='10' if xor else '00')
-        data = header.encode()
+        return _encode(
+            self.header,
+            _lf2crlf(self.ds).encode(),
+            _lf2crlf(self.dsr or self.EMPTY_DSR).encode(),
+            xor=xor,
+            compress=compress,
+            level=level,
+        )
+
+    def write(
+        self,
+        dst: str | Path,
+        *,
+        dsr: bool | None = None,
+        level: minilzo.Level = 'fast',
+    ) -> None:
+        """
+        ECO2 저장 파일 (`.eco`, `.ecox`, `.tpl`, `.tplx`, `.ecl2`) 변환 및 저장.
+
+        저장 경로 확장자에 따라 xor 암호화, MiniLZO 압축 여부 자동 결정.
+
+        Parameters
+        ----------
+        dst : str | Path
+            저장 경로.
+        dsr : bool | None
+            DSR (결과) 부분 저장 여부.
+            `None`일 경우, `.eco` 또는 `.ecox`로 저장할 때 DSR 제외.
+        level : minilzo.Level, optional
+            `.ecox`, `.tplx` 저장 시 MiniLZO 압축 모드.
+        """
+        dst = Path(dst)
+
+        suffix = dst.suffix.lower()
+        is_eco = suffix.startswith('.eco')
+        compress = suffix.endswith('x')
+
+        if dsr is None:
+            dsr = not is_eco
+
+        eco = self if dsr else dc.replace(self, dsr=None)
+        data = eco.encrypt(xor=is_eco, compress=compress, level=level)
+        dst.write_bytes(data)
+
+
+@dc.dataclass
+class Eco2Bytes:
+    """
+    DS, DSR을 원본 UTF-8 (CRLF) bytes로 보관하는 ECO2 저장 파일.
+
+    `ds`, `dsr`, `xml`은 처음 접근할 때 decode. 수정하지 않은 데이터는
+    `encrypt`에서 다시 encode하지 않고 그대로 저장하며, `ds`, `dsr`을
+    지정하면 `raw_ds`, `raw_dsr`로 encode.
+    """
+
+    header: Header
+    """프로젝트 메타 정보 (ECO2 버전, 프로젝트명 등)"""
+
+    raw_ds: bytes
+    """설계 정보 및 계산 데이터베이스 (UTF-8, CRLF)"""
+
+    raw_dsr: bytes | None
+    """계산 결과 (UTF-8, CRLF)"""
+
+    @property
+    def ds(self) -> str:
+        """설계 정보 및 계산 데이터베이스. 지정하면 `raw_ds`로 encode."""
+        values = vars(self)
+        if 'ds' not in values:
+            values['ds'] = _decode_lf(self.raw_ds, 'DS')
+
+        return values['ds']
+
+    @ds.setter
+    def ds(self, value: str) -> None:
+        self.raw_ds = _lf2crlf(value).encode()
+        vars(self)['ds'] = value
+
+    @property
+    def dsr(self) -> str | None:
+        """계산 결과. 지정하면 `raw_dsr`로 encode."""
+        values = vars(self)
+        if 'dsr' not in values:
+            values['dsr'] = (
+                None if self.raw_dsr is None else _decode_lf(self.raw_dsr, 'DSR')
+            )
+
+        return values['dsr']
+
+    @dsr.setter
+    def dsr(self, value: str | None) -> None:
+        self.raw_dsr = None if value is None else _lf2crlf(value).encode()
+        vars(self)['dsr'] = value
+
+    @property
+    def xml(self) -> str:
+        """DS, DSR을 합한 xml 형식 정보."""
+        if self.dsr is None:
+            return self.ds
+
+        return f'{self.ds}\n{self.dsr}'
+
+    @classmethod
+    def from_eco2(cls, eco: Eco2) -> Self:
+        """
+        `Eco2`로부터 생성.
+
+        Parameters
+        ----------
+        eco : Eco2
+
+        Returns
+        -------
+        Self
+        """
+        return cls(
+            header=eco.header,
+            raw_ds=_lf2crlf(eco.ds).encode(),
+            raw_dsr=None if eco.dsr is None else _lf2crlf(eco.dsr).encode(),
+        )
+
+    def to_eco2(self) -> Eco2:
+        """
+        `Eco2`로 변환 (DS, DSR decode).
 
-        # DS
-        ds = _lf2crlf(self.ds).encode()
-        data += struct.pack('<q', len(ds))
-        data += ds
+        Returns
+        -------
+        Eco2
+        """
+        return Eco2(header=self.header, ds=self.ds, dsr=self.dsr)
 
-        # DSR
-        dsr = _lf2crlf(self.dsr or self.EMPTY_DSR).encode()
-        data += struct.pack('<q', len(dsr))
-        data += dsr
+    @classmethod
+    def parse(cls, data: Buffer | IO[bytes]) -> Self:
+        """
+        복호화한 데이터 또는 `.tpl` 등의 파일 객체 해석.
+
+        Parameters
+        ----------
+        data : Buffer | IO[bytes]
+
+        Returns
+        -------
+        Self
+        """
+        with _buffer(data) as buffer:
+            header, ds, dsr = Eco2.split(buffer)
 
-        if compress:
-            data = minilzo.compress(data)
+            with ds:
+                raw_ds = bytes(ds)
+
+            if dsr is None:
+                return cls(header=header, raw_ds=raw_ds, raw_dsr=None)
+
+            with dsr:
+                return cls(header=header, raw_ds=raw_ds, raw_dsr=bytes(dsr))
+
+    @classmethod
+    def decrypt(cls, data: Buffer, *, xor: bool, decompress: bool) -> Self:
+        """
+        ECO2 저장 파일 (`.eco`, `.ecox`, `.tpl`, `.tplx`) 데이터 복호화.
+
+        Parameters
+        ----------
+        data : Buffer
+            Raw data.
+        xor : bool
+            xor 적용 여부. `.eco` 또는 `.ecox` 파일이면 `True`.
+        decompress : bool
+            MiniLZO 압축 해제 여부. `.ecox` 또는 `.tplx` 파일이면 `True`.
+
+        Returns
+        -------
+        Self
+        """
         if xor:
-            data = self.xor(data)
+            data = Eco2.xor(data)
+        if decompress:
+            data = minilzo.decompress(data)
 
-        return data
+        return cls.parse(data)
 
-    def write(self, dst: str | Path, *, dsr: bool | None = None) -> None:
+    @classmethod
+    def read(cls, src: str | Path) -> Self:
+        """
+        ECO2 저장 파일 (`.eco`, `.ecox`, `.tpl`, `.tplx`) 복호화.
+
+        Parameters
+        ----------
+        src : str | Path
+            대상 파일 경로
+
+        Returns
+        -------
+        Self
+        """
+        with _plain(Path(src)) as buffer:
+            return cls.parse(buffer)
+
+    def encrypt(
+        self,
+        *,
+        xor: bool,
+        compress: bool = False,
+        level: minilzo.Level = 'fast',
+    ) -> bytes:
+        """
+        ECO2 파일로 저장하기 위해 암호화. DS, DSR은 원본 bytes 그대로 저장.
+
+        Parameters
+        ----------
+        xor : bool
+            xor 적용 여부. `.eco`로 저장할 경우 적용.
+        compress : bool, optional
+            MiniLZO 압축 여부. `.ecox`, `.tplx`로 저장할 경우 적용.
+        level : minilzo.Level, optional
+            MiniLZO 압축 모드. `'fast'` 또는 `'best'` (압축률 우선).
+
+        Returns
+        -------
+        bytes
+        """
+        dsr = self.raw_dsr
+        if dsr is None:
+            dsr = _lf2crlf(Eco2.EMPTY_DSR).encode()
+
+        return _encode(
+            self.header,
+            self.raw_ds,
+            dsr,
+            xor=xor,
+            compress=compress,
+            level=level,
+        )
+
+    def write(
+        self,
+        dst: str | Path,
+        *,
+        dsr: bool | None = None,
+        level: minilzo.Level = 'fast',
+    ) -> None:
         """
         ECO2 저장 파일 (`.eco`, `.ecox`, `.tpl`, `.tplx`, `.ecl2`) 변환 및 저장.
 
@@ -293,6 +803,8 @@ class Eco2:
         dsr : bool | None
             DSR (결과) 부분 저장 여부.
             `None`일 경우, `.eco` 또는 `.ecox`로 저장할 때 DSR 제외.
+        level : minilzo.Level, optional
+            `.ecox`, `.tplx` 저장 시 MiniLZO 압축 모드.
         """
         dst = Path(dst)
 
@@ -303,6 +815,67 @@ class Eco2:
         if dsr is None:
             dsr = not is_eco
 
-        eco = self if dsr else dc.replace(self, dsr=None)
-        data = eco.encrypt(xor=is_eco, compress=compress)
+        eco = self if dsr else dc.replace(self, raw_dsr=None)
+        data = eco.encrypt(xor=is_eco, compress=compress, level=level)
         dst.write_bytes(data)
+
+
+def transcode(
+    src: str | Path,
+    dst: str | Path,
+    *,
+    dsr: bool | None = None,
+    level: minilzo.Level = 'fast',
+) -> None:
+    """
+    ECO2 저장 파일 형식 변환 (`.eco`, `.ecox`, `.tpl`, `.tplx`).
+
+    DS, DSR을 decode하지 않고 xor, MiniLZO, header의 `SFType`만 변환.
+    DSR 제외 시 길이 prefix로 DSR 영역을 빈 DSR로 교체.
+
+    Parameters
+    ----------
+    src : str | Path
+        원본 파일.
+    dst : str | Path
+        저장 경로. 확장자에 따라 xor 암호화, MiniLZO 압축 여부 결정.
+    dsr : bool | None, optional
+        DSR (결과) 부분 저장 여부.
+        `None`일 경우, `.eco` 또는 `.ecox`로 저장할 때 DSR 제외.
+    level : minilzo.Level, optional
+        `.ecox`, `.tplx` 저장 시 MiniLZO 압축 모드.
+    """
+    dst = Path(dst)
+    xor, compress = _options(dst)
+
+    if dsr is None:
+        dsr = not xor
+
+    with _plain(Path(src)) as buffer:
+        _, ds, result = Eco2.split(buffer)
+
+        try:
+            section: Buffer = (
+                result
+                if dsr and result is not None
+                else _lf2crlf(Eco2.EMPTY_DSR).encode()
+            )
+            data = bytearray().join([
+                b'10' if xor else b'00',  # SFType
+                buffer[2 : Header.SIZE],
+                PREFIX.pack(len(ds)),
+                ds,
+                PREFIX.pack(memoryview(section).nbytes),
+                section,
+            ])
+        finally:
+            ds.release()
+            if result is not None:
+                result.release()
+
+    if compress:
+        data = bytearray(minilzo.compress(data, level=level))
+    if xor:
+        xor_into(data, bytes(Eco2.KEY))
+
+    dst.write_bytes(data)
@@ -0,0 +1,312 @@
+"""
+복호화·압축 해제한 ECO2 저장 파일 내용의 disk cache.
+
+원본 파일 bytes의 blake2b hash를 key로, header와 DS, DSR을 암호화·압축하지
+않은 ECO2 저장 형식 (`.tpl`과 같은 형식)으로 저장. 바뀌지 않은 `.eco`,
+`.ecox`, `.tplx` 파일은 hash 계산 후 cache 파일을 memory map으로 읽음.
+
+`ECO2_CACHE_DIR` 환경 변수 또는 `set_disk_cache`로 지정하면 `Eco2.read`,
+`Eco2Bytes.read`, `Eco2Xml.read`가 자동으로 사용.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses as dc
+import hashlib
+import mmap
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import structlog
+
+if TYPE_CHECKING:
+    from collections.abc import Buffer, Generator
+
+logger = structlog.stdlib.get_logger()
+
+ENV_DIR = 'ECO2_CACHE_DIR'
+"""Cache 폴더 환경 변수."""
+
+ENV_SIZE = 'ECO2_CACHE_SIZE'
+"""Cache 최대 크기 [bytes] 환경 변수."""
+
+
+@dc.dataclass(frozen=True)
+class CacheEntry:
+    """Cache 파일 정보."""
+
+    path: Path
+    size: int
+    used: float
+    """마지막 사용 시각 (mtime) [s]."""
+
+    @property
+    def key(self) -> str:
+        """원본 파일 hash."""
+        return self.path.stem
+
+
+class DiskCache:
+    """
+    ECO2 저장 파일 내용의 content-addressed disk cache.
+
+    Cache 파일은 임시 파일에 쓴 후 이름을 바꾸므로 (`os.replace`) 여러 process가
+    같은 폴더를 동시에 사용 가능. 읽을 때마다 수정 시각을 갱신하며, 전체
+    크기 (추정값)가 `max_size`를 넘으면 오래 사용하지 않은 파일부터 삭제.
+
+    Parameters
+    ----------
+    root : str | Path
+        Cache 폴더.
+    max_size : int | None, optional
+        최대 크기 [bytes]. `None`이면 제한 없음.
+    """
+
+    SUFFIX = '.eco2'
+    DIGEST_SIZE = 20
+
+    def __init__(self, root: str | Path, max_size: int | None = 4 << 30) -> None:
+        self.root = Path(root)
+        self.max_size = max_size
+
+        # 전체 크기 추정값. 처음 저장할 때 한 번 계산하고 이후 저장·삭제 크기로
+        # 갱신하므로, 다른 process가 저장한 파일은 다음 `prune`까지 반영 안 됨.
+        self._size: int | None = None
+
+    def __repr__(self) -> str:  # ruff: ignore[undocumented-magic-method]
+        return f'{type(self).__name__}({self.root.as_posix()!r}, {self.max_size})'
+
+    @classmethod
+    def from_env(cls) -> DiskCache | None:
+        """
+        환경 변수 (`ECO2_CACHE_DIR`, `ECO2_CACHE_SIZE`)로부터 생성.
+
+        Returns
+        -------
+        DiskCache | None
+            `ECO2_CACHE_DIR`가 없으면 `None`.
+        """
+        if not (root := os.environ.get(ENV_DIR)):
+            return None
+
+        if size := os.environ.get(ENV_SIZE):
+            return cls(root, max_size=int(size))
+
+        return cls(root)
+
+    @classmethod
+    def key(cls, data: Buffer, *, xor: bool, decompress: bool) -> str:
+        """
+        원본 파일 bytes와 복호화 방식의 hash.
+
+        같은 bytes라도 확장자에 따라 복호화 결과가 다르므로 방식을 key에 포함.
+
+        Parameters
+        ----------
+        data : Buffer
+        xor : bool
+            Xor 복호화 여부.
+        decompress : bool
+            MiniLZO 압축 해제 여부.
+
+        Returns
+        -------
+        str
+        """
+        person = f'xor={xor:d},lzo={decompress:d}'.encode()
+        return hashlib.blake2b(
+            data, digest_size=cls.DIGEST_SIZE, person=person
+        ).hexdigest()
+
+    def path(self, key: str) -> Path:
+        """
+        Cache 파일 경로.
+
+        Parameters
+        ----------
+        key : str
+
+        Returns
+        -------
+        Path
+        """
+        return self.root / key[:2] / f'{key}{self.SUFFIX}'
+
+    @contextlib.contextmanager
+    def open(self, key: str) -> Generator[memoryview | None]:
+        """
+        Cache 파일 내용 (memory map). 없으면 `None`.
+
+        Parameters
+        ----------
+        key : str
+
+        Yields
+        ------
+        memoryview | None
+        """
+        path = self.path(key)
+
+        try:
+            f = path.open('rb')
+        except FileNotFoundError:
+            yield None
+            return
+
+        with f:
+            # LRU 순서 갱신
+            with contextlib.suppress(OSError):
+                os.utime(f.fileno() if os.utime in os.supports_fd else path)
+
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # 빈 파일
+                yield None
+                return
+
+            with mm, memoryview(mm) as view:
+                yield view
+
+    def put(self, key: str, data: Buffer) -> None:
+        """
+        Cache 파일 저장 (atomic).
+
+        Parameters
+        ----------
+        key : str
+        data : Buffer
+            복호화, 압축 해제한 ECO2 저장 파일 내용.
+        """
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{key}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+
+            Path(tmp).replace(path)
+        except OSError:
+            # 다른 process가 같은 파일을 쓰거나 읽는 중 (Windows)
+            logger.debug('cache 저장 실패', path=path.as_posix(), exc_info=True)
+            Path(tmp).unlink(missing_ok=True)
+            return
+
+        if self.max_size is None:
+            return
+
+        # 매번 전체 목록을 확인하지 않고 추정 크기가 넘을 때만 정리
+        if self._size is None:
+            self._size = self.size()
+        else:
+            self._size += memoryview(data).nbytes
+
+        if self._size > self.max_size:
+            self.prune(self.max_size)
+
+    def entries(self) -> list[CacheEntry]:
+        """
+        Cache 파일 목록 (오래 사용하지 않은 순서).
+
+        Returns
+        -------
+        list[CacheEntry]
+        """
+        entries: list[CacheEntry] = []
+
+        for path in self.root.glob(f'*/*{self.SUFFIX}'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+
+            entries.append(CacheEntry(path, stat.st_size, stat.st_mtime))
+
+        entries.sort(key=lambda x: x.used)
+        return entries
+
+    def size(self) -> int:
+        """
+        전체 크기 [bytes].
+
+        Returns
+        -------
+        int
+        """
+        return sum(x.size for x in self.entries())
+
+    def prune(self, max_size: int = 0) -> list[CacheEntry]:
+        """
+        전체 크기가 `max_size` 이하가 되도록 오래 사용하지 않은 파일부터 삭제.
+
+        Parameters
+        ----------
+        max_size : int, optional
+            최대 크기 [bytes]. 0이면 전체 삭제.
+
+        Returns
+        -------
+        list[CacheEntry]
+            삭제한 파일.
+        """
+        entries = self.entries()
+        size = sum(x.size for x in entries)
+        removed: list[CacheEntry] = []
+
+        for entry in entries:
+            if size <= max_size:
+                break
+
+            try:
+                entry.path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError:  # 사용 중 (Windows)
+                continue
+
+            size -= entry.size
+            removed.append(entry)
+
+        self._size = size
+        return removed
+
+
+_UNSET = object()
+_CACHE: DiskCache | object | None = _UNSET
+
+
+def get_disk_cache() -> DiskCache | None:
+    """
+    현재 사용하는 disk cache. 지정하지 않았으면 환경 변수로부터 생성.
+
+    Returns
+    -------
+    DiskCache | None
+    """
+    global _CACHE  # ruff: ignore[global-statement]
+
+    if _CACHE is _UNSET:
+        _CACHE = DiskCache.from_env()
+
+    return _CACHE  # type: ignore[return-value]
+
+
+def set_disk_cache(cache: DiskCache | None) -> DiskCache | None:
+    """
+    Disk cache 지정. `None`이면 사용하지 않음.
+
+    Parameters
+    ----------
+    cache : DiskCache | None
+
+    Returns
+    -------
+    DiskCache | None
+        지정한 cache.
+    """
+    global _CACHE  # ruff: ignore[global-statement]
+    _CACHE = cache
+    return cache
@@ -0,0 +1,102 @@
+# ruff: file-ignore[undocumented-magic-method]
+"""처음 접근할 때 계산하는 dataclass field."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, NoReturn, overload
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class Deferred[T]:
+    """
+    `LazyField`에 지정해 처음 접근할 때 계산할 값.
+
+    Parameters
+    ----------
+    func : Callable[[], T]
+        값 계산 함수.
+    """
+
+    __slots__ = ('_func',)
+
+    def __init__(self, func: Callable[[], T]) -> None:
+        self._func = func
+
+    def __call__(self) -> T:
+        """값 계산."""
+        return self._func()
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self._func!r})'
+
+
+class LazyField[T]:
+    """
+    `Deferred` 값을 처음 접근할 때 계산하는 dataclass field descriptor.
+
+    Class에서 접근하면 `AttributeError`를 발생시켜 dataclass가 기본값이 없는
+    field로 인식.
+
+    Examples
+    --------
+    >>> import dataclasses as dc
+    >>> @dc.dataclass
+    ... class Data:
+    ...     value: LazyField[int] = LazyField()
+    >>> data = Data(Deferred(lambda: 42))
+    >>> is_deferred(data, 'value')
+    True
+    >>> data.value
+    42
+    >>> is_deferred(data, 'value')
+    False
+    """
+
+    __slots__ = ('name',)
+
+    def __init__(self) -> None:
+        self.name = ''
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, obj: None, objtype: type | None = None) -> NoReturn: ...
+    @overload
+    def __get__(self, obj: object, objtype: type | None = None) -> T: ...
+    def __get__(self, obj: object | None, objtype: type | None = None) -> Any:
+        if obj is None:
+            raise AttributeError(self.name)
+
+        values = vars(obj)
+        try:
+            value = values[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+        if isinstance(value, Deferred):
+            value = values[self.name] = value()
+
+        return value
+
+    def __set__(self, obj: object, value: T | Deferred[T]) -> None:
+        vars(obj)[self.name] = value
+
+
+def is_deferred(obj: object, name: str) -> bool:
+    """
+    `LazyField` 값이 아직 계산되지 않았는지 여부.
+
+    Parameters
+    ----------
+    obj : object
+    name : str
+        Field 이름.
+
+    Returns
+    -------
+    bool
+    """
+    return isinstance(vars(obj).get(name), Deferred)
@@ -0,0 +1,624 @@
+# ruff: file-ignore[undocumented-magic-method]
+"""
+ECO2 저장 파일과 XML 파일의 chunk 단위 변환.
+
+파일 전체를 메모리에 올리지 않고 xor, MiniLZO 압축 (해제), 줄바꿈 변환을
+chunk 단위로 처리. 사용 메모리는 파일 크기가 아닌 chunk 크기에 비례.
+"""
+
+from __future__ import annotations
+
+import codecs
+import dataclasses as dc
+import itertools
+import operator
+import os
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, ClassVar, Self
+
+import structlog
+from lxml import etree
+
+from eco2.minilzo import Compressor, Decompressor
+
+from .data import (
+    PREFIX,
+    SECTIONS,
+    Eco2,
+    Header,
+    Section,
+    _lf2crlf,
+    _options,
+    xor_into,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Buffer, Generator, Iterable, Iterator, Sequence
+    from types import TracebackType
+
+    from lxml.etree import _Element
+
+    from eco2 import minilzo
+
+logger = structlog.stdlib.get_logger()
+
+CHUNK = 1 << 16
+"""기본 chunk 크기 [bytes]."""
+
+KEY = bytes(Eco2.KEY)
+
+
+def crlf2lf(chunks: Iterable[bytes]) -> Generator[bytes]:
+    """
+    CRLF를 LF로 변환. Chunk 경계에 걸친 CRLF도 변환.
+
+    Parameters
+    ----------
+    chunks : Iterable[bytes]
+
+    Yields
+    ------
+    bytes
+    """
+    carry = b''
+
+    for chunk in chunks:
+        data = carry + chunk
+        if carry := b'\r' if data.endswith(b'\r') else b'':
+            data = data[:-1]
+
+        if data:
+            yield data.replace(b'\r\n', b'\n')
+
+    if carry:
+        yield carry
+
+
+class _Source:
+    """Xor 복호화, MiniLZO 압축 해제한 파일 내용을 순서대로 읽음."""
+
+    def __init__(
+        self,
+        stream: IO[bytes],
+        *,
+        xor: bool,
+        decompress: bool,
+        chunk_size: int,
+    ) -> None:
+        self._stream = stream
+        self._xor = xor
+        self._decompressor = Decompressor() if decompress else None
+        self._chunk_size = chunk_size
+        self._offset = 0  # xor key 위상
+        self._buffer = bytearray()
+        self._eof = False
+
+        self.position = 0
+        """지금까지 읽은 (복호화한) byte 수."""
+        self.size: int | None = (
+            None if decompress else os.fstat(stream.fileno()).st_size
+        )
+        """복호화한 전체 크기. 압축 파일은 첫 chunk를 읽은 후 확인 가능."""
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+
+        if not (raw := self._stream.read(self._chunk_size)):
+            self._eof = True
+            if self._decompressor is not None:
+                self._buffer += self._decompressor.flush()
+            return False
+
+        if self._xor:
+            buffer = bytearray(raw)
+            xor_into(buffer, KEY, self._offset)
+            self._offset += len(buffer)
+            raw = bytes(buffer)
+
+        if self._decompressor is not None:
+            raw = self._decompressor.decompress(raw)
+            self.size = self._decompressor.size
+
+        self._buffer += raw
+        return True
+
+    def read(self, n: int) -> bytes:
+        while len(self._buffer) < n and self._fill():
+            pass
+
+        data = bytes(self._buffer[:n])
+        del self._buffer[:n]
+        self.position += len(data)
+        return data
+
+    def iter(self, n: int) -> Generator[bytes]:
+        while n > 0:
+            if not self._buffer and not self._fill():
+                msg = f'Unexpected end of data ({n} bytes remaining)'
+                raise ValueError(msg)
+
+            data = self.read(min(n, self._chunk_size, len(self._buffer)))
+            n -= len(data)
+            yield data
+
+
+class Eco2Reader:
+    """
+    ECO2 저장 파일 (`.eco`, `.ecox`, `.tpl`, `.tplx`, `.ecl2`)을 chunk 단위로 해석.
+
+    Examples
+    --------
+    >>> with Eco2Reader('project.ecox') as reader:  # doctest: +SKIP
+    ...     for tag, chunks in reader.sections():
+    ...         size = sum(len(x) for x in chunks)
+    """
+
+    def __init__(self, src: str | Path, chunk_size: int = CHUNK) -> None:
+        self.path = Path(src)
+        xor, decompress = _options(self.path)
+
+        self._file = self.path.open('rb')
+        self._source = _Source(
+            self._file, xor=xor, decompress=decompress, chunk_size=chunk_size
+        )
+
+        try:
+            self.header = self._read_header()
+        except BaseException:
+            self._file.close()
+            raise
+
+    def _read_header(self) -> Header:
+        data = self._source.read(Header.SIZE)
+        size = self._source.size or 0
+
+        if size < Header.SIZE + PREFIX.size:
+            msg = f'Data too short for ECO2 file: {size} bytes'
+            raise ValueError(msg)
+
+        return Header.decode(data)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """파일 닫기."""
+        self._file.close()
+
+    def _length(self, tag: str) -> int | None:
+        source = self._source
+        remaining = (source.size or 0) - source.position
+
+        if tag == 'DSR' and remaining < PREFIX.size:
+            return None
+
+        length: int = PREFIX.unpack(source.read(PREFIX.size))[0]
+        remaining -= PREFIX.size
+
+        if 0 <= length <= remaining:
+            return length
+
+        if tag == 'DS':
+            msg = f'Invalid DS length: {length} (remaining {remaining} bytes)'
+            raise ValueError(msg)
+
+        return None
+
+    def sections(self) -> Generator[tuple[str, Iterator[bytes]]]:
+        """
+        DS, DSR 영역을 순서대로 반환.
+
+        각 영역의 chunk는 다음 영역으로 넘어가기 전에 사용해야 함.
+        사용하지 않은 chunk는 건너뜀.
+
+        Yields
+        ------
+        tuple[str, Iterator[bytes]]
+            영역 이름 (`'DS'`, `'DSR'`)과 UTF-8 (CRLF) 데이터 chunk.
+        """
+        for tag in ('DS', 'DSR'):
+            if (length := self._length(tag)) is None:
+                return
+
+            chunks = self._source.iter(length)
+            yield tag, chunks
+
+            for _ in chunks:
+                pass
+
+
+def read_header(src: str | Path, chunk_size: int = 1024) -> Header:
+    """
+    ECO2 저장 파일의 header만 해석.
+
+    `.eco`, `.tpl`은 파일 앞부분만 읽고, `.ecox`, `.tplx`는 header 길이만큼만
+    압축 해제.
+
+    Parameters
+    ----------
+    src : str | Path
+    chunk_size : int, optional
+
+    Returns
+    -------
+    Header
+    """
+    with Eco2Reader(src, chunk_size=chunk_size) as reader:
+        return reader.header
+
+
+def _localname(tag: str) -> str:
+    return tag.rpartition('}')[2]
+
+
+def _iter_rows(
+    chunks: Iterable[bytes],
+    tables: frozenset[str],
+) -> Generator[tuple[str, dict[str, str | None]]]:
+    parser = etree.XMLPullParser(events=('start', 'end'), recover=True, huge_tree=True)
+    root: _Element | None = None
+    depth = 0
+
+    def rows() -> Generator[tuple[str, dict[str, str | None]]]:
+        nonlocal root, depth
+
+        for event, element in parser.read_events():
+            if event == 'start':
+                root = element if root is None else root
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth != 1 or root is None:
+                continue
+
+            # 최상위 table (root의 child)
+            if (tag := _localname(str(element.tag))) in tables:
+                row = {
+                    _localname(x.tag): x.text for x in element if isinstance(x.tag, str)
+                }
+                yield tag, row
+
+            # 해석한 element 삭제
+            element.clear(keep_tail=False)
+            while len(root) > 1:
+                del root[0]
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from rows()
+
+    parser.close()
+    yield from rows()
+
+
+def iter_tables(
+    src: str | Path,
+    tables: Iterable[str],
+    *,
+    sections: Sequence[Section] = SECTIONS,
+    chunk_size: int = CHUNK,
+) -> Generator[tuple[str, dict[str, str | None]]]:
+    """
+    지정한 table의 행을 순서대로 해석.
+
+    전체 tree를 만들지 않고 chunk 단위로 해석하며, 해석한 element는 바로
+    삭제하므로 사용 메모리는 파일 크기와 무관.
+
+    Parameters
+    ----------
+    src : str | Path
+        ECO2 저장 파일 (`.eco`, `.ecox`, `.tpl`, `.tplx`, `.ecl2`).
+    tables : Iterable[str]
+        대상 table (e.g. `tbl_zone`, `tbl_yk`).
+    sections : Sequence[Section], optional
+        대상 영역.
+    chunk_size : int, optional
+
+    Yields
+    ------
+    tuple[str, dict[str, str | None]]
+        Table 이름과 행 (하위 element 이름: 값).
+
+    Examples
+    --------
+    >>> for table, row in iter_tables('project.ecox', ['tbl_zone']):  # doctest: +SKIP
+    ...     print(row['code'], row['설명'])
+    """
+    tables = frozenset(tables)
+
+    with Eco2Reader(src, chunk_size=chunk_size) as reader:
+        for tag, chunks in reader.sections():
+            if tag in sections:
+                yield from _iter_rows(chunks, tables)
+
+
+class Eco2Writer:
+    """
+    ECO2 저장 파일을 chunk 단위로 저장.
+
+    MiniLZO 압축 형식은 전체 크기로 시작하므로 각 영역의 길이를 미리 지정.
+    압축은 Python 구현 (`eco2.minilzo.Compressor`) 사용.
+
+    Examples
+    --------
+    >>> lengths = (len(ds), len(dsr))  # doctest: +SKIP
+    >>> with Eco2Writer('project.tplx', header, lengths) as writer:  # doctest: +SKIP
+    ...     writer.write_section([ds])
+    ...     writer.write_section([dsr])
+    """
+
+    def __init__(
+        self,
+        dst: str | Path,
+        header: Header,
+        lengths: Iterable[int],
+        *,
+        level: minilzo.Level = 'fast',
+    ) -> None:
+        self.path = Path(dst)
+        self._xor, compress = _options(self.path)
+        self._lengths = list(lengths)
+        self._offset = 0
+
+        size = Header.SIZE + sum(PREFIX.size + x for x in self._lengths)
+        self._compressor = Compressor(size, level) if compress else None
+
+        self._file = self.path.open('wb')
+        header = dc.replace(header, SFType='10' if self._xor else '00')
+        self._write(header.encode())
+
+    def _output(self, data: bytes) -> None:
+        if self._xor:
+            buffer = bytearray(data)
+            xor_into(buffer, KEY, self._offset)
+            self._offset += len(buffer)
+            data = bytes(buffer)
+
+        self._file.write(data)
+
+    def _write(self, data: Buffer) -> None:
+        if self._compressor is not None:
+            data = self._compressor.compress(data)
+
+        self._output(bytes(data))
+
+    def write_section(self, chunks: Iterable[Buffer]) -> None:
+        """
+        다음 영역 (DS, DSR) 저장.
+
+        Parameters
+        ----------
+        chunks : Iterable[Buffer]
+            UTF-8 (CRLF) 데이터 chunk.
+
+        Raises
+        ------
+        ValueError
+            영역 수 또는 길이가 지정한 값과 다른 경우.
+        """
+        if not self._lengths:
+            msg = 'No section left to write'
+            raise ValueError(msg)
+
+        length = self._lengths.pop(0)
+        self._write(PREFIX.pack(length))
+
+        written = 0
+        for chunk in chunks:
+            written += memoryview(chunk).nbytes
+            self._write(chunk)
+
+        if written != length:
+            msg = f'Section length mismatch: {written} != {length}'
+            raise ValueError(msg)
+
+    def close(self) -> None:
+        """
+        남은 압축 데이터를 저장하고 파일 닫기.
+
+        오류가 발생하면 불완전한 파일 삭제.
+
+        Raises
+        ------
+        ValueError
+            저장하지 않은 영역이 남았거나 압축한 길이가 지정한 값과 다른 경우.
+        """
+        if self._lengths:
+            self._discard()
+            msg = f'{len(self._lengths)} section(s) not written'
+            raise ValueError(msg)
+
+        try:
+            if self._compressor is not None:
+                self._output(self._compressor.flush())
+        except BaseException:
+            self._discard()
+            raise
+
+        self._file.close()
+
+    def _discard(self) -> None:
+        # 불완전한 파일 삭제
+        self._file.close()
+        self.path.unlink(missing_ok=True)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc is None:
+            self.close()
+        else:
+            self._discard()
+
+
+@dc.dataclass
+class _XmlScanner:
+    """XML 파일 (DS와 DSR을 줄바꿈으로 이어 붙인 형식)을 DS, DSR로 나눠 읽음."""
+
+    path: Path
+    encoding: str = 'UTF-8'
+    chunk_size: int = CHUNK
+
+    DSR: ClassVar[str] = '<DSR xmlns'
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        return self._iter()
+
+    def _iter(self) -> Generator[tuple[str, str]]:
+        # `Path.read_text`와 같이 줄바꿈은 모두 LF로 읽음
+        keep = len(self.DSR)  # 경계에 걸친 태그, DS와 DSR 사이 줄바꿈
+        tail = ''
+
+        yield 'DS', ''
+
+        with self.path.open(encoding=self.encoding) as f:
+            while chunk := f.read(self.chunk_size):
+                text = tail + chunk
+
+                if (idx := text.find(self.DSR)) != -1:
+                    yield 'DS', text[: max(idx - 1, 0)]
+                    yield 'DSR', text[idx:]
+                    while chunk := f.read(self.chunk_size):
+                        yield 'DSR', chunk
+                    return
+
+                yield 'DS', text[:-keep]
+                tail = text[-keep:]
+
+        yield 'DS', tail
+
+    def lengths(self) -> dict[str, int]:
+        """영역별 UTF-8, CRLF 변환 후 byte 수."""
+        lengths = dict.fromkeys(('DS', 'DSR'), 0)
+        found = False
+
+        for tag, text in self:
+            found |= tag == 'DSR'
+            lengths[tag] += len(text.encode()) + text.count('\n')
+
+        if not found:
+            del lengths['DSR']
+
+        return lengths
+
+
+def decrypt_xml(
+    src: str | Path,
+    dst: str | Path,
+    *,
+    encoding: str = 'UTF-8',
+    chunk_size: int = CHUNK,
+) -> Header:
+    """
+    ECO2 저장 파일을 XML 파일로 변환.
+
+    `Eco2.read(src).xml`을 저장한 결과와 같음.
+
+    Parameters
+    ----------
+    src : str | Path
+        ECO2 저장 파일.
+    dst : str | Path
+        저장할 XML 파일 경로.
+    encoding : str, optional
+        XML 저장 인코딩.
+    chunk_size : int, optional
+
+    Returns
+    -------
+    Header
+    """
+    with (
+        Eco2Reader(src, chunk_size=chunk_size) as reader,
+        Path(dst).open('w', encoding=encoding) as f,
+    ):
+        for idx, (tag, chunks) in enumerate(reader.sections()):
+            if idx:
+                f.write('\n')
+
+            decoder = codecs.getincrementaldecoder('UTF-8')()
+            first = True
+
+            for chunk in crlf2lf(chunks):
+                text = decoder.decode(chunk)
+                if first and text:
+                    first = False
+                    if not text.startswith(f'<{tag}'):
+                        logger.warning('Unexpected %s start', tag, path=str(src))
+
+                f.write(text)
+
+            f.write(decoder.decode(b'', final=True))
+
+    return reader.header
+
+
+def encrypt_xml(  # ruff: ignore[too-many-arguments]
+    src: str | Path,
+    dst: str | Path,
+    header: Header,
+    *,
+    encoding: str = 'UTF-8',
+    dsr: bool | None = None,
+    level: minilzo.Level = 'fast',
+    chunk_size: int = CHUNK,
+) -> None:
+    """
+    XML 파일을 ECO2 저장 파일로 변환.
+
+    `Eco2(header, ds, dsr).write(dst)`와 같은 결과. XML 파일은 두 번 읽음
+    (영역 길이 계산, 저장).
+
+    Parameters
+    ----------
+    src : str | Path
+        DS와 DSR을 줄바꿈으로 이어 붙인 XML 파일.
+    dst : str | Path
+        저장 경로. 확장자에 따라 xor 암호화, MiniLZO 압축 여부 결정.
+    header : Header
+    encoding : str, optional
+        XML 파일 인코딩.
+    dsr : bool | None, optional
+        DSR (결과) 부분 저장 여부.
+        `None`일 경우, `.eco` 또는 `.ecox`로 저장할 때 DSR 제외.
+    level : minilzo.Level, optional
+        `.ecox`, `.tplx` 저장 시 MiniLZO 압축 모드.
+    chunk_size : int, optional
+    """
+    dst = Path(dst)
+    scanner = _XmlScanner(Path(src), encoding=encoding, chunk_size=chunk_size)
+
+    if dsr is None:
+        dsr = not _options(dst)[0]
+
+    lengths = scanner.lengths()
+    empty = _lf2crlf(Eco2.EMPTY_DSR).encode()
+    if not dsr or 'DSR' not in lengths:
+        lengths['DSR'] = len(empty)
+        dsr = False
+
+    with Eco2Writer(dst, header, lengths.values(), level=level) as writer:
+        for tag, group in itertools.groupby(scanner, key=operator.itemgetter(0)):
+            if tag == 'DSR' and not dsr:
+                break
+
+            writer.write_section(_lf2crlf(text).encode() for _, text in group)
+
+        if not dsr:
+            writer.write_section([empty])
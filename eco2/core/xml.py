@@ -1,101 +1,403 @@
 from __future__ import annotations
 
+import codecs
+import contextlib
 import dataclasses as dc
+import functools
 import struct
+import sys
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Self
 
 from lxml import etree
 
-from eco2.core import Eco2
+from eco2.core.cache import get_tree_cache
+from eco2.core.data import SECTIONS, Eco2, Eco2Bytes, Header, Section
+from eco2.core.lazy import Deferred, LazyField, is_deferred
+from eco2.core.stream import Eco2Reader, Eco2Writer
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Mapping
-
+    from collections.abc import (
+        Buffer,
+        Generator,
+        Iterable,
+        Iterator,
+        Mapping,
+        Sequence,
+    )
+
+    import polars as pl
     from lxml.etree import _Element
 
+    from eco2 import minilzo
+
+
+CHUNK = 1 << 16
+"""Parser에 한 번에 전달하는 byte 수."""
+
+
+class _Parsers(threading.local):
+    """Thread별 `XMLParser` (설정별 하나씩 재사용)."""
+
+    def __init__(self) -> None:
+        self.parsers: dict[bool, etree.XMLParser] = {}
+
+    def get(self, *, remove_blank_text: bool) -> etree.XMLParser:
+        if (parser := self.parsers.get(remove_blank_text)) is None:
+            parser = self.parsers[remove_blank_text] = etree.XMLParser(
+                recover=True,
+                huge_tree=True,  # 수백 MB 이상의 DSR
+                remove_blank_text=remove_blank_text,
+            )
+
+        return parser
 
-def _split(data: bytes, encoding: str = 'UTF-8') -> tuple[str, str | None]:
+    def discard(self, *, remove_blank_text: bool) -> None:
+        # 해석 중 오류가 발생한 parser는 이전 입력이 남아 있으므로 폐기
+        self.parsers.pop(remove_blank_text, None)
+
+
+_PARSERS = _Parsers()
+
+
+def _split(data: bytes, encoding: str = 'UTF-8') -> tuple[Buffer, Buffer | None]:
+    if codecs.lookup(encoding).name != 'utf-8':
+        data = data.decode(encoding).encode()
+
+    view = memoryview(data)
     tag = b'<DSR xmlns="http://tempuri.org/DSR.xsd">'
-    split = data.split(tag, maxsplit=1)
 
-    ds = split[0].decode(encoding)
-    dsr = None if len(split) == 1 else (tag + split[1]).decode(encoding)
+    if (idx := data.find(tag)) == -1:
+        return view, None
+
+    return view[:idx], view[idx:]
+
+
+def _strip_namespace(chunks: Iterable[bytes], root: bytes) -> Generator[bytes]:
+    # 첫 chunk의 root namespace (`<DS xmlns="..."`) 제거
+    iterator = iter(chunks)
+    head = b''
+    for chunk in iterator:
+        head += chunk
+        if len(head) >= CHUNK:
+            break
+
+    if (idx := head.find(root)) != -1:
+        tag = root[: root.index(b' ')]
+        head = head[:idx] + tag + head[idx + len(root) :]
+
+    yield head
+    yield from iterator
+
+
+class _PruneTarget:
+    """
+    최상위 element 중 지정한 tag를 제외하고 tree를 만드는 parser target.
+
+    제외한 element와 tail은 만들지 않으며, 완성된 최상위 element는 직렬화 후
+    바로 삭제.
+    """
+
+    def __init__(self, tags: frozenset[str], head: str) -> None:
+        self.output: list[str] = []
+        self._builder = etree.TreeBuilder()
+        self._tags = tags
+        self._head = head  # namespace를 포함한 root 시작 태그 앞부분
+        self._root: _Element | None = None
+        self._text: list[str] = []  # root의 text 또는 최상위 element의 tail
+        self._depth = 0
+        self._skip = 0  # 제외 중인 subtree 깊이
+
+    def _flush(self) -> None:
+        if (root := self._root) is None:
+            return
+
+        # TreeBuilder는 다음 event에서 text를 지정하므로 최상위 text는 직접 지정
+        text = ''.join(self._text) or None
+        self._text.clear()
+        if len(root):
+            root[-1].tail = text
+        elif self._head:
+            root.text = text
+
+        if not len(root):
+            return
+
+        if self._head:
+            self._write_head(root)
+
+        for child in list(root):
+            self.output.append(etree.tostring(child, encoding='unicode'))
+            root.remove(child)
+
+    def _write_head(self, root: _Element) -> None:
+        tag = str(root.tag)
+        shallow = etree.Element(tag, root.attrib)
+        shallow.text = root.text
+        text = etree.tostring(shallow, encoding='unicode')
+        close = f'</{tag}>'
+        text = text.removesuffix(close) if text.endswith(close) else f'{text[:-2]}>'
+        self.output.append(self._head + text.removeprefix(f'<{tag}'))
+        self._head = ''
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        self._depth += 1
 
-    return ds, dsr
+        if self._skip:
+            self._skip += 1
+            return
+
+        if self._depth == 2:  # ruff: ignore[magic-value-comparison]
+            self._flush()
+            if tag in self._tags:
+                self._skip = 1
+                return
+
+        element = self._builder.start(tag, attrib)  # type: ignore[func-returns-value]
+        if self._depth == 1:
+            self._root = element
+
+    def end(self, tag: str) -> None:
+        self._depth -= 1
+
+        if self._skip:
+            self._skip -= 1
+            return
+
+        if self._depth or (root := self._root) is None:
+            self._builder.end(tag)
+            return
+
+        # root 종료
+        self._flush()
+        if self._head:
+            text = etree.tostring(root, encoding='unicode')
+            self.output.append(self._head + text.removeprefix(f'<{tag}'))
+        else:
+            self.output.append(f'</{tag}>')
+
+    def data(self, data: str) -> None:
+        if self._skip:
+            return
+
+        if self._depth == 1:
+            self._text.append(data)
+        elif self._depth:
+            self._builder.data(data)
+
+    def comment(self, text: str) -> None:
+        if not self._skip and self._depth > 1:
+            self._builder.comment(text)
+
+    def pi(self, target: str, data: str) -> None:
+        if not self._skip and self._depth > 1:
+            self._builder.pi(target, data)
+
+    def close(self) -> None:
+        pass
+
+
+def _encode(text: str | Deferred[str]) -> bytes | Deferred[bytes]:
+    if isinstance(text, Deferred):
+        return Deferred(lambda: text().encode())
+
+    return text.encode()
+
+
+def _source(
+    src: Eco2 | Eco2Bytes,
+    tag: Section,
+    sections: Sequence[Section],
+) -> Buffer | Deferred[Buffer] | None:
+    # Eco2Bytes는 원본 bytes, Eco2는 encode한 str.
+    # 대상이 아닌 영역은 decode도 처음 접근할 때 (영역 존재 여부를 아는 경우).
+    name = tag.lower()
+
+    if isinstance(src, Eco2Bytes):
+        raw: bytes | None = getattr(src, f'raw_{name}')
+        return raw
+
+    if tag in sections or not is_deferred(src, name):
+        text: str | None = getattr(src, name)
+        return None if text is None else text.encode()
+
+    return _encode(Deferred(functools.partial(getattr, src, name)))
 
 
 @dc.dataclass
 class Eco2Xml:
     """Decrypt한 ECO2 데이터 (xml), ECO2-OD 파일 (.ECL2) 해석."""
 
-    ds: _Element
-    dsr: _Element | None
+    ds: LazyField[_Element] = LazyField()
+    dsr: LazyField[_Element | None] = LazyField()
 
     URI: ClassVar[str] = 'http://tempuri.org/{}.xsd'
+    REMOVE_BLANK_TEXT: ClassVar[bool] = False
+    """해석 시 공백 text 제거 여부. 메모리는 줄지만 저장 시 들여쓰기가 사라짐."""
 
     @classmethod
-    def _create(cls, ds: str, dsr: str | None) -> Self:
-        parser = etree.XMLParser(recover=True)
+    def _parse(cls, data: Buffer | Deferred[Buffer], tag: str) -> _Element:
+        # namespace를 제거하며 UTF-8 bytes를 chunk 단위로 해석
+        if isinstance(data, Deferred):
+            data = data()
 
-        def parse(text: str, tag: str) -> _Element:
-            uri = cls.URI.format(tag)
-            text = text.replace(f'<{tag} xmlns="{uri}"', f'<{tag}')
-            return etree.fromstring(text, parser=parser)
+        parser = _PARSERS.get(remove_blank_text=cls.REMOVE_BLANK_TEXT)
+        view = memoryview(data).cast('B')
+        root = f'<{tag} xmlns="{cls.URI.format(tag)}"'.encode()
+        chunks = (bytes(view[x : x + CHUNK]) for x in range(0, len(view), CHUNK))
 
-        return cls(ds=parse(ds, 'DS'), dsr=None if dsr is None else parse(dsr, 'DSR'))
+        done = False
+        try:
+            for chunk in _strip_namespace(chunks, root):
+                parser.feed(chunk)
+
+            element = parser.close()
+            done = True
+        finally:
+            if not done:
+                _PARSERS.discard(remove_blank_text=cls.REMOVE_BLANK_TEXT)
+
+        return element
+
+    @classmethod
+    def _create(
+        cls,
+        ds: Buffer | Deferred[Buffer],
+        dsr: Buffer | Deferred[Buffer] | None,
+        sections: Sequence[Section] = SECTIONS,
+    ) -> Self:
+        def section(
+            data: Buffer | Deferred[Buffer], tag: Section
+        ) -> _Element | Deferred[_Element]:
+            # 대상이 아닌 영역은 처음 접근할 때 해석
+            if tag in sections:
+                return cls._parse(data, tag)
+
+            return Deferred(functools.partial(cls._parse, data, tag))
+
+        return cls(
+            ds=section(ds, 'DS'),
+            dsr=None if dsr is None else section(dsr, 'DSR'),
+        )
 
     @classmethod
-    def create(cls, src: str | bytes | Eco2) -> Self:
+    def create(
+        cls,
+        src: str | bytes | Eco2 | Eco2Bytes,
+        sections: Sequence[Section] = SECTIONS,
+    ) -> Self:
         """
-        XML 데이터 (str | bytes) 또는 `Eco2`로부터 생성.
+        XML 데이터 (str | bytes) 또는 `Eco2`, `Eco2Bytes`로부터 생성.
 
         Parameters
         ----------
-        src : str | bytes | Eco2
+        src : str | bytes | Eco2 | Eco2Bytes
+        sections : Sequence[Section], optional
+            바로 해석할 영역. 나머지 영역은 처음 접근할 때 해석.
 
         Returns
         -------
         Self
         """
         match src:
-            case Eco2():
-                return cls._create(src.ds, src.dsr)
+            case Eco2() | Eco2Bytes():
+                ds = _source(src, 'DS', sections)
+                assert ds is not None
+                return cls._create(ds, _source(src, 'DSR', sections), sections)
             case str():
                 raw = src.encode()
             case _:
                 raw = src
 
-        ds, dsr = _split(raw)
-        return cls._create(ds, dsr)
+        return cls._create(*_split(raw), sections)
 
     @classmethod
-    def read(cls, src: str | Path, encoding: str = 'UTF-8') -> Self:
+    def read(
+        cls,
+        src: str | Path,
+        encoding: str = 'UTF-8',
+        sections: Sequence[Section] = SECTIONS,
+    ) -> Self:
         """
         ECO2 저장 파일 (`.eco`, `.ecox`, `.tpl`, `.tplx`) 또는 XML 파일 해석.
 
+        Tree cache (`set_tree_cache`)를 지정한 경우 cache 사용.
+
         Parameters
         ----------
         src : str | Path
         encoding : str, optional
+        sections : Sequence[Section], optional
+            바로 해석할 영역. 나머지 영역은 처음 접근할 때 해석.
 
         Returns
         -------
         Self
         """
+        if (cache := get_tree_cache()) is not None:
+            with contextlib.suppress(ValueError, struct.error):
+                return cache.load(cls, src, sections)[1]
+
         try:
-            eco2 = Eco2.read(src)
-            ds = eco2.ds
-            dsr = eco2.dsr
+            eco2: Eco2Bytes | None = Eco2Bytes.read(src)
         except (ValueError, struct.error):
-            ds = None
-            dsr = None
+            eco2 = None
 
-        if ds is None or not ds.startswith('<DS'):
-            # XML 파일
-            ds, dsr = _split(Path(src).read_bytes(), encoding=encoding)
+        if eco2 is not None and eco2.raw_ds.startswith(b'<DS'):
+            return cls.create(eco2, sections=sections)
 
-        return cls._create(ds, dsr)
+        # XML 파일
+        return cls._create(*_split(Path(src).read_bytes(), encoding), sections)
+
+    @classmethod
+    def iter_pruned(
+        cls,
+        src: str | Path,
+        tags: Iterable[str],
+        tag: Section = 'DS',
+        *,
+        chunk_size: int = CHUNK,
+    ) -> Generator[str]:
+        """
+        지정한 최상위 table을 제외한 XML을 chunk 단위로 해석, 직렬화.
+
+        제외할 table은 tree를 만들지 않으며, 나머지 element도 직렬화 후 바로
+        삭제. `Eco2Xml.read`로 해석 후 table을 삭제하고 `tostring`한 결과와 같음.
+
+        Parameters
+        ----------
+        src : str | Path
+            ECO2 저장 파일.
+        tags : Iterable[str]
+            제외할 최상위 table (e.g. `tbl_weather`).
+        tag : Section, optional
+            대상 영역.
+        chunk_size : int, optional
+
+        Yields
+        ------
+        str
+            XML (LF) 조각.
+        """
+        head = f'<{tag} xmlns="{cls.URI.format(tag)}"'
+        target = _PruneTarget(frozenset(tags), head)
+        parser = etree.XMLParser(target=target, recover=True, huge_tree=True)  # type: ignore[call-overload]
+
+        with Eco2Reader(src, chunk_size=chunk_size) as reader:
+            for section, chunks in reader.sections():
+                if section != tag:
+                    continue
+
+                for chunk in _strip_namespace(chunks, head.encode()):
+                    parser.feed(chunk)
+                    if target.output:
+                        yield ''.join(target.output)
+                        target.output.clear()
+
+                parser.close()
+                yield ''.join(target.output)
+                return
 
     def _tostring(self, tag: Literal['DS', 'DSR'], /, **kwargs: Any) -> str:
         if (element := self.ds if tag == 'DS' else self.dsr) is None:
@@ -146,6 +448,136 @@ class Eco2Xml:
         """
         Path(path).write_text(self.tostring(), encoding=encoding)
 
+    def _iter_bytes(self, tag: Section) -> Generator[bytes]:
+        # UTF-8 (LF) xml을 root의 자식 단위로 직렬화.
+        if (element := self.ds if tag == 'DS' else self.dsr) is None:
+            return
+
+        def tostring(e: _Element) -> bytes:
+            return etree.tostring(e, encoding='UTF-8', xml_declaration=False)
+
+        # root 시작 태그와 text
+        root = etree.Element(element.tag, element.attrib)
+        root.text = element.text
+        head = tostring(root)
+        ns = f'<{tag} xmlns="{self.URI.format(tag)}"'.encode()
+        head = ns + head.removeprefix(f'<{tag}'.encode())
+
+        if not len(element):
+            yield head
+            return
+
+        close = f'</{tag}>'.encode()
+        yield head[: -len(close)] if head.endswith(close) else head[:-2] + b'>'
+
+        buffer: list[bytes] = []
+        size = 0
+        for child in element:
+            buffer.append(data := tostring(child))
+            if (size := size + len(data)) >= CHUNK:
+                yield b''.join(buffer)
+                buffer.clear()
+                size = 0
+
+        buffer.append(close)
+        yield b''.join(buffer)
+
+    def iter_bytes(self, tag: Section) -> Generator[bytes]:
+        """
+        ECO2 저장 형식 (UTF-8, CRLF, namespace 포함)으로 직렬화.
+
+        전체 문서를 하나의 str, bytes로 만들지 않고 chunk 단위로 반환.
+
+        Parameters
+        ----------
+        tag : Section
+
+        Yields
+        ------
+        bytes
+        """
+        for chunk in self._iter_bytes(tag):
+            yield chunk.replace(b'\n', b'\r\n')
+
+    def byte_length(self, tag: Section) -> int:
+        """
+        `iter_bytes` 결과의 전체 길이.
+
+        Parameters
+        ----------
+        tag : Section
+
+        Returns
+        -------
+        int
+        """
+        return sum(len(x) + x.count(b'\n') for x in self._iter_bytes(tag))
+
+    def modified(self, tag: Section) -> bool:
+        """
+        영역 수정 여부. 해석하지 않은 (지연된) 영역만 수정되지 않은 것으로 판단.
+
+        Parameters
+        ----------
+        tag : Section
+
+        Returns
+        -------
+        bool
+        """
+        return not is_deferred(self, tag.lower())
+
+    def write_eco2(
+        self,
+        path: str | Path,
+        header: Header,
+        *,
+        dsr: bool | None = None,
+        level: minilzo.Level = 'fast',
+        source: Eco2Bytes | None = None,
+    ) -> None:
+        """
+        ECO2 저장 파일 (`.eco`, `.ecox`, `.tpl`, `.tplx`)로 직접 저장.
+
+        Tree를 chunk 단위로 직렬화해 xor 암호화, MiniLZO 압축 후 저장.
+        영역 길이 계산을 위해 tree를 두 번 직렬화.
+
+        Parameters
+        ----------
+        path : str | Path
+        header : Header
+        dsr : bool | None, optional
+            DSR (결과) 부분 저장 여부.
+            `None`일 경우, `.eco` 또는 `.ecox`로 저장할 때 DSR 제외.
+        level : minilzo.Level, optional
+            `.ecox`, `.tplx` 저장 시 MiniLZO 압축 모드.
+        source : Eco2Bytes | None, optional
+            원본 데이터. 수정하지 않은 영역 (`modified`)은 직렬화하지 않고
+            원본 bytes를 그대로 저장.
+        """
+        path = Path(path)
+
+        if dsr is None:
+            dsr = not path.suffix.lower().startswith('.eco')
+
+        def section(tag: Section) -> tuple[int, Iterable[bytes]]:
+            raw = None if source is None else getattr(source, f'raw_{tag.lower()}')
+            if raw is not None and not self.modified(tag):
+                return len(raw), [raw]
+
+            return self.byte_length(tag), self.iter_bytes(tag)
+
+        ds = section('DS')
+        if dsr and (is_deferred(self, 'dsr') or self.dsr is not None):
+            result = section('DSR')
+        else:
+            empty = Eco2.EMPTY_DSR.encode()
+            result = (len(empty), [empty])
+
+        with Eco2Writer(path, header, (ds[0], result[0]), level=level) as writer:
+            writer.write_section(ds[1])
+            writer.write_section(result[1])
+
     def iterfind(
         self,
         path: str,
@@ -167,3 +599,95 @@ class Eco2Xml:
 
         if self.dsr is not None:
             yield from self.dsr.iterfind(path, namespaces=namespaces)
+
+    def _section(self, tag: Section) -> _Element:
+        if (element := self.ds if tag == 'DS' else self.dsr) is None:
+            raise ValueError(tag)
+
+        return element
+
+    def table(self, name: str, tag: Section = 'DS') -> pl.DataFrame:
+        """
+        최상위 table (e.g. `tbl_zone`)을 DataFrame으로 변환.
+
+        모든 행을 한 번에 순회하며, 반복되는 문자열은 intern. 모든 열은
+        문자열 (`pl.String`)이며, 행마다 없는 항목은 null.
+
+        Parameters
+        ----------
+        name : str
+            Table 이름.
+        tag : Section, optional
+            대상 영역.
+
+        Returns
+        -------
+        pl.DataFrame
+        """
+        import polars as pl  # ruff: ignore[import-outside-top-level]
+
+        columns: dict[str, list[str | None]] = {}
+        for idx, row in enumerate(self._section(tag).iterfind(name)):
+            for child in row:
+                if not isinstance(child.tag, str):
+                    continue
+
+                column = columns.setdefault(child.tag, [None] * idx)
+                if len(column) == idx:
+                    text = child.text
+                    column.append(None if text is None else sys.intern(text))
+
+            for column in columns.values():
+                if len(column) == idx:
+                    column.append(None)
+
+        return pl.DataFrame(columns, schema=dict.fromkeys(columns, pl.String))
+
+    def set_table(self, name: str, data: pl.DataFrame, tag: Section = 'DS') -> Self:
+        """
+        DataFrame 값으로 최상위 table 행 수정.
+
+        `data`의 각 행은 기존 element 순서대로 대응하며, element 순서와
+        DataFrame에 없는 항목은 유지. 값이 바뀐 항목만 수정하고, 없는 항목은
+        행 끝에 추가. 값은 문자열로 변환해 저장.
+
+        Parameters
+        ----------
+        name : str
+            Table 이름.
+        data : pl.DataFrame
+            `table()` 형식의 DataFrame. 행 수는 기존 table과 같아야 함.
+        tag : Section, optional
+            대상 영역.
+
+        Returns
+        -------
+        Self
+
+        Raises
+        ------
+        ValueError
+            행 수가 다른 경우.
+        """
+        import polars as pl  # ruff: ignore[import-outside-top-level]
+
+        rows = list(self._section(tag).iterfind(name))
+        if len(rows) != data.height:
+            msg = f'{name} 행 수 불일치: {len(rows)} != {data.height}'
+            raise ValueError(msg)
+
+        children = [{c.tag: c for c in row if isinstance(c.tag, str)} for row in rows]
+        data = data.cast(pl.String)
+
+        for series in data.iter_columns():
+            field = series.name
+            for row, child, value in zip(
+                rows, (x.get(field) for x in children), series, strict=True
+            ):
+                if child is None:
+                    if value is not None:
+                        etree.SubElement(row, field).text = value
+                elif child.text != value:
+                    child.text = value
+
+        return self
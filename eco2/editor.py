@@ -2,20 +2,27 @@
 
 from __future__ import annotations
 
+import copy
 import dataclasses as dc
 import functools
-from typing import TYPE_CHECKING, ClassVar, Literal, Self
+import hashlib
+import sys
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, Self
+from xml.sax.saxutils import escape
 
 import more_itertools as mi
 import structlog
 from lxml import etree
 
 from eco2 import core
+from eco2.core.lazy import Deferred, is_deferred
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterable
     from pathlib import Path
 
+    import polars as pl
     from lxml.etree import _Element
 
 Level = int | Literal['raise']
@@ -88,6 +95,69 @@ def set_child_text(element: _Element, child: str, value: object) -> None:
     c.text = str(value)
 
 
+@functools.cache
+def _custom_layer_format() -> str:
+    layer = etree.fromstring(CUSTOM_LAYER)
+    set_child_text(layer, 'pcode', '{code}')
+    set_child_text(layer, '열전도율', '{uvalue}')
+    set_child_text(layer, '열저항', '{resistance}')
+    return etree.tostring(layer, encoding='unicode')
+
+
+def custom_layers(layers: Iterable[tuple[str, float]]) -> list[_Element]:
+    """
+    열관류율을 지정하는 사용자 정의 레이어 (`tbl_ykdetail`) 목록.
+
+    모든 레이어를 한 번에 해석.
+
+    Parameters
+    ----------
+    layers : Iterable[tuple[str, float]]
+        벽체 code (`tbl_yk/code`)와 열관류율.
+
+    Returns
+    -------
+    list[_Element]
+    """
+    fmt = _custom_layer_format()
+    text = ''.join(
+        fmt.format(code=escape(code), uvalue=uvalue, resistance=f'{1 / uvalue:.4f}')
+        for code, uvalue in layers
+    )
+    return list(etree.fromstring(f'<layers>{text}</layers>'))
+
+
+def custom_layer(code: str, uvalue: float) -> _Element:
+    """
+    열관류율을 지정하는 사용자 정의 레이어 (`tbl_ykdetail`).
+
+    Parameters
+    ----------
+    code : str
+        벽체 code (`tbl_yk/code`).
+    uvalue : float
+
+    Returns
+    -------
+    _Element
+    """
+    return custom_layers([(code, uvalue)])[0]
+
+
+@dc.dataclass(frozen=True)
+class SurfaceEdits:
+    """`Eco2Xml.set_surfaces` 결과."""
+
+    updated: list[str] = dc.field(default_factory=list)
+    """수정한 표면 code."""
+
+    missing: list[str] = dc.field(default_factory=list)
+    """`tbl_yk`에 없는 code."""
+
+    skipped: list[str] = dc.field(default_factory=list)
+    """해당하지 않는 값만 지정한 code (e.g. 벽체의 SHGC, SHGC가 0인 문)."""
+
+
 @dc.dataclass(frozen=True)
 class Area:
     """면적 정보."""
@@ -128,9 +198,313 @@ class Area:
         )
 
 
+@dc.dataclass
+class ElementIndex:
+    """
+    최상위 table element 색인.
+
+    Tag, (tag, 항목, 값), 표면 유형 (`면형태`)별 element를 문서 순서대로 저장.
+    순서를 유지하는 집합으로 `dict[_Element, None]` 사용.
+    """
+
+    tags: dict[str, dict[_Element, None]] = dc.field(default_factory=dict)
+    """Tag별 element."""
+
+    keys: dict[tuple[str, str, str], dict[_Element, None]] = dc.field(
+        default_factory=dict
+    )
+    """(tag, 항목, 값)별 element."""
+
+    surfaces: dict[int, dict[_Element, None]] = dc.field(default_factory=dict)
+    """`면형태`별 표면 (`tbl_yk`)."""
+
+    roots: list[_Element] = dc.field(default_factory=list, repr=False)
+    """색인한 root (영역)."""
+
+    _entries: dict[_Element, list[dict[_Element, None]]] = dc.field(
+        default_factory=dict, repr=False
+    )
+
+    KEYS: ClassVar[tuple[str, ...]] = ('code', 'pcode', '열관류율2')
+    FIELDS: ClassVar[frozenset[str]] = frozenset([*KEYS, '면형태'])
+    SURFACE: ClassVar[str] = 'tbl_yk'
+
+    @classmethod
+    def create(cls, roots: Iterable[_Element]) -> Self:
+        """
+        각 root의 최상위 table로부터 색인 생성.
+
+        Parameters
+        ----------
+        roots : Iterable[_Element]
+
+        Returns
+        -------
+        Self
+        """
+        index = cls()
+        for root in roots:
+            index.extend(root)
+
+        return index
+
+    def extend(self, root: _Element) -> None:
+        """
+        Root (영역)의 최상위 table 추가.
+
+        Parameters
+        ----------
+        root : _Element
+        """
+        self.roots.append(root)
+        for e in root.iterchildren(tag=etree.Element):
+            self.add(e)
+
+    def _buckets(self, element: _Element) -> list[dict[_Element, None]]:
+        tag = str(element.tag)
+        buckets = [self.tags.setdefault(tag, {})]
+
+        buckets.extend(
+            self.keys.setdefault((tag, field, value), {})
+            for field in self.KEYS
+            if (value := element.findtext(field)) is not None
+        )
+
+        if tag == self.SURFACE:
+            t = int(element.findtext('면형태', -1))
+            buckets.append(self.surfaces.setdefault(t, {}))
+
+        return buckets
+
+    def add(self, element: _Element) -> None:
+        """
+        Element 추가.
+
+        Parameters
+        ----------
+        element : _Element
+        """
+        self._entries[element] = buckets = self._buckets(element)
+        for bucket in buckets:
+            bucket[element] = None
+
+    def discard(self, element: _Element) -> None:
+        """
+        Element 삭제.
+
+        Parameters
+        ----------
+        element : _Element
+        """
+        for bucket in self._entries.pop(element, ()):
+            bucket.pop(element, None)
+
+    def update(self, element: _Element) -> None:
+        """
+        색인 항목 값이 바뀐 element 재색인. 바뀌지 않은 항목의 순서는 유지.
+
+        Parameters
+        ----------
+        element : _Element
+        """
+        if (old := self._entries.get(element)) is None:
+            return
+
+        new = self._buckets(element)
+        for bucket in old:
+            if not any(bucket is b for b in new):
+                bucket.pop(element, None)
+        for bucket in new:
+            bucket.setdefault(element)
+
+        self._entries[element] = new
+
+    def find(self, tag: str, field: str, value: str) -> list[_Element]:
+        """
+        항목 값이 일치하는 element 목록.
+
+        Parameters
+        ----------
+        tag : str
+        field : str
+            `KEYS` 중 하나.
+        value : str
+
+        Returns
+        -------
+        list[_Element]
+        """
+        return list(self.keys.get((tag, field, value), ()))
+
+
+def _digest(element: _Element) -> bytes:
+    return hashlib.blake2b(etree.tostring(element), digest_size=16).digest()
+
+
 @dc.dataclass
 class Eco2Xml(core.Eco2Xml):
-    """XML 개별 element 수정."""
+    """
+    XML 개별 element 수정.
+
+    편집 method로 수정한 영역 (DS, DSR)과 최상위 table을 `changes`에 기록.
+    저장 시 수정하지 않은 영역은 원본 bytes를 그대로 사용하며, `changes`에
+    없는 영역은 해석 직후 tree의 hash와 비교해 수정 여부 판단 (lxml API로
+    직접 수정한 경우 포함).
+    """
+
+    changes: dict[str, set[str]] = dc.field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    """수정한 영역별 최상위 table 목록."""
+
+    _digests: dict[str, bytes] = dc.field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """해석 직후 (지연된 영역은 해석할 때) tree hash 기록."""
+        values = vars(self)
+        for name in ('ds', 'dsr'):
+            if isinstance(value := values[name], Deferred):
+                values[name] = Deferred(functools.partial(self._parsed, name, value))
+            elif value is not None:
+                self._digests[name] = _digest(value)
+
+    def _parsed(self, name: str, parse: Deferred[_Element | None]) -> _Element | None:
+        if (element := parse()) is not None:
+            self._digests[name] = _digest(element)
+
+        return element
+
+    def mark_modified(
+        self, section: core.Section = 'DS', table: str | None = None
+    ) -> None:
+        """
+        영역 수정 기록.
+
+        Parameters
+        ----------
+        section : core.Section, optional
+        table : str | None, optional
+            수정한 최상위 table (e.g. `tbl_yk`).
+        """
+        tables = self.changes.setdefault(section, set())
+        if table is not None:
+            tables.add(table)
+
+    def _touch(self, element: _Element) -> None:
+        # 최상위 table과 root (영역)까지 탐색
+        table = element
+        while (
+            parent := table.getparent()
+        ) is not None and parent.getparent() is not None:
+            table = parent
+
+        root = table if parent is None else parent
+        self.mark_modified(root.tag, None if parent is None else table.tag)  # type: ignore[arg-type]
+
+        # 색인 항목이 수정된 경우 table 재색인
+        if (
+            '_index' in vars(self)
+            and element.getparent() is table
+            and element.tag in ElementIndex.FIELDS
+        ):
+            self.index.update(table)
+
+    @functools.cached_property
+    def _index(self) -> ElementIndex:
+        return ElementIndex()
+
+    @property
+    def index(self) -> ElementIndex:
+        """
+        최상위 table element 색인. 편집 method의 삽입·삭제에 따라 갱신.
+
+        해석하지 않은 DSR은 색인을 위해 해석하지 않고, 이후 해석한 뒤 처음
+        접근할 때 추가.
+        """
+        index = self._index
+        roots = [self.ds]
+        if not is_deferred(self, 'dsr') and self.dsr is not None:
+            roots.append(self.dsr)
+
+        for root in roots:
+            if not any(root is x for x in index.roots):
+                index.extend(root)
+
+        return index
+
+    def _remove(self, element: _Element) -> None:
+        self._touch(element)
+        self.index.discard(element)
+
+        if (parent := element.getparent()) is not None:
+            parent.remove(element)
+
+    def _add_next(self, anchor: _Element, element: _Element) -> None:
+        anchor.addnext(element)
+        self.index.add(element)
+        self._touch(element)
+
+    def modified(self, tag: core.Section) -> bool:
+        """
+        영역 수정 여부.
+
+        `changes`에 기록되지 않은 영역은 해석 직후 tree의 hash와 비교.
+
+        Parameters
+        ----------
+        tag : core.Section
+
+        Returns
+        -------
+        bool
+        """
+        if not super().modified(tag):
+            return False
+
+        if tag in self.changes:
+            return True
+
+        # 편집 method를 거치지 않은 수정 (lxml API, `set_window_uvalue` 등)
+        name = tag.lower()
+        if (element := getattr(self, name)) is None:
+            return False
+
+        digest = self._digests.get(name)
+        return digest is None or _digest(element) != digest
+
+    def copy(self) -> Self:
+        """
+        Tree와 수정 기록 복사본.
+
+        해석하지 않은 DSR은 복사본에서 처음 접근할 때 원본에서 해석·복사하므로,
+        원본 하나로 여러 복사본을 만들 때 파일 해석은 한 번만 수행.
+
+        Returns
+        -------
+        Self
+        """
+        deferred = is_deferred(self, 'dsr')
+        other = type(self)(
+            ds=copy.deepcopy(self.ds),
+            dsr=None if deferred else copy.deepcopy(self.dsr),
+        )
+        other.changes = {k: set(v) for k, v in self.changes.items()}
+        # 원본 bytes 기준 hash 유지
+        other._digests = dict(self._digests)  # ruff: ignore[private-member-access]
+
+        if deferred:
+
+            def dsr() -> _Element | None:
+                element = copy.deepcopy(self.dsr)
+                if (digest := self._digests.get('dsr')) is not None:
+                    other._digests['dsr'] = digest  # ruff: ignore[private-member-access]
+                return element
+
+            vars(other)['dsr'] = Deferred(dsr)
+
+        return other
 
     @functools.cached_property
     def area(self) -> Area:
@@ -141,6 +515,31 @@ class Eco2Xml(core.Eco2Xml):
 
         return Area.create(desc)
 
+    def set_table(
+        self, name: str, data: pl.DataFrame, tag: core.Section = 'DS'
+    ) -> Self:
+        """
+        DataFrame 값으로 최상위 table 행 수정. 수정 기록과 색인 갱신.
+
+        Parameters
+        ----------
+        name : str
+        data : pl.DataFrame
+        tag : core.Section, optional
+
+        Returns
+        -------
+        Self
+        """
+        super().set_table(name, data, tag)
+        self.mark_modified(tag, name)
+
+        if '_index' in vars(self):
+            for row in self._section(tag).iterfind(name):
+                self.index.update(row)
+
+        return self
+
     def set_elements(
         self,
         path: str,
@@ -176,6 +575,7 @@ class Eco2Xml(core.Eco2Xml):
                 continue
 
             e.text = value
+            self._touch(e)
 
         return self
 
@@ -194,9 +594,7 @@ class Eco2Xml(core.Eco2Xml):
         if isinstance(t, str):
             t = SURFACE_TYPE.index(t)
 
-        for e in self.iterfind('tbl_yk'):
-            if int(e.findtext('면형태', -1)) == t:
-                yield e
+        yield from list(self.index.surfaces.get(t, ()))
 
     def set_wall_uvalue(self, wall: _Element, uvalue: float) -> None:
         """
@@ -206,27 +604,31 @@ class Eco2Xml(core.Eco2Xml):
         ----------
         wall : _Element
         uvalue : float
+
+        Raises
+        ------
+        ElementNotFoundError
+            기존 레이어 (`tbl_ykdetail`)가 없는 경우.
         """
         code = wall.findtext('code')
         assert code is not None
 
         # 기존 레이어 삭제
-        for layer in self.iterfind('tbl_ykdetail'):
-            if layer.findtext('pcode') == code:
-                self.ds.remove(layer)
+        for layer in self.index.find('tbl_ykdetail', 'pcode', code):
+            self._remove(layer)
 
         # 새 레이어 추가
-        layer = etree.fromstring(CUSTOM_LAYER)
-        set_child_text(layer, 'pcode', code)
-        set_child_text(layer, '열전도율', str(uvalue))
-        set_child_text(layer, '열저항', f'{1 / uvalue:.4f}')
+        layer = custom_layer(code, uvalue)
+
+        if not (layers := self.index.tags.get('tbl_ykdetail')):
+            msg = 'tbl_ykdetail'
+            raise ElementNotFoundError(msg)
 
-        last_layer = mi.last(self.iterfind('tbl_ykdetail'))
-        index = self.ds.index(last_layer) + 1
-        self.ds.insert(index, layer)
+        self._add_next(next(reversed(layers)), layer)
 
         # 벽체 열관류율 수정
         set_child_text(wall, '열관류율', uvalue)
+        self._touch(wall)
 
     @staticmethod
     def set_window_uvalue(window: _Element, uvalue: float) -> None:
@@ -278,6 +680,7 @@ class Eco2Xml(core.Eco2Xml):
 
         # 일사에너지투과율 수정
         set_child_text(window, path, shgc)
+        self._touch(window)
 
         # 전체 투과율 수정
         if balcony := float(window.findtext('발코니투과율') or 0):
@@ -287,9 +690,9 @@ class Eco2Xml(core.Eco2Xml):
             # tbl_myoun 투과율 수정
             pcode = window.findtext('code')
             assert pcode is not None
-            for e in self.iterfind('tbl_myoun'):
-                if e.findtext('열관류율2') == pcode:
-                    set_child_text(e, '투과율', total)
+            for e in self.index.find('tbl_myoun', '열관류율2', pcode):
+                set_child_text(e, '투과율', total)
+                self._touch(e)
 
     def set_walls(
         self,
@@ -377,17 +780,241 @@ class Eco2Xml(core.Eco2Xml):
 
             if uvalue is not None:
                 self.set_window_uvalue(window=w, uvalue=uvalue)
+                self._touch(w)
             if shgc is not None:
                 self.set_window_shgc(window=w, shgc=shgc, update_zero=update_zero_shgc)
 
         return self
 
+    @staticmethod
+    def _surface_values(
+        data: Mapping[str, Mapping[str, float | None]] | pl.DataFrame,
+        code: str,
+    ) -> dict[str, dict[str, float]]:
+        # code별 {항목: 값}. None (null) 값은 제외.
+        rows: Iterable[dict[str, Any]] = (
+            ({code: k, **v} for k, v in data.items())
+            if isinstance(data, Mapping)
+            else data.iter_rows(named=True)
+        )
+
+        values: dict[str, dict[str, float]] = {}
+        for row in rows:
+            key = str(row.pop(code))
+            values.setdefault(key, {}).update(
+                (k, float(v)) for k, v in row.items() if v is not None
+            )
+
+        return values
+
+    def set_surfaces(
+        self,
+        data: Mapping[str, Mapping[str, float | None]] | pl.DataFrame,
+        *,
+        code: str = 'code',
+        update_zero_shgc: bool = False,
+    ) -> SurfaceEdits:
+        """
+        표면 (`tbl_yk`) code별 열관류율, SHGC 일괄 수정.
+
+        색인으로 대상 표면, 레이어, `tbl_myoun`을 찾으며, 벽체 레이어는
+        기존 레이어를 모두 삭제한 후 마지막 `tbl_ykdetail` 뒤에 `data`
+        순서대로 추가. `tbl_yk`에 없는 code는 오류 대신 결과에 기록.
+
+        Parameters
+        ----------
+        data : Mapping[str, Mapping[str, float | None]] | pl.DataFrame
+            code별 `uvalue`, `shgc`. DataFrame은 `code`, `uvalue`, `shgc` 열.
+        code : str, optional
+            DataFrame의 code 열 이름.
+        update_zero_shgc : bool, optional
+            기존 SHGC가 0일 때 (문으로 추정) 수정 여부.
+
+        Returns
+        -------
+        SurfaceEdits
+
+        Raises
+        ------
+        EditorError
+            알 수 없는 항목이 있는 경우.
+        ElementNotFoundError
+            벽체를 수정하는데 `tbl_ykdetail`이 없는 경우.
+
+        Examples
+        --------
+        >>> edits = xml.set_surfaces({  # doctest: +SKIP
+        ...     '0001': {'uvalue': 0.15},
+        ...     '0006': {'uvalue': 1.2, 'shgc': 0.4},
+        ... })
+        >>> edits.missing  # doctest: +SKIP
+        []
+        """
+        surface_values = self._surface_values(data, code)
+        if unknown := {k for v in surface_values.values() for k in v} - {
+            'uvalue',
+            'shgc',
+        }:
+            msg = f'알 수 없는 항목: {sorted(unknown)}'
+            raise EditorError(msg)
+
+        result = SurfaceEdits()
+        windows = {SURFACE_TYPE.index('외부창'), SURFACE_TYPE.index('내부창')}
+        walls: dict[str, tuple[list[_Element], float]] = {}
+
+        for key, values in surface_values.items():
+            if not (surfaces := self.index.find('tbl_yk', 'code', key)):
+                result.missing.append(key)
+                continue
+
+            updated = False
+            for surface in surfaces:
+                if int(surface.findtext('면형태', -1)) in windows:
+                    updated |= self._set_window_values(
+                        surface, values, update_zero=update_zero_shgc
+                    )
+                elif (uvalue := values.get('uvalue')) is not None:
+                    walls.setdefault(key, ([], uvalue))[0].append(surface)
+                    updated = True
+
+            (result.updated if updated else result.skipped).append(key)
+
+        if walls:
+            if not (layers := self.index.tags.get('tbl_ykdetail')):
+                msg = 'tbl_ykdetail'
+                raise ElementNotFoundError(msg)
+
+            self._set_wall_layers(walls, next(reversed(layers)))
+
+        return result
+
+    def _set_window_values(
+        self,
+        window: _Element,
+        values: dict[str, float],
+        *,
+        update_zero: bool,
+    ) -> bool:
+        updated = False
+
+        if (uvalue := values.get('uvalue')) is not None:
+            self.set_window_uvalue(window=window, uvalue=uvalue)
+            self._touch(window)
+            updated = True
+
+        if (shgc := values.get('shgc')) is not None and (
+            update_zero or float(window.findtext('일사에너지투과율') or 0) != 0  # ruff: ignore[float-equality-comparison]
+        ):
+            self.set_window_shgc(window, shgc, update_zero=True)
+            updated = True
+
+        return updated
+
+    def _set_wall_layers(
+        self,
+        walls: dict[str, tuple[list[_Element], float]],
+        anchor: _Element,
+    ) -> None:
+        # 기존 레이어를 모두 삭제하고 마지막 레이어 (`anchor`) 뒤에 새 레이어 추가.
+        # 수정 기록은 table별로 한 번만 갱신.
+        old = [x for c in walls for x in self.index.find('tbl_ykdetail', 'pcode', c)]
+        layers = custom_layers((c, uvalue) for c, (_, uvalue) in walls.items())
+
+        for layer in layers:
+            anchor.addnext(layer)
+            self.index.add(layer)
+            anchor = layer
+
+        for layer in old:
+            self.index.discard(layer)
+            if (parent := layer.getparent()) is not None:
+                parent.remove(layer)
+
+        self._touch(anchor)
+
+        for surfaces, uvalue in walls.values():
+            for surface in surfaces:
+                set_child_text(surface, '열관류율', uvalue)
+
+        self._touch(next(iter(walls.values()))[0][0])
+
+
+@dc.dataclass(frozen=True)
+class MemoryUsage:
+    """`Eco2Editor`가 보관하는 데이터의 추정 메모리 사용량 [bytes]."""
+
+    raw: int
+    """원본 bytes (DS, DSR)."""
+
+    text: int
+    """Decode한 문자열 (`eco2`)."""
+
+    tree: int
+    """해석한 tree (node 수와 `core.TreeCache.NODE_SIZE`의 곱)."""
+
+    @property
+    def total(self) -> int:
+        """전체."""
+        return self.raw + self.text + self.tree
+
 
 @dc.dataclass(frozen=True)
 class Eco2Editor:
-    """ECO2 파일 수정."""
+    """
+    ECO2 파일 수정.
+
+    DSR은 처음 접근할 때 해석하며, 저장 시 수정하지 않은 영역은
+    원본 bytes를 그대로 사용. Tree cache (`core.set_tree_cache`)를 지정한
+    경우 파일 해석에 cache 사용.
+
+    `low_memory`를 지정하면 해석 후 header와 tree (및 해석하지 않은 DSR
+    bytes)만 보관 (`release`).
+    """
 
-    src: str | Path | core.Eco2
+    src: str | Path | core.Eco2 | core.Eco2Bytes
+
+    _: dc.KW_ONLY
+
+    low_memory: bool = False
+    """해석 후 원본 bytes, decode한 문자열 해제 여부."""
+
+    @functools.cached_property
+    def _cached(self) -> tuple[core.Eco2Bytes, Eco2Xml] | None:
+        if isinstance(self.src, core.Eco2 | core.Eco2Bytes) or (
+            (cache := core.get_tree_cache()) is None
+        ):
+            return None
+
+        return cache.load(Eco2Xml, self.src, sections=('DS',))
+
+    @functools.cached_property
+    def raw(self) -> core.Eco2Bytes:
+        """
+        원본 ECO2 bytes. `release` 후에는 원본을 다시 읽음.
+
+        Returns
+        -------
+        core.Eco2Bytes
+        """
+        match self.src:
+            case core.Eco2Bytes():
+                return self.src
+            case core.Eco2():
+                return core.Eco2Bytes.from_eco2(self.src)
+            case _ if self._cached is not None:
+                return self._cached[0]
+            case _:
+                return core.Eco2Bytes.read(self.src)
+
+    @functools.cached_property
+    def header(self) -> core.Header:
+        """프로젝트 메타 정보."""
+        return self.raw.header
+
+    @functools.cached_property
+    def _source(self) -> core.Eco2Bytes:
+        # 저장 시 수정하지 않은 영역에 사용할 원본
+        return self.raw
 
     @functools.cached_property
     def eco2(self) -> core.Eco2:
@@ -398,12 +1025,78 @@ class Eco2Editor:
         -------
         core.Eco2
         """
-        return self.src if isinstance(self.src, core.Eco2) else core.Eco2.read(self.src)
+        return self.src if isinstance(self.src, core.Eco2) else self.raw.to_eco2()
 
     @functools.cached_property
     def xml(self) -> Eco2Xml:
         """XML 모델 설계 정보."""
-        return Eco2Xml.create(self.eco2)
+        if self._cached is not None:
+            xml = self._cached[1]
+        else:
+            xml = Eco2Xml.create(self.raw, sections=('DS',))
+
+        if self.low_memory:
+            vars(self)['xml'] = xml
+            self.release()
+
+        return xml
+
+    def release(self) -> None:
+        """
+        원본 bytes와 decode한 문자열 (`eco2`) 해제.
+
+        Header와 tree만 보관하며, 해석하지 않은 DSR은 원본 bytes를 유지.
+        이후 DS (와 해석한 DSR)는 수정 여부와 관계없이 tree에서 직렬화해
+        저장.
+        """
+        xml = self.xml
+        header = self.header
+        dsr = self._source.raw_dsr if is_deferred(xml, 'dsr') else None
+
+        if not is_deferred(xml, 'dsr') and xml.dsr is not None:
+            xml.mark_modified('DSR')
+        xml.mark_modified('DS')
+
+        for name in ('_cached', 'raw', 'eco2'):
+            vars(self).pop(name, None)
+
+        vars(self)['_source'] = core.Eco2Bytes(header, raw_ds=b'', raw_dsr=dsr)
+
+    def memory(self) -> MemoryUsage:
+        """
+        보관 중인 데이터의 추정 메모리 사용량.
+
+        Returns
+        -------
+        MemoryUsage
+        """
+        held = vars(self)
+        sources = [x for x in (held.get('raw'), held.get('_source')) if x is not None]
+
+        # 같은 객체를 여러 곳에서 참조하는 경우 한 번만 계산
+        raw = {id(b): b for x in sources for b in (x.raw_ds, x.raw_dsr) if b}
+        text = {
+            id(t): t
+            for x in [*sources, held.get('eco2')]
+            if x is not None
+            for t in (vars(x).get('ds'), vars(x).get('dsr'))
+            if isinstance(t, str)
+        }
+
+        tree = 0
+        if (xml := held.get('xml')) is not None:
+            roots = [getattr(xml, x) for x in ('ds', 'dsr') if not is_deferred(xml, x)]
+            tree = sum(
+                int(e.xpath('count(//node())')) * core.TreeCache.NODE_SIZE
+                for e in roots
+                if e is not None
+            )
+
+        return MemoryUsage(
+            raw=sum(map(sys.getsizeof, raw.values())),
+            text=sum(map(sys.getsizeof, text.values())),
+            tree=tree,
+        )
 
     def write(self, path: str | Path, *, dsr: bool | None = None) -> None:
         """
@@ -414,9 +1107,4 @@ class Eco2Editor:
         path : str | Path
         dsr : bool, optional
         """
-        eco2 = core.Eco2(
-            header=self.eco2.header,
-            ds=self.xml.tostring('DS'),
-            dsr=self.xml.tostring('DSR'),
-        )
-        eco2.write(path, dsr=dsr)
+        self.xml.write_eco2(path, self.header, dsr=dsr, source=self._source)
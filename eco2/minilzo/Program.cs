@@ -1,12 +1,21 @@
+using System.Text;
+
 namespace MiniLZO
 {
     class Program
     {
         static void Main(string[] args)
         {
+            if (args.Length == 1 && args[0] == "serve")
+            {
+                Serve();
+                return;
+            }
+
             if (args.Length < 3)
             {
                 Console.WriteLine("Usage: MiniLZO <compress|decompress> <inputFile> <outputFile>");
+                Console.WriteLine("       MiniLZO serve");
                 return;
             }
 
@@ -41,5 +50,63 @@ namespace MiniLZO
                 Environment.Exit(1);
             }
         }
+
+        // Worker mode. stdin/stdout으로 여러 요청을 순서대로 처리.
+        // 요청: mode (1 byte, 'c' 또는 'd') + int32 길이 + 데이터
+        // 응답: status (1 byte, 0 성공, 1 오류) + int32 길이 + 결과 또는 UTF-8 오류 메시지
+        static void Serve()
+        {
+            using Stream input = Console.OpenStandardInput();
+            using Stream output = Console.OpenStandardOutput();
+            byte[] head = new byte[5];
+
+            while (ReadFrame(input, head))
+            {
+                int length = BitConverter.ToInt32(head, 1);
+                byte[] payload = new byte[length];
+                if (!ReadFrame(input, payload))
+                {
+                    break;
+                }
+
+                byte status = 0;
+                byte[] result;
+
+                try
+                {
+                    result = head[0] switch
+                    {
+                        (byte)'c' => MiniLZO.CompressBytes(payload),
+                        (byte)'d' => MiniLZO.DecompressBytes(payload),
+                        _ => throw new ArgumentException("Invalid mode: " + head[0]),
+                    };
+                }
+                catch (Exception ex)
+                {
+                    status = 1;
+                    result = Encoding.UTF8.GetBytes(ex.Message);
+                }
+
+                output.WriteByte(status);
+                output.Write(BitConverter.GetBytes(result.Length));
+                output.Write(result);
+                output.Flush();
+            }
+        }
+
+        static bool ReadFrame(Stream stream, byte[] buffer)
+        {
+            int offset = 0;
+            while (offset < buffer.Length)
+            {
+                int read = stream.Read(buffer, offset, buffer.Length - offset);
+                if (read == 0)
+                {
+                    return false;
+                }
+                offset += read;
+            }
+            return true;
+        }
     }
 }
@@ -1,5 +1,41 @@
 """ECO2 MiniLZO 압축, 압축 해제."""
 
-from .minilzo import compress, decompress
+from .lzo1x import (
+    CompressionStats,
+    Compressor,
+    Decompressor,
+    Level,
+    MiniLzoDataError,
+    iter_decompress,
+    measure,
+)
+from .minilzo import (
+    Backend,
+    MiniLzoNotFoundError,
+    MiniLzoWorker,
+    MiniLzoWorkerError,
+    MiniLzoWorkerPool,
+    compress,
+    decompress,
+    get_backend,
+    get_pool,
+)
 
-__all__ = ['compress', 'decompress']
+__all__ = [
+    'Backend',
+    'CompressionStats',
+    'Compressor',
+    'Decompressor',
+    'Level',
+    'MiniLzoDataError',
+    'MiniLzoNotFoundError',
+    'MiniLzoWorker',
+    'MiniLzoWorkerError',
+    'MiniLzoWorkerPool',
+    'compress',
+    'decompress',
+    'get_backend',
+    'get_pool',
+    'iter_decompress',
+    'measure',
+]
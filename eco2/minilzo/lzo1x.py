@@ -0,0 +1,855 @@
+# ruff: file-ignore[magic-value-comparison]
+"""
+LZO1X 압축, 압축 해제 Python 구현.
+
+ECO2 `MiniLZO.cs`의 `CompressBytes`, `DecompressBytes`와 같은 형식 처리.
+"""
+
+from __future__ import annotations
+
+import dataclasses as dc
+import time
+from typing import TYPE_CHECKING, ClassVar, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Buffer, Generator, Iterable
+
+type Level = Literal['fast', 'best']
+"""압축 모드. `'fast'`는 LZO1X-1, `'best'`는 LZO1X-999 방식 (hash chain 탐색)."""
+
+M2_MAX_OFFSET = 0x0800
+M3_MAX_OFFSET = 0x4000
+M4_MAX_OFFSET = 0xBFFF
+
+MIN_MATCH = 3
+MIN_FAR_MATCH = 4
+"""M2 범위 밖 (3 bytes 명령) match의 최소 길이. 더 짧으면 literal이 유리."""
+MAX_CHAIN = 64
+"""`'best'` 모드의 hash chain 최대 탐색 수."""
+NICE_MATCH = 128
+"""`'best'` 모드에서 탐색을 멈추는 충분히 긴 match 길이."""
+MIN_FIRST_LITERAL = 4
+"""
+첫 literal run 최소 길이. `MiniLZO.cs`는 1-3 bytes 첫 literal run (`0x12`-`0x14`)
+뒤의 match를 해제하지 못함 (Lookbehind Overrun).
+"""
+
+EOF_MARKER = b'\x11\x00\x00'
+
+INPUT_OVERRUN = 'Input Overrun'
+OUTPUT_OVERRUN = 'Output Overrun'
+LOOKBEHIND_OVERRUN = 'Lookbehind Overrun'
+
+
+class MiniLzoDataError(ValueError):
+    """손상되었거나 LZO1X 형식이 아닌 데이터."""
+
+
+def _copy_match(dst: bytearray | memoryview, op: int, pos: int, length: int) -> None:
+    if (distance := op - pos) >= length:
+        dst[op : op + length] = dst[pos : pos + length]
+    else:
+        # 겹치는 구간은 반복되는 pattern
+        pattern = bytes(dst[pos:op]) * (length // distance + 1)
+        dst[op : op + length] = pattern[:length]
+
+
+def _decompress(  # ruff: ignore[complex-structure, too-many-branches, too-many-statements]
+    s: bytes,
+    dst: bytearray | memoryview,
+) -> int:
+    size_in = len(s)
+    size_out = len(dst)
+    ip = op = 0
+
+    # 0: literal run 대기, 1: literal run (4 bytes 이상) 직후, 2: 1-3 literal 직후
+    state = 0
+
+    if s[0] > 17:
+        t = s[0] - 17
+        ip = 1
+        if op + t > size_out:
+            raise MiniLzoDataError(OUTPUT_OVERRUN)
+        if ip + t > size_in:
+            raise MiniLzoDataError(INPUT_OVERRUN)
+
+        dst[op : op + t] = s[ip : ip + t]
+        ip += t
+        op += t
+        state = 1 if t >= 4 else 2
+
+    while True:
+        t = s[ip]
+        ip += 1
+
+        if t < 16:
+            if state == 0:
+                # literal run
+                if t == 0:
+                    while s[ip] == 0:
+                        t += 255
+                        ip += 1
+                    t += 15 + s[ip]
+                    ip += 1
+
+                t += 3
+                if op + t > size_out:
+                    raise MiniLzoDataError(OUTPUT_OVERRUN)
+                if ip + t > size_in:
+                    raise MiniLzoDataError(INPUT_OVERRUN)
+
+                dst[op : op + t] = s[ip : ip + t]
+                ip += t
+                op += t
+                state = 1
+                continue
+
+            if state == 1:
+                # literal run 직후 3 bytes match
+                pos = op - (1 + M2_MAX_OFFSET) - (t >> 2) - (s[ip] << 2)
+                length = 3
+            else:
+                # 1-3 literal 직후 2 bytes match
+                pos = op - 1 - (t >> 2) - (s[ip] << 2)
+                length = 2
+            ip += 1
+        elif t >= 64:
+            # M2
+            pos = op - 1 - ((t >> 2) & 7) - (s[ip] << 3)
+            length = (t >> 5) + 1
+            ip += 1
+        elif t >= 32:
+            # M3
+            if (length := t & 31) == 0:
+                while s[ip] == 0:
+                    length += 255
+                    ip += 1
+                length += 31 + s[ip]
+                ip += 1
+
+            length += 2
+            pos = op - 1 - ((s[ip] | (s[ip + 1] << 8)) >> 2)
+            ip += 2
+        else:
+            # M4
+            pos = op - ((t & 8) << 11)
+            if (length := t & 7) == 0:
+                while s[ip] == 0:
+                    length += 255
+                    ip += 1
+                length += 7 + s[ip]
+                ip += 1
+
+            length += 2
+            pos -= (s[ip] | (s[ip + 1] << 8)) >> 2
+            ip += 2
+
+            if pos == op:
+                break  # EOF marker
+
+            pos -= 0x4000
+
+        if pos < 0 or pos >= op:
+            raise MiniLzoDataError(LOOKBEHIND_OVERRUN)
+        if op + length > size_out:
+            raise MiniLzoDataError(OUTPUT_OVERRUN)
+
+        _copy_match(dst, op, pos, length)
+        op += length
+
+        # match 뒤 literal (0-3 bytes)
+        if t := s[ip - 2] & 3:
+            if op + t > size_out:
+                raise MiniLzoDataError(OUTPUT_OVERRUN)
+            if ip + t > size_in:
+                raise MiniLzoDataError(INPUT_OVERRUN)
+
+            dst[op : op + t] = s[ip : ip + t]
+            ip += t
+            op += t
+            state = 2
+        else:
+            state = 0
+
+    if ip < size_in:
+        msg = 'Input Not Consumed'
+        raise MiniLzoDataError(msg)
+
+    return op
+
+
+def decompress_into(src: Buffer, dst: bytearray | memoryview) -> int:
+    """
+    LZO1X stream을 미리 할당한 buffer에 압축 해제.
+
+    Parameters
+    ----------
+    src : Buffer
+        압축된 stream (길이 prefix 제외).
+    dst : bytearray | memoryview
+        압축 해제 결과를 저장할 buffer. 결과보다 짧으면 오류.
+
+    Returns
+    -------
+    int
+        `dst`에 기록한 byte 수.
+
+    Raises
+    ------
+    MiniLzoDataError
+        Input/Output/Lookbehind overrun, EOF marker 누락 등.
+    """
+    s = src if isinstance(src, bytes) else bytes(src)
+
+    try:
+        return _decompress(s, dst)
+    except IndexError:
+        msg = 'EOF Marker Not Found'
+        raise MiniLzoDataError(msg) from None
+
+
+def decompress(data: Buffer) -> bytes:
+    """
+    `MiniLZO.DecompressBytes` 형식 (int32 원본 길이 + LZO1X stream) 압축 해제.
+
+    Parameters
+    ----------
+    data : Buffer
+
+    Returns
+    -------
+    bytes
+
+    Raises
+    ------
+    MiniLzoDataError
+    """
+    view = memoryview(data).cast('B')
+    if len(view) < 4:
+        raise MiniLzoDataError(INPUT_OVERRUN)
+
+    size = int.from_bytes(view[:4], 'little', signed=True)
+    if size < 0:
+        msg = f'Invalid length: {size}'
+        raise MiniLzoDataError(msg)
+
+    dst = bytearray(size)
+    decompress_into(view[4:], dst)
+    return bytes(dst)
+
+
+class Decompressor:
+    """
+    `MiniLZO.DecompressBytes` 형식 stream의 점진적 압축 해제.
+
+    입력을 임의 크기 chunk로 전달 가능. Match 참조 범위 (`M4_MAX_OFFSET`)의
+    출력과 처리 중인 명령만 보관하므로 사용 메모리는 전체 크기와 무관.
+
+    Examples
+    --------
+    >>> data = compress(b'abc' * 100)
+    >>> d = Decompressor()
+    >>> out = d.decompress(data[:10]) + d.decompress(data[10:]) + d.flush()
+    >>> out == b'abc' * 100
+    True
+    """
+
+    WINDOW: ClassVar[int] = M4_MAX_OFFSET + 1
+
+    def __init__(self) -> None:
+        self.size: int | None = None
+        """원본 길이. 첫 4 bytes 입력 후 확인 가능."""
+        self.eof = False
+
+        self._s = b''
+        self._ip = 0
+        self._out = bytearray()
+        self._base = 0  # `_out[0]`의 전체 출력 기준 위치
+        self._emitted = 0
+        self._state = -1  # -1: 첫 명령 전, 나머지는 `_decompress`와 동일
+
+    def _literal(self, ip: int, t: int) -> int:
+        if ip + t > len(self._s):
+            raise IndexError  # 입력 대기
+
+        if self._base + len(self._out) + t > self.size:  # type: ignore[operator]
+            raise MiniLzoDataError(OUTPUT_OVERRUN)
+
+        self._out += self._s[ip : ip + t]
+        return ip + t
+
+    def _step(  # ruff: ignore[complex-structure, too-many-branches, too-many-statements]
+        self,
+        ip: int,
+        state: int,
+    ) -> tuple[int, int]:
+        """명령 하나 처리. 입력이 부족하면 `IndexError`."""
+        s, out = self._s, self._out
+        t = s[ip]
+        ip += 1
+
+        if state == -1 and t > 17:
+            t -= 17
+            return self._literal(ip, t), 1 if t >= 4 else 2
+
+        op = self._base + len(out)
+
+        if t < 16:
+            if state <= 0:
+                # literal run
+                if t == 0:
+                    while s[ip] == 0:
+                        t += 255
+                        ip += 1
+                    t += 15 + s[ip]
+                    ip += 1
+
+                return self._literal(ip, t + 3), 1
+
+            if state == 1:
+                pos = op - (1 + M2_MAX_OFFSET) - (t >> 2) - (s[ip] << 2)
+                length = 3
+            else:
+                pos = op - 1 - (t >> 2) - (s[ip] << 2)
+                length = 2
+            ip += 1
+        elif t >= 64:
+            pos = op - 1 - ((t >> 2) & 7) - (s[ip] << 3)
+            length = (t >> 5) + 1
+            ip += 1
+        elif t >= 32:
+            if (length := t & 31) == 0:
+                while s[ip] == 0:
+                    length += 255
+                    ip += 1
+                length += 31 + s[ip]
+                ip += 1
+
+            length += 2
+            pos = op - 1 - ((s[ip] | (s[ip + 1] << 8)) >> 2)
+            ip += 2
+        else:
+            pos = op - ((t & 8) << 11)
+            if (length := t & 7) == 0:
+                while s[ip] == 0:
+                    length += 255
+                    ip += 1
+                length += 7 + s[ip]
+                ip += 1
+
+            length += 2
+            pos -= (s[ip] | (s[ip + 1] << 8)) >> 2
+            ip += 2
+
+            if pos == op:
+                self.eof = True
+                return ip, state
+
+            pos -= 0x4000
+
+        if pos < self._base or pos >= op:
+            raise MiniLzoDataError(LOOKBEHIND_OVERRUN)
+        if op + length > self.size:  # type: ignore[operator]
+            raise MiniLzoDataError(OUTPUT_OVERRUN)
+
+        out += bytes(length)
+        _copy_match(out, op - self._base, pos - self._base, length)
+
+        if t := s[ip - 2] & 3:
+            return self._literal(ip, t), 2
+
+        return ip, 0
+
+    def _run(self) -> None:
+        ip, state = self._ip, self._state
+
+        try:
+            while not self.eof:
+                # 입력이 부족하면 마지막 명령 시작 위치로 복귀
+                self._ip, self._state, mark = ip, state, len(self._out)
+                ip, state = self._step(ip, state)
+        except IndexError:
+            del self._out[mark:]
+        else:
+            self._ip, self._state = ip, state
+
+    def _drain(self) -> bytes:
+        out = self._out
+        data = bytes(out[self._emitted - self._base :])
+        self._emitted = self._base + len(out)
+
+        if (trim := len(out) - self.WINDOW) > 0:
+            del out[:trim]
+            self._base += trim
+
+        return data
+
+    def decompress(self, data: Buffer) -> bytes:
+        """
+        입력 일부 압축 해제.
+
+        Parameters
+        ----------
+        data : Buffer
+
+        Returns
+        -------
+        bytes
+            지금까지 해제한 결과. 처리 중인 명령의 결과는 이후 호출에서 반환.
+
+        Raises
+        ------
+        MiniLzoDataError
+        """
+        if self.eof:
+            if memoryview(data).nbytes:
+                msg = 'Input Not Consumed'
+                raise MiniLzoDataError(msg)
+            return b''
+
+        self._s = self._s[self._ip :] + bytes(data)
+        self._ip = 0
+
+        if self.size is None:
+            if len(self._s) < 4:
+                return b''
+
+            self.size = int.from_bytes(self._s[:4], 'little', signed=True)
+            if self.size < 0:
+                msg = f'Invalid length: {self.size}'
+                raise MiniLzoDataError(msg)
+
+            self._ip = 4
+
+        self._run()
+
+        if self.eof and self._ip < len(self._s):
+            msg = 'Input Not Consumed'
+            raise MiniLzoDataError(msg)
+
+        return self._drain()
+
+    def flush(self) -> bytes:
+        """
+        입력 종료 확인.
+
+        Returns
+        -------
+        bytes
+            남은 결과 (항상 빈 bytes).
+
+        Raises
+        ------
+        MiniLzoDataError
+            EOF marker가 없거나 결과 길이가 원본 길이와 다른 경우.
+        """
+        if not self.eof:
+            msg = 'EOF Marker Not Found'
+            raise MiniLzoDataError(msg)
+
+        if self._emitted != self.size:
+            msg = f'Decompressed {self._emitted} bytes, expected {self.size}'
+            raise MiniLzoDataError(msg)
+
+        return self._drain()
+
+
+def iter_decompress(chunks: Iterable[Buffer]) -> Generator[bytes]:
+    """
+    압축된 chunk를 순서대로 해제.
+
+    Parameters
+    ----------
+    chunks : Iterable[Buffer]
+        `MiniLZO.CompressBytes` 형식 stream을 나눈 chunk.
+
+    Yields
+    ------
+    bytes
+        압축 해제 결과 일부. 손상된 stream은 `MiniLzoDataError`.
+    """
+    decompressor = Decompressor()
+
+    for chunk in chunks:
+        if data := decompressor.decompress(chunk):
+            yield data
+
+    decompressor.flush()
+
+
+def _emit_count(out: bytearray, count: int) -> None:
+    # 명령 byte 뒤 0 bytes와 나머지로 표현하는 긴 길이
+    while count > 255:
+        count -= 255
+        out.append(0)
+    out.append(count)
+
+
+def _emit_match(out: bytearray, distance: int, length: int) -> None:
+    if distance <= M2_MAX_OFFSET and length <= 8:
+        # M2
+        d = distance - 1
+        out.append(((length - 1) << 5) | ((d & 7) << 2))
+        out.append(d >> 3)
+        return
+
+    if distance <= M3_MAX_OFFSET:
+        # M3
+        d = distance - 1
+        if length <= 33:
+            out.append(32 | (length - 2))
+        else:
+            out.append(32)
+            _emit_count(out, length - 33)
+    else:
+        # M4
+        d = distance - 0x4000
+        marker = 16 | ((d & 0x4000) >> 11)
+        if length <= 9:
+            out.append(marker | (length - 2))
+        else:
+            out.append(marker)
+            _emit_count(out, length - 9)
+
+    out.append((d & 63) << 2)
+    out.append((d >> 6) & 0xFF)
+
+
+def _match_length(src: bytes, pos: int, ip: int, end: int) -> int:
+    """`src[pos:]`와 `src[ip:]`의 공통 prefix 길이."""
+    n = 0
+    limit = end - ip
+
+    for step in (256, 16):
+        while (
+            n + step <= limit
+            and src[pos + n : pos + n + step] == src[ip + n : ip + n + step]
+        ):
+            n += step
+
+    while n < limit and src[pos + n] == src[ip + n]:
+        n += 1
+
+    return n
+
+
+def _worth(distance: int, length: int) -> bool:
+    if length < MIN_MATCH:
+        return False
+
+    return distance <= M2_MAX_OFFSET or length >= MIN_FAR_MATCH
+
+
+class Compressor:
+    """
+    LZO1X 압축기. 입력을 chunk 단위로 나눠 전달 가능.
+
+    Match 탐색 범위 (`M4_MAX_OFFSET`)와 아직 출력하지 않은 literal만 보관하므로
+    사용 메모리는 전체 크기와 무관. `MiniLZO.CompressBytes` 형식은 원본 길이로
+    시작하므로 전체 크기를 미리 지정해야 함.
+
+    Examples
+    --------
+    >>> c = Compressor(size=6)
+    >>> data = c.compress(b'abc') + c.compress(b'abc') + c.flush()
+    >>> decompress(data)
+    b'abcabc'
+    """
+
+    LOOKAHEAD: ClassVar[int] = 4096
+    """마지막 chunk 전까지 탐색하지 않고 남겨두는 byte 수."""
+    PRUNE: ClassVar[int] = 1 << 17
+    """Hash table에서 오래된 위치를 정리하는 기준 크기."""
+
+    def __init__(self, size: int, level: Level = 'fast') -> None:
+        if level not in {'fast', 'best'}:
+            msg = f'Unknown level: {level!r}'
+            raise ValueError(msg)
+
+        self.size = size
+        self.level: Level = level
+        self.received = 0
+
+        # 위치는 모두 전체 입력 기준. `src[0]`은 전체 입력의 `base` 위치.
+        self._src = b''
+        self._base = 0
+        self._ii = 0  # 출력하지 않은 literal 시작 위치
+        self._ip = MIN_FIRST_LITERAL  # 다음 탐색 위치
+        self._table: dict[bytes, int] = {}  # fast: 4 bytes, best: 3 bytes chain head
+        self._prev: list[int] = []  # best: hash chain
+        self._inserted = 0  # best: chain에 등록한 위치
+
+        self._out = bytearray(size.to_bytes(4, 'little', signed=True))
+        self._started = False
+
+    def _literals(self, start: int, end: int) -> None:
+        if (length := end - start) <= 0:
+            return
+
+        out = self._out
+        if not self._started and length <= 238:
+            # 첫 literal run
+            out.append(17 + length)
+        elif length <= 3:
+            # 직전 match 명령의 하위 2 bits
+            out[-2] |= length
+        elif length <= 18:
+            out.append(length - 3)
+        else:
+            out.append(0)
+            _emit_count(out, length - 18)
+
+        out += self._src[start - self._base : end - self._base]
+        self._started = True
+
+    def _match(self, ip: int, distance: int, length: int) -> None:
+        self._literals(self._ii, ip)
+        _emit_match(self._out, distance, length)
+        self._ii = ip + length
+        self._started = True
+
+    def _append(self, data: Buffer) -> None:
+        # match 탐색 범위와 남은 literal만 유지
+        keep = min(self._ii, self._ip - M4_MAX_OFFSET)
+        if (trim := keep - self._base) > 0:
+            self._src = self._src[trim:]
+            del self._prev[:trim]
+            self._base = keep
+            # 긴 match로 건너뛴 위치는 chain에 등록하지 않음
+            self._inserted = max(self._inserted, keep)
+
+            if len(self._table) > self.PRUNE:
+                self._table = {k: v for k, v in self._table.items() if v >= keep}
+
+        self._src += data
+        if self.level == 'best':
+            self._prev.extend([-1] * (len(self._src) - len(self._prev)))
+
+    def _fast(self, limit: int) -> None:
+        """LZO1X-1 방식. 4 bytes hash로 후보 하나만 비교, 실패가 이어지면 건너뜀."""
+        src, base, table = self._src, self._base, self._table
+        size = len(src)
+        ip = self._ip
+
+        while ip < limit:
+            i = ip - base
+            key = src[i : i + 4]
+            pos = table.get(key)
+            table[key] = ip
+
+            if pos is None or (distance := ip - pos) > M4_MAX_OFFSET:
+                ip += 1 + ((ip - self._ii) >> 5)
+                continue
+
+            length = MIN_FAR_MATCH + _match_length(src, pos - base + 4, i + 4, size)
+            self._match(ip, distance, length)
+            ip += length
+
+        self._ip = ip
+
+    def _insert(self, until: int) -> None:
+        src, base, head, prev = self._src, self._base, self._table, self._prev
+
+        for i in range(self._inserted - base, until - base):
+            key = src[i : i + 3]
+            prev[i] = head.get(key, -1)
+            head[key] = i + base
+
+        self._inserted = max(self._inserted, until)
+
+    def _find(self, ip: int) -> tuple[int, int]:
+        """Hash chain에서 가장 긴 (가까운) match 탐색."""
+        self._insert(ip)
+        src, base = self._src, self._base
+        size = len(src)
+        i = ip - base
+        best_distance = best_length = 0
+        pos = self._table.get(src[i : i + 3], -1)
+        chain = MAX_CHAIN
+
+        while pos >= base and chain and (distance := ip - pos) <= M4_MAX_OFFSET:
+            j = pos - base
+
+            # 현재 최장 길이 위치의 byte가 다르면 더 긴 match가 아님
+            if src[j + best_length] == src[i + best_length]:
+                length = MIN_MATCH + _match_length(src, j + 3, i + 3, size)
+                if length > best_length and _worth(distance, length):
+                    best_distance, best_length = distance, length
+                    if length >= NICE_MATCH or i + length >= size:
+                        break
+
+            pos = self._prev[j]
+            chain -= 1
+
+        return best_distance, best_length
+
+    def _best(self, limit: int) -> None:
+        """LZO1X-999 방식. Hash chain으로 가장 긴 match를 찾고 lazy matching 적용."""
+        ip = self._ip
+
+        while ip < limit:
+            distance, length = self._find(ip)
+            if not length:
+                ip += 1
+                continue
+
+            # 다음 위치의 match가 더 길면 현재 byte는 literal
+            while ip + 1 < limit:
+                d, n = self._find(ip + 1)
+                if n <= length:
+                    break
+
+                ip += 1
+                distance, length = d, n
+
+            self._match(ip, distance, length)
+            ip += length
+
+        self._ip = ip
+
+    def _search(self, *, final: bool) -> None:
+        end = self._base + len(self._src)
+
+        if self.level == 'fast':
+            if self.size > 13:
+                self._fast(end - (MIN_FAR_MATCH if final else self.LOOKAHEAD))
+        else:
+            self._best(end - (MIN_MATCH if final else self.LOOKAHEAD))
+
+    def _drain(self, keep: int) -> bytes:
+        # 끝의 `keep` bytes는 이후 literal 길이 기록을 위해 보관
+        out = self._out
+        if (n := len(out) - keep) <= 0:
+            return b''
+
+        data = bytes(out[:n])
+        del out[:n]
+        return data
+
+    def compress(self, data: Buffer) -> bytes:
+        """
+        입력 일부 압축.
+
+        Parameters
+        ----------
+        data : Buffer
+
+        Returns
+        -------
+        bytes
+            지금까지 확정된 압축 결과. 나머지는 이후 호출 또는 `flush`에서 반환.
+
+        Raises
+        ------
+        ValueError
+            입력 크기가 지정한 전체 크기보다 큰 경우.
+        """
+        self.received += memoryview(data).nbytes
+        if self.received > self.size:
+            msg = f'Input exceeds declared size {self.size}'
+            raise ValueError(msg)
+
+        self._append(data)
+        self._search(final=False)
+        return self._drain(keep=2)
+
+    def flush(self) -> bytes:
+        """
+        남은 입력을 압축하고 EOF marker 추가.
+
+        Returns
+        -------
+        bytes
+
+        Raises
+        ------
+        ValueError
+            입력 크기가 지정한 전체 크기와 다른 경우.
+        """
+        if self.received != self.size:
+            msg = f'Received {self.received} bytes, expected {self.size}'
+            raise ValueError(msg)
+
+        self._search(final=True)
+        self._literals(self._ii, self._base + len(self._src))
+        self._ii = self._base + len(self._src)
+        self._out += EOF_MARKER
+        return self._drain(keep=0)
+
+
+def compress(data: Buffer, level: Level = 'fast') -> bytes:
+    """
+    `MiniLZO.CompressBytes` 형식 (int32 원본 길이 + LZO1X stream)으로 압축.
+
+    Parameters
+    ----------
+    data : Buffer
+    level : Level, optional
+        `'fast'`는 속도, `'best'`는 압축률 우선.
+
+    Returns
+    -------
+    bytes
+    """
+    src = data if isinstance(data, bytes) else bytes(data)
+    compressor = Compressor(len(src), level)
+    return compressor.compress(src) + compressor.flush()
+
+
+@dc.dataclass(frozen=True)
+class CompressionStats:
+    """압축 모드별 성능."""
+
+    level: Level
+    size: int
+    """원본 크기 [bytes]"""
+    compressed: int
+    """압축 결과 크기 [bytes]"""
+    elapsed: float
+    """압축 소요 시간 [s]"""
+
+    @property
+    def ratio(self) -> float:
+        """압축률 (압축 결과 / 원본)."""
+        return self.compressed / self.size if self.size else 1.0
+
+    @property
+    def throughput(self) -> float:
+        """압축 속도 [MB/s]."""
+        return self.size / self.elapsed / 1e6 if self.elapsed else float('inf')
+
+
+def measure(
+    data: Buffer,
+    levels: Iterable[Level] = ('fast', 'best'),
+) -> list[CompressionStats]:
+    """
+    압축 모드별 압축률, 속도 측정.
+
+    Parameters
+    ----------
+    data : Buffer
+        측정 대상 (대표 파일의 압축 전 데이터).
+    levels : Iterable[Level], optional
+
+    Returns
+    -------
+    list[CompressionStats]
+    """
+    src = bytes(data)
+    stats: list[CompressionStats] = []
+
+    for level in levels:
+        start = time.perf_counter()
+        compressed = compress(src, level)
+        elapsed = time.perf_counter() - start
+        stats.append(
+            CompressionStats(
+                level=level,
+                size=len(src),
+                compressed=len(compressed),
+                elapsed=elapsed,
+            )
+        )
+
+    return stats
@@ -1,10 +1,30 @@
-# ruff: file-ignore[suspicious-subprocess-import, subprocess-without-shell-equals-true]
+# ruff: file-ignore[suspicious-subprocess-import, subprocess-without-shell-equals-true, undocumented-magic-method]
+from __future__ import annotations
+
+import atexit
+import contextlib
+import os
+import struct
 import subprocess as sp
 import sys
 import tempfile
+import threading
 from pathlib import Path
+from typing import IO, TYPE_CHECKING, Literal, Self, cast
+
+from . import lzo1x
+
+if TYPE_CHECKING:
+    from collections.abc import Buffer, Generator
+
+type Backend = Literal['python', 'worker', 'exe']
+type Mode = Literal['compress', 'decompress']
+BACKENDS: tuple[Backend, ...] = ('python', 'worker', 'exe')
 
 MINILZO = 'bin/**/MiniLZO.exe'
+BACKEND_ENV = 'ECO2_MINILZO_BACKEND'
+WORKERS = min(4, os.cpu_count() or 1)
+"""Pool 당 최대 worker 프로세스 수."""
 
 
 class MiniLzoNotFoundError(FileNotFoundError):
@@ -14,6 +34,10 @@ class MiniLzoNotFoundError(FileNotFoundError):
         super().__init__(msg, *args)
 
 
+class MiniLzoWorkerError(RuntimeError):
+    """MiniLZO worker 프로세스 통신 오류."""
+
+
 def find_minilzo(pattern: str = MINILZO) -> str:
     """
     Find path of MiniLZO.exe.
@@ -40,18 +64,259 @@ def find_minilzo(pattern: str = MINILZO) -> str:
         raise MiniLzoNotFoundError(msg, root) from None
 
 
-def compress(data: bytes, minilzo: str = MINILZO) -> bytes:
+def get_backend(backend: Backend | None = None) -> Backend:
     """
-    Minilzo compress.
+    사용할 MiniLZO 구현 결정.
 
     Parameters
     ----------
-    data : bytes
+    backend : Backend | None, optional
+        `None`이면 환경 변수 `ECO2_MINILZO_BACKEND` 값, 미지정 시 `'python'`.
 
     Returns
     -------
-    bytes
+    Backend
+
+    Raises
+    ------
+    ValueError
+    """
+    value = backend or os.environ.get(BACKEND_ENV) or 'python'
+
+    if value not in BACKENDS:
+        msg = f'Unknown MiniLZO backend: {value!r}'
+        raise ValueError(msg)
+
+    return cast('Backend', value)
+
+
+class MiniLzoWorker:
+    """
+    `MiniLZO.exe serve`로 실행한 상주 프로세스.
+
+    요청마다 임시 파일 대신 길이 prefix를 붙인 frame을 stdin/stdout으로 주고받음.
+    """
+
+    HEAD: str = '<Bi'
+    """응답 frame header (status, length)."""
+
+    def __init__(self, minilzo: str = MINILZO) -> None:
+        self.process = sp.Popen(
+            [find_minilzo(minilzo), 'serve'],
+            stdin=sp.PIPE,
+            stdout=sp.PIPE,
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @property
+    def alive(self) -> bool:
+        """프로세스 실행 여부."""
+        return self.process.poll() is None
+
+    def _pipes(self) -> tuple[IO[bytes], IO[bytes]]:
+        stdin, stdout = self.process.stdin, self.process.stdout
+        assert stdin is not None
+        assert stdout is not None
+        return stdin, stdout
+
+    def _read(self, size: int) -> bytes:
+        _, stdout = self._pipes()
+        if len(data := stdout.read(size)) != size:
+            msg = f'MiniLZO worker terminated (returncode={self.process.poll()})'
+            raise MiniLzoWorkerError(msg)
+
+        return data
+
+    def request(self, mode: Mode, data: Buffer) -> bytes:
+        """
+        압축 또는 압축 해제 요청.
+
+        Parameters
+        ----------
+        mode : Mode
+        data : Buffer
+
+        Returns
+        -------
+        bytes
+
+        Raises
+        ------
+        MiniLzoWorkerError
+            프로세스 종료, pipe 오류.
+        lzo1x.MiniLzoDataError
+            MiniLZO 처리 오류.
+        """
+        stdin, _ = self._pipes()
+
+        try:
+            stdin.write(struct.pack('<ci', mode[0].encode(), memoryview(data).nbytes))
+            stdin.write(data)
+            stdin.flush()
+        except OSError as e:
+            msg = 'Failed to send request to MiniLZO worker'
+            raise MiniLzoWorkerError(msg) from e
+
+        status, length = struct.unpack(
+            self.HEAD, self._read(struct.calcsize(self.HEAD))
+        )
+        result = self._read(length)
+
+        if status:
+            raise lzo1x.MiniLzoDataError(result.decode(errors='replace'))
+
+        return result
+
+    def close(self, timeout: float = 5) -> None:
+        """
+        Stdin을 닫아 프로세스 종료.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            종료 대기 시간 [s]. 초과 시 강제 종료.
+        """
+        stdin, stdout = self._pipes()
+
+        with contextlib.suppress(OSError):
+            stdin.close()
+
+        try:
+            self.process.wait(timeout=timeout)
+        except sp.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+        stdout.close()
+
+
+class MiniLzoWorkerPool:
+    """재사용 가능한 `MiniLzoWorker` pool (thread-safe)."""
+
+    def __init__(self, minilzo: str = MINILZO, size: int = WORKERS) -> None:
+        self.minilzo = minilzo
+        self.size = size
+        self._idle: list[MiniLzoWorker] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+        self._pid = os.getpid()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _acquire(self) -> MiniLzoWorker:
+        with self._lock:
+            if self._pid != os.getpid():
+                # fork된 자식 프로세스: 부모의 worker는 사용하지 않음
+                self._idle.clear()
+                self._pid = os.getpid()
+
+            while self._idle:
+                if (worker := self._idle.pop()).alive:
+                    return worker
+
+        return MiniLzoWorker(self.minilzo)
+
+    @contextlib.contextmanager
+    def worker(self) -> Generator[MiniLzoWorker]:
+        """
+        Worker 하나를 빌려 사용한 뒤 pool에 반환.
+
+        MiniLZO 처리 오류 (`lzo1x.MiniLzoDataError`) 응답 외의 예외가 발생한
+        worker는 응답을 다 읽지 않았을 수 있으므로 종료하고 반환하지 않음.
+
+        Yields
+        ------
+        MiniLzoWorker
+
+        Raises
+        ------
+        lzo1x.MiniLzoDataError
+            MiniLZO 처리 오류. Worker는 pool에 반환.
+        """
+        with self._slots:
+            worker = self._acquire()
+
+            try:
+                yield worker
+            except lzo1x.MiniLzoDataError:
+                # 응답 frame을 모두 읽은 정상 오류 응답
+                self._release(worker)
+                raise
+            except BaseException:
+                worker.close(timeout=0)
+                raise
+            else:
+                self._release(worker)
+
+    def _release(self, worker: MiniLzoWorker) -> None:
+        with self._lock:
+            self._idle.append(worker)
+
+    def request(self, mode: Mode, data: Buffer) -> bytes:
+        """
+        Pool의 worker로 압축 또는 압축 해제.
+
+        Parameters
+        ----------
+        mode : Mode
+        data : Buffer
+
+        Returns
+        -------
+        bytes
+        """
+        with self.worker() as worker:
+            return worker.request(mode, data)
+
+    def close(self) -> None:
+        """대기 중인 모든 worker 종료."""
+        with self._lock:
+            workers, self._idle = self._idle, []
+
+        if self._pid == os.getpid():
+            for worker in workers:
+                worker.close()
+
+
+_POOLS: dict[str, MiniLzoWorkerPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(minilzo: str = MINILZO) -> MiniLzoWorkerPool:
     """
+    MiniLZO.exe 경로 pattern별 공용 worker pool.
+
+    Parameters
+    ----------
+    minilzo : str, optional
+
+    Returns
+    -------
+    MiniLzoWorkerPool
+    """
+    with _POOLS_LOCK:
+        if (pool := _POOLS.get(minilzo)) is None:
+            pool = _POOLS[minilzo] = MiniLzoWorkerPool(minilzo)
+
+    return pool
+
+
+@atexit.register
+def _close_pools() -> None:
+    for pool in _POOLS.values():
+        pool.close()
+
+
+def _exe(mode: Mode, data: Buffer, minilzo: str) -> bytes:
     m = find_minilzo(minilzo)
 
     with (
@@ -63,41 +328,76 @@ def compress(data: bytes, minilzo: str = MINILZO) -> bytes:
         s.write(data)
 
     try:
-        sp.check_output([m, 'compress', src.as_posix(), dst.as_posix()])
+        sp.check_output([m, mode, src.as_posix(), dst.as_posix()])
         return dst.read_bytes()
     finally:
         src.unlink()
         dst.unlink()
 
 
-def decompress(data: bytes, minilzo: str = MINILZO) -> bytes:
+def compress(
+    data: Buffer,
+    minilzo: str = MINILZO,
+    *,
+    backend: Backend | None = None,
+    level: lzo1x.Level = 'fast',
+) -> bytes:
     """
-    Minilzo decompress.
+    Minilzo compress.
 
     Parameters
     ----------
-    data : bytes
+    data : Buffer
+    minilzo : str, optional
+        `backend`가 `'worker'` 또는 `'exe'`일 때 사용할 MiniLZO.exe 경로 pattern.
+    backend : Backend | None, optional
+        MiniLZO 구현. `'python'`은 프로세스 생성 없이 압축,
+        `'worker'`는 상주 MiniLZO.exe 프로세스 재사용.
+    level : lzo1x.Level, optional
+        `backend='python'`일 때 압축 모드. `'fast'` (LZO1X-1) 또는 `'best'`.
 
     Returns
     -------
     bytes
     """
-    m = find_minilzo(minilzo)
+    match get_backend(backend):
+        case 'python':
+            return lzo1x.compress(data, level)
+        case 'worker':
+            return get_pool(minilzo).request('compress', data)
+        case _:
+            return _exe('compress', data, minilzo)
 
-    with (
-        tempfile.NamedTemporaryFile(delete=False) as s,
-        tempfile.NamedTemporaryFile(delete=False) as d,
-    ):
-        src = Path(s.name)
-        dst = Path(d.name)
-        s.write(data)
 
-    try:
-        sp.check_output([m, 'decompress', src.as_posix(), dst.as_posix()])
-        return dst.read_bytes()
-    finally:
-        src.unlink()
-        dst.unlink()
+def decompress(
+    data: Buffer,
+    minilzo: str = MINILZO,
+    *,
+    backend: Backend | None = None,
+) -> bytes:
+    """
+    Minilzo decompress.
+
+    Parameters
+    ----------
+    data : Buffer
+    minilzo : str, optional
+        `backend`가 `'worker'` 또는 `'exe'`일 때 사용할 MiniLZO.exe 경로 pattern.
+    backend : Backend | None, optional
+        MiniLZO 구현. `'python'`은 프로세스 생성 없이 압축 해제,
+        `'worker'`는 상주 MiniLZO.exe 프로세스 재사용.
+
+    Returns
+    -------
+    bytes
+    """
+    match get_backend(backend):
+        case 'python':
+            return lzo1x.decompress(data)
+        case 'worker':
+            return get_pool(minilzo).request('decompress', data)
+        case _:
+            return _exe('decompress', data, minilzo)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,141 @@
+"""
+파일별 작업 (일괄 수정, 변형 생성)의 process pool 실행과 오류 처리.
+
+작업마다 발생한 오류는 전체 실행을 중단하지 않고 파일별 실패로 기록
+(`attempt`). Worker process는 작업에 필요한 상태 (수정 명세, 기준 파일
+tree 등)를 한 번만 만들어 재사용 (`run`).
+"""
+
+from __future__ import annotations
+
+import concurrent.futures as cf
+import os
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from lxml import etree
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+    from pathlib import Path
+
+logger = structlog.stdlib.get_logger()
+
+ERRORS: tuple[type[Exception], ...] = (
+    ArithmeticError,
+    TypeError,
+    ValueError,
+    OSError,
+    etree.LxmlError,
+)
+"""파일별 실패로 기록하는 예외. 그 외 예외는 전체 실행 중단."""
+
+MAX_CHUNKSIZE = 16
+
+
+def attempt(func: Callable[[], object], dst: Path) -> str | None:
+    """
+    파일 저장 작업 실행. 실패하면 불완전한 파일을 삭제하고 오류 반환.
+
+    Parameters
+    ----------
+    func : Callable[[], object]
+        저장 작업.
+    dst : Path
+        저장 경로.
+
+    Returns
+    -------
+    str | None
+        오류 (`{예외 이름}: {메세지}`). 성공하면 `None`.
+    """
+    try:
+        func()
+    except ERRORS as e:
+        logger.exception(dst.as_posix())
+        dst.unlink(missing_ok=True)
+        return f'{type(e).__name__}: {e}'
+
+    return None
+
+
+_TASK: Callable[..., Any] | None = None
+_STATE: Any = None
+
+
+def _init(
+    task: Callable[..., Any],
+    factory: Callable[[], object] | None,
+    state: object,
+) -> None:
+    # worker process마다 상태를 한 번 생성
+    global _TASK, _STATE  # ruff: ignore[global-statement]
+    _TASK = task
+    _STATE = state if factory is None else factory()
+
+
+def _call(*args: Any) -> Any:  # ruff: ignore[any-type]
+    assert _TASK is not None
+    return _TASK(_STATE, *args)
+
+
+def chunksize(count: int, workers: int) -> int:
+    """
+    Worker마다 4번 정도 나눠 전달하는 chunk 크기 (최대 `MAX_CHUNKSIZE`).
+
+    Parameters
+    ----------
+    count : int
+        작업 수.
+    workers : int
+
+    Returns
+    -------
+    int
+    """
+    return min(MAX_CHUNKSIZE, max(1, count // (4 * workers)))
+
+
+def run[T, R](
+    task: Callable[..., R],
+    state: T,
+    items: Sequence[tuple[Any, ...]],
+    *,
+    workers: int | None = None,
+    factory: Callable[[], T] | None = None,
+) -> Iterator[R]:
+    """
+    작업별로 `task(state, *item)` 실행. 입력 순서대로 결과 반환.
+
+    Parameters
+    ----------
+    task : Callable[..., R]
+        Module 수준 함수 또는 method (pickle 가능).
+    state : T
+        현재 process에서 실행할 때 사용할 상태.
+    items : Sequence[tuple[Any, ...]]
+        작업별 인자.
+    workers : int | None, optional
+        Process 수. 1이면 현재 process에서 실행, `None`이면 CPU 수.
+    factory : Callable[[], T] | None, optional
+        Worker process에서 상태를 만드는 함수 (pickle 가능). `None`이면
+        `state`를 worker process마다 한 번 전달.
+
+    Yields
+    ------
+    R
+    """
+    if workers == 1 or len(items) <= 1:
+        for item in items:
+            yield task(state, *item)
+        return
+
+    workers = workers or os.process_cpu_count() or 1
+    with cf.ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init,
+        initargs=(task, factory, None if factory else state),
+    ) as executor:
+        yield from executor.map(
+            _call, *zip(*items, strict=True), chunksize=chunksize(len(items), workers)
+        )
@@ -0,0 +1,351 @@
+"""
+ECO2 저장 파일의 Arrow IPC snapshot.
+
+DS, DSR의 최상위 table을 table별 Arrow IPC (Feather) 파일로, header와
+element 순서·항목 구성을 json으로 저장. Table은 memory map으로 읽으며,
+`Snapshot.to_eco2`로 원본과 같은 `Eco2`를 복원.
+
+```
+snapshot/
+├── snapshot.json
+├── DS/
+│   ├── tbl_zone.arrow
+│   └── ...
+└── DSR/
+    └── ...
+```
+"""
+
+from __future__ import annotations
+
+import dataclasses as dc
+import functools
+import json
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, Self
+from xml.sax.saxutils import escape
+
+import structlog
+
+from eco2.core import SECTIONS, Eco2, Eco2Bytes, Eco2Xml, Header, Section
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    import polars as pl
+    from lxml.etree import _Element
+
+logger = structlog.stdlib.get_logger()
+
+LAYOUT = '__layout__'
+"""행별 항목 구성 (`layouts` index) 열 이름."""
+
+
+class SnapshotError(ValueError):  # ruff: ignore[undocumented-public-class]
+    pass
+
+
+@dc.dataclass
+class _Table:
+    columns: dict[str, list[str | None]] = dc.field(default_factory=dict)
+    layouts: dict[tuple[str, ...], int] = dc.field(default_factory=dict)
+    rows: list[int] = dc.field(default_factory=list)  # 행별 layout index
+
+    def add(self, row: _Element) -> bool:
+        idx = len(self.rows)
+        fields: list[str] = []
+
+        for child in row:
+            if (
+                not isinstance(child.tag, str)
+                or len(child)
+                or child.attrib
+                or child.tag in fields
+            ):
+                return False
+
+            fields.append(child.tag)
+            column = self.columns.setdefault(child.tag, [None] * idx)
+            column.append(child.text or '')
+
+        for column in self.columns.values():
+            if len(column) == idx:
+                column.append(None)
+
+        self.rows.append(self.layouts.setdefault(tuple(fields), len(self.layouts)))
+        return True
+
+    def frame(self) -> pl.DataFrame:
+        import polars as pl  # ruff: ignore[import-outside-top-level]
+
+        schema = dict.fromkeys(self.columns, pl.String)
+        return pl.DataFrame(self.columns, schema=schema).with_columns(
+            pl.Series(LAYOUT, self.rows, dtype=pl.UInt16)
+        )
+
+
+type _Row = list[tuple[str, str]]
+
+
+def _rows(frame: pl.DataFrame, layouts: list[list[str]]) -> Iterator[_Row]:
+    # 행별 (항목, 값) 목록
+    columns = {x.name: x.to_list() for x in frame.iter_columns()}
+    for idx, layout in enumerate(columns.pop(LAYOUT)):
+        yield [(field, columns[field][idx]) for field in layouts[layout]]
+
+
+def _render(
+    tag: str,
+    order: list[tuple[str, int]],
+    rows: Mapping[str, Iterator[_Row]],
+) -> str:
+    # .NET DataSet.WriteXml 형식 (들여쓰기 2칸, 빈 값은 `<field />`)
+    root = f'<{tag} xmlns="{Eco2Xml.URI.format(tag)}"'
+    if not order:
+        return f'{root} />'
+
+    lines = [f'{root}>']
+    for table, count in order:
+        for _ in range(count):
+            lines.append(f'  <{table}>')
+            for field, value in next(rows[table]):
+                if value:
+                    lines.append(f'    <{field}>{escape(value)}</{field}>')
+                else:
+                    lines.append(f'    <{field} />')
+            lines.append(f'  </{table}>')
+
+    lines.append(f'</{tag}>')
+    return '\n'.join(lines)
+
+
+@dc.dataclass(frozen=True)
+class Snapshot:
+    """
+    ECO2 저장 파일의 Arrow IPC snapshot.
+
+    Examples
+    --------
+    >>> snapshot = Snapshot.write('project.tpl', 'project.snapshot')  # doctest: +SKIP
+    >>> zone = snapshot.table('tbl_zone')  # doctest: +SKIP
+    >>> snapshot.to_eco2().write('project-copy.tpl')  # doctest: +SKIP
+    """
+
+    path: Path
+
+    META: ClassVar[str] = 'snapshot.json'
+    VERSION: ClassVar[int] = 1
+
+    def __post_init__(self) -> None:  # ruff: ignore[undocumented-magic-method]
+        object.__setattr__(self, 'path', Path(self.path))
+
+    @functools.cached_property
+    def meta(self) -> dict[str, Any]:
+        """Header, 영역별 table 순서와 항목 구성."""
+        meta = json.loads((self.path / self.META).read_text('UTF-8'))
+
+        if (version := meta.get('version')) != self.VERSION:
+            msg = f'지원하지 않는 snapshot 버전: {version}'
+            raise SnapshotError(msg)
+
+        return meta
+
+    @property
+    def header(self) -> Header:
+        """프로젝트 메타 정보."""
+        return Header(**self.meta['header'])
+
+    def tables(self, section: Section = 'DS') -> list[str]:
+        """
+        영역의 table 목록 (처음 나타나는 순서).
+
+        Parameters
+        ----------
+        section : Section, optional
+
+        Returns
+        -------
+        list[str]
+        """
+        if (meta := self.meta['sections'][section]) is None:
+            return []
+
+        return list(dict.fromkeys(table for table, _ in meta['order']))
+
+    def _ipc(self, name: str, section: Section) -> pl.DataFrame:
+        path = self.path / section / f'{name}.arrow'
+        if not path.exists():
+            raise KeyError(name)
+
+        import polars as pl  # ruff: ignore[import-outside-top-level]
+
+        # 압축하지 않은 IPC 파일은 memory map으로 읽음
+        return pl.read_ipc(path)
+
+    def table(self, name: str, section: Section = 'DS') -> pl.DataFrame:
+        """
+        Table DataFrame (memory map). 모든 열은 문자열, 없는 항목은 null.
+
+        Parameters
+        ----------
+        name : str
+        section : Section, optional
+
+        Returns
+        -------
+        pl.DataFrame
+        """
+        return self._ipc(name, section).drop(LAYOUT)
+
+    def _section(self, section: Section) -> str | None:
+        if (meta := self.meta['sections'][section]) is None:
+            return None
+
+        if meta['raw']:
+            return (self.path / f'{section}.xml').read_text('UTF-8')
+
+        tables = {
+            table: _rows(self._ipc(table, section), meta['layouts'][table])
+            for table in self.tables(section)
+        }
+        order = [(table, count) for table, count in meta['order']]
+        return _render(section, order, tables)
+
+    def to_eco2(self) -> Eco2:
+        """
+        `Eco2` 복원.
+
+        Returns
+        -------
+        Eco2
+        """
+        return Eco2(
+            header=self.header,
+            ds=self._section('DS') or '',
+            dsr=self._section('DSR'),
+        )
+
+    @staticmethod
+    def _collect(
+        root: _Element,
+    ) -> tuple[list[tuple[str, int]], dict[str, _Table]] | None:
+        order: list[tuple[str, int]] = []
+        tables: dict[str, _Table] = {}
+
+        for row in root:
+            if not isinstance(row.tag, str) or row.attrib:
+                return None
+
+            if not tables.setdefault(row.tag, _Table()).add(row):
+                return None
+
+            if order and order[-1][0] == row.tag:
+                order[-1] = (row.tag, order[-1][1] + 1)
+            else:
+                order.append((row.tag, 1))
+
+        return order, tables
+
+    @classmethod
+    def write(
+        cls,
+        src: str | Path | Eco2 | Eco2Bytes,
+        dst: str | Path,
+        *,
+        overwrite: bool = False,
+    ) -> Self:
+        """
+        Snapshot 저장.
+
+        Table로 원본 영역을 그대로 재현할 수 없는 경우 (하위 element, 속성
+        등), 해당 영역은 xml 원문으로 저장.
+
+        Parameters
+        ----------
+        src : str | Path | Eco2 | Eco2Bytes
+            ECO2 저장 파일 또는 해석한 데이터.
+        dst : str | Path
+            Snapshot 폴더.
+        overwrite : bool, optional
+            기존 snapshot 덮어쓰기 여부.
+
+        Returns
+        -------
+        Self
+
+        Raises
+        ------
+        FileExistsError
+            `dst`가 이미 존재하고 `overwrite`가 아닌 경우.
+        """
+        dst = Path(dst)
+        if dst.exists():
+            if not overwrite:
+                raise FileExistsError(dst)
+
+            shutil.rmtree(dst)
+
+        match src:
+            case Eco2():
+                eco = src
+            case Eco2Bytes():
+                eco = src.to_eco2()
+            case _:
+                eco = Eco2.read(src)
+
+        xml = Eco2Xml.create(eco)
+        meta: dict[str, Any] = {
+            'version': cls.VERSION,
+            'header': dc.asdict(eco.header),
+            'sections': dict.fromkeys(SECTIONS),
+        }
+
+        dst.mkdir(parents=True)
+        for section in SECTIONS:
+            text = eco.ds if section == 'DS' else eco.dsr
+            root = xml.ds if section == 'DS' else xml.dsr
+            if text is None or root is None:
+                continue
+
+            meta['sections'][section] = cls._write_section(dst, section, text, root)
+
+        (dst / cls.META).write_text(
+            json.dumps(meta, ensure_ascii=False, indent=2), encoding='UTF-8'
+        )
+
+        return cls(dst)
+
+    @classmethod
+    def _write_section(
+        cls,
+        dst: Path,
+        section: Section,
+        text: str,
+        root: _Element,
+    ) -> dict[str, Any]:
+        raw = {'raw': True, 'order': [], 'layouts': {}}
+
+        if (collected := cls._collect(root)) is None:
+            logger.debug('table로 표현할 수 없는 영역', section=section)
+            (dst / f'{section}.xml').write_text(text, encoding='UTF-8', newline='')
+            return raw
+
+        order, tables = collected
+        frames = {name: table.frame() for name, table in tables.items()}
+        layouts = {
+            name: [list(x) for x in table.layouts] for name, table in tables.items()
+        }
+
+        # 재현 결과가 원본과 다르면 원문 저장
+        rows = {name: _rows(frames[name], layouts[name]) for name in tables}
+        if _render(section, order, rows) != text:
+            logger.debug('table로 원본 영역을 재현할 수 없음', section=section)
+            (dst / f'{section}.xml').write_text(text, encoding='UTF-8', newline='')
+            return raw
+
+        (directory := dst / section).mkdir()
+        for name, frame in frames.items():
+            frame.write_ipc(directory / f'{name}.arrow', compression='uncompressed')
+
+        return {'raw': False, 'order': order, 'layouts': layouts}
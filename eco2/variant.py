@@ -0,0 +1,604 @@
+# ruff: file-ignore[undocumented-magic-method]
+"""
+하나의 기준 ECO2 파일로부터 설계 변수를 바꾼 변형 (variant) 파일 일괄 생성.
+
+기준 파일은 process마다 한 번만 해석하고, 변형별로 해석한 tree의 복사본을
+수정해 저장. 결과 폴더에 변형 파일과 파일별 변수 값 목록 (`manifest.csv`)을
+저장.
+
+`template` 모드 (기본값)에서는 변수 조합마다 변수 자리에 표식을 넣은 tree를
+한 번 직렬화해 고정 bytes 구간과 값 자리 (slot)로 나누고, 변형마다 값
+bytes만 끼워 넣어 저장 (lxml 작업 없음).
+
+Examples
+--------
+>>> gen = VariantGenerator('base.tpl')  # doctest: +SKIP
+>>> space = grid({'wall_uvalue': [0.15, 0.2], 'tbl_zone/침기율': [0.5, 1.0]})
+>>> gen.generate(space, 'variants', workers=4)  # doctest: +SKIP
+"""
+
+from __future__ import annotations
+
+import csv
+import dataclasses as dc
+import functools
+import itertools
+import operator
+import random
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, NoReturn, Self
+from xml.sax.saxutils import escape
+
+import structlog
+
+from eco2 import core, minilzo, parallel
+from eco2.editor import Eco2Xml, EditorError, SurfaceType
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping, Sequence
+
+logger = structlog.stdlib.get_logger()
+
+type Value = float | str
+type Params = dict[str, Value]
+
+
+class VariantError(EditorError):  # ruff: ignore[undocumented-public-class]
+    pass
+
+
+def grid(space: Mapping[str, Sequence[Value]]) -> list[Params]:
+    """
+    전체 조합 (full factorial).
+
+    Parameters
+    ----------
+    space : Mapping[str, Sequence[Value]]
+        변수별 값 목록.
+
+    Returns
+    -------
+    list[Params]
+
+    Examples
+    --------
+    >>> grid({
+    ...     'wall_uvalue': [0.15, 0.2],
+    ...     'shgc': [0.4],
+    ... })  # doctest: +NORMALIZE_WHITESPACE
+    [{'wall_uvalue': 0.15, 'shgc': 0.4}, {'wall_uvalue': 0.2, 'shgc': 0.4}]
+    """
+    names = list(space)
+    return [
+        dict(zip(names, values, strict=True))
+        for values in itertools.product(*space.values())
+    ]
+
+
+def lhs(
+    bounds: Mapping[str, tuple[float, float]],
+    n: int,
+    *,
+    seed: int | None = None,
+    ndigits: int | None = 4,
+) -> list[Params]:
+    """
+    Latin hypercube 표본.
+
+    변수별 범위를 `n`개 구간으로 나누고, 구간마다 하나씩 균등 분포로 추출한
+    값을 변수별로 섞어 조합.
+
+    Parameters
+    ----------
+    bounds : Mapping[str, tuple[float, float]]
+        변수별 (최솟값, 최댓값).
+    n : int
+        표본 수.
+    seed : int | None, optional
+    ndigits : int | None, optional
+        반올림 자릿수. `None`이면 반올림하지 않음.
+
+    Returns
+    -------
+    list[Params]
+    """
+    rng = random.Random(seed)  # ruff: ignore[suspicious-non-cryptographic-random-usage]
+    columns: dict[str, list[float]] = {}
+
+    for name, (lower, upper) in bounds.items():
+        width = (upper - lower) / n
+        values = [lower + (i + rng.random()) * width for i in range(n)]
+        rng.shuffle(values)
+        columns[name] = (
+            values if ndigits is None else [round(x, ndigits) for x in values]
+        )
+
+    return [{name: columns[name][i] for name in columns} for i in range(n)]
+
+
+def apply(xml: Eco2Xml, params: Mapping[str, Value | Symbol]) -> Eco2Xml:
+    """
+    변수 적용.
+
+    `PARAMETERS`의 변수 외에 `/`를 포함한 이름은 element 경로로 보고
+    `Eco2Xml.set_elements`로 수정 (e.g. `tbl_zone/침기율`). 기존 값이 없는
+    element도 수정.
+
+    Parameters
+    ----------
+    xml : Eco2Xml
+    params : Mapping[str, Value | Symbol]
+        변수 값 또는 template을 만들기 위한 `Symbol`.
+
+    Returns
+    -------
+    Eco2Xml
+
+    Raises
+    ------
+    VariantError
+        알 수 없는 변수이거나 값을 float로 변환할 수 없는 경우.
+    """
+    uvalue: float | None = None
+    shgc: float | None = None
+
+    for name, value in params.items():
+        if (surface := VariantGenerator.PARAMETERS.get(name)) is not None:
+            xml.set_walls(_float(name, value), surface)
+        elif name == 'window_uvalue':
+            uvalue = _float(name, value)
+        elif name == 'window_shgc':
+            shgc = _float(name, value)
+        elif '/' in name:
+            xml.set_elements(name, str(value), edit_none=True)
+        else:
+            msg = f'알 수 없는 변수: {name}'
+            raise VariantError(msg)
+
+    if uvalue is not None or shgc is not None:
+        xml.set_windows(uvalue=uvalue, shgc=shgc)
+
+    return xml
+
+
+def _float(name: str, value: Value | Symbol) -> Any:  # ruff: ignore[any-type]
+    # Symbol은 변형마다 float로 변환
+    if isinstance(value, Symbol):
+        return value.map(float)
+
+    try:
+        return float(value)
+    except (TypeError, ValueError) as e:
+        msg = f'변수 값을 계산할 수 없음: {name}={value!r}'
+        raise VariantError(msg) from e
+
+
+SLOT = re.compile(rb'\xee\x80\x80([0-9]+)\xee\x80\x81')
+"""값 자리 표식 (`U+E000` 번호 `U+E001`, UTF-8)."""
+
+
+class Symbol:
+    """
+    변형마다 계산할 값 (template slot).
+
+    편집 method에 값 대신 전달하면 산술 연산을 기록하고, 문자열로 변환할 때
+    (`str`, `format`) 값 자리 표식을 반환하며 slot으로 등록.
+
+    Parameters
+    ----------
+    func : Callable[[Mapping[str, Value]], Any]
+        변수로부터 값 계산.
+    slots : list[tuple[Symbol, str]]
+        등록한 slot (값, 형식) 목록.
+    """
+
+    __slots__ = ('_func', '_slots')
+
+    def __init__(
+        self,
+        func: Callable[[Mapping[str, Value]], Any],
+        slots: list[tuple[Symbol, str]],
+    ) -> None:
+        self._func = func
+        self._slots = slots
+
+    @classmethod
+    def param(cls, name: str, slots: list[tuple[Symbol, str]]) -> Self:
+        """변수 `name`의 값."""
+        return cls(operator.itemgetter(name), slots)
+
+    def evaluate(self, params: Mapping[str, Value]) -> object:
+        """값 계산."""
+        return self._func(params)
+
+    def map(self, func: Callable[[Any], Any]) -> Symbol:
+        """계산한 값에 `func` 적용."""
+        return Symbol(lambda p: func(self._func(p)), self._slots)
+
+    def _op(self, other: object, op: Callable[[Any, Any], Any]) -> Symbol:
+        if isinstance(other, Symbol):
+            return Symbol(lambda p: op(self._func(p), other.evaluate(p)), self._slots)
+
+        return Symbol(lambda p: op(self._func(p), other), self._slots)
+
+    def _rop(self, other: object, op: Callable[[Any, Any], Any]) -> Symbol:
+        return Symbol(lambda p: op(other, self._func(p)), self._slots)
+
+    def __add__(self, other: object) -> Symbol:
+        return self._op(other, operator.add)
+
+    def __radd__(self, other: object) -> Symbol:
+        return self._rop(other, operator.add)
+
+    def __sub__(self, other: object) -> Symbol:
+        return self._op(other, operator.sub)
+
+    def __rsub__(self, other: object) -> Symbol:
+        return self._rop(other, operator.sub)
+
+    def __mul__(self, other: object) -> Symbol:
+        return self._op(other, operator.mul)
+
+    def __rmul__(self, other: object) -> Symbol:
+        return self._rop(other, operator.mul)
+
+    def __truediv__(self, other: object) -> Symbol:
+        return self._op(other, operator.truediv)
+
+    def __rtruediv__(self, other: object) -> Symbol:
+        return self._rop(other, operator.truediv)
+
+    def __neg__(self) -> Symbol:
+        return self.map(operator.neg)
+
+    def __bool__(self) -> NoReturn:
+        # 값에 따라 수정 대상·구조가 달라지면 template으로 만들 수 없음
+        msg = '값에 따라 달라지는 조건은 template으로 만들 수 없음'
+        raise VariantError(msg)
+
+    def __format__(self, format_spec: str) -> str:
+        self._slots.append((self, format_spec))
+        return f'\ue000{len(self._slots) - 1}\ue001'
+
+    def __str__(self) -> str:
+        return format(self, '')
+
+
+@dc.dataclass(frozen=True)
+class _Segments:
+    static: list[bytes]
+    slots: list[tuple[Symbol, str]]
+
+    @classmethod
+    def split(cls, data: bytes, slots: list[tuple[Symbol, str]]) -> Self:
+        parts = SLOT.split(data)
+        return cls(
+            static=parts[::2],
+            slots=[slots[int(x)] for x in parts[1::2]],
+        )
+
+    @staticmethod
+    def _value(symbol: Symbol, spec: str, params: Mapping[str, Value]) -> bytes:
+        text = escape(format(symbol.evaluate(params), spec))
+        return text.encode().replace(b'\n', b'\r\n')
+
+    def render(self, params: Mapping[str, Value]) -> list[bytes]:
+        chunks = [self.static[0]]
+        for (symbol, spec), static in zip(self.slots, self.static[1:], strict=True):
+            chunks.extend((self._value(symbol, spec, params), static))
+
+        return chunks
+
+
+@dc.dataclass(frozen=True)
+class VariantTemplate:
+    """
+    변수 조합별 byte template.
+
+    변수 자리에 `Symbol`을 전달해 편집한 tree를 한 번 직렬화하고, 수정한
+    영역을 고정 bytes와 값 자리로 분리. 벽체 layer 교체 등 구조 변경은
+    template을 만들 때 한 번 수행하며, 새 layer의 값 (열전도율, 열저항)도
+    값 자리로 기록. 변형마다 값 bytes만 끼워 넣어 xor 암호화, MiniLZO 압축
+    후 저장.
+    """
+
+    header: core.Header
+    ds: _Segments
+    dsr: _Segments | None
+
+    @classmethod
+    def create(
+        cls,
+        raw: core.Eco2Bytes,
+        xml: Eco2Xml,
+        names: Iterable[str],
+    ) -> Self:
+        """
+        Template 생성.
+
+        Parameters
+        ----------
+        raw : core.Eco2Bytes
+            기준 파일 원본 bytes.
+        xml : Eco2Xml
+            기준 tree 복사본 (수정됨).
+        names : Iterable[str]
+            변수 이름 (적용 순서).
+
+        Returns
+        -------
+        Self
+
+        Raises
+        ------
+        VariantError
+            값에 따라 수정 대상이 달라지는 등 template으로 만들 수 없는 경우.
+        """
+        slots: list[tuple[Symbol, str]] = []
+        try:
+            apply(xml, {name: Symbol.param(name, slots) for name in names})
+        except (TypeError, ValueError) as e:
+            msg = f'template으로 만들 수 없는 변수: {names}'
+            raise VariantError(msg) from e
+
+        def section(tag: core.Section) -> _Segments | None:
+            if not xml.modified(tag):
+                data = raw.raw_ds if tag == 'DS' else raw.raw_dsr
+                return None if data is None else _Segments([bytes(data)], [])
+
+            return _Segments.split(b''.join(xml.iter_bytes(tag)), slots)
+
+        ds = section('DS')
+        assert ds is not None
+        return cls(header=raw.header, ds=ds, dsr=section('DSR'))
+
+    def write(
+        self,
+        params: Mapping[str, Value],
+        path: str | Path,
+        *,
+        dsr: bool | None = None,
+        level: minilzo.Level = 'fast',
+    ) -> None:
+        """
+        변형 파일 저장.
+
+        Parameters
+        ----------
+        params : Mapping[str, Value]
+        path : str | Path
+        dsr : bool | None, optional
+            DSR (결과) 부분 저장 여부.
+            `None`일 경우, `.eco` 또는 `.ecox`로 저장할 때 DSR 제외.
+        level : minilzo.Level, optional
+
+        Raises
+        ------
+        VariantError
+            값을 계산할 수 없는 경우.
+        """
+        path = Path(path)
+        if dsr is None:
+            dsr = not path.suffix.lower().startswith('.eco')
+
+        try:
+            ds = self.ds.render(params)
+            result = (
+                self.dsr.render(params)
+                if dsr and self.dsr is not None
+                else [core.Eco2.EMPTY_DSR.encode()]
+            )
+        except (ArithmeticError, KeyError, TypeError, ValueError) as e:
+            msg = f'변수 값을 계산할 수 없음: {e!r}'
+            raise VariantError(msg) from e
+
+        lengths = (sum(map(len, ds)), sum(map(len, result)))
+        with core.Eco2Writer(path, self.header, lengths, level=level) as writer:
+            writer.write_section(ds)
+            writer.write_section(result)
+
+
+@dc.dataclass(frozen=True)
+class Variant:
+    """생성한 변형 파일."""
+
+    path: Path
+    params: Params
+    error: str | None = None
+
+
+@dc.dataclass(frozen=True)
+class VariantGenerator:
+    """
+    기준 ECO2 파일로부터 변형 파일 생성.
+
+    Parameters
+    ----------
+    src : str | Path
+        기준 ECO2 저장 파일.
+    suffix : str | None, optional
+        변형 파일 확장자 (e.g. `.tplx`, `tplx`). 미지정 시 기준 파일과 같은
+        확장자.
+    template : bool, optional
+        변수 조합별 byte template 사용 여부 (기본값 `True`). Template으로
+        만들 수 없는 조합은 변형마다 tree를 수정해 저장.
+    """
+
+    src: str | Path
+
+    _: dc.KW_ONLY
+
+    suffix: str | None = None
+    template: bool = True
+
+    PARAMETERS: ClassVar[dict[str, SurfaceType]] = {
+        'wall_uvalue': '외벽(벽체)',
+        'roof_uvalue': '외벽(지붕)',
+        'floor_uvalue': '외벽(바닥)',
+    }
+    """벽체 열관류율 변수와 대상 표면 유형. 창은 `window_uvalue`, `window_shgc`."""
+
+    MANIFEST: ClassVar[str] = 'manifest.csv'
+
+    @functools.cached_property
+    def base(self) -> tuple[core.Eco2Bytes, Eco2Xml]:
+        """기준 파일 원본 bytes와 해석한 tree."""
+        raw = core.Eco2Bytes.read(self.src)
+        return raw, Eco2Xml.create(raw, sections=('DS',))
+
+    def variant(self, params: Mapping[str, Value]) -> Eco2Xml:
+        """
+        기준 tree 복사본에 변수를 적용한 변형.
+
+        Parameters
+        ----------
+        params : Mapping[str, Value]
+
+        Returns
+        -------
+        Eco2Xml
+        """
+        return apply(self.base[1].copy(), params)
+
+    @functools.cached_property
+    def _templates(self) -> dict[tuple[str, ...], VariantTemplate | None]:
+        return {}
+
+    def variant_template(self, names: Iterable[str]) -> VariantTemplate | None:
+        """
+        변수 조합의 byte template. 만들 수 없으면 `None`.
+
+        Parameters
+        ----------
+        names : Iterable[str]
+            변수 이름 (적용 순서).
+
+        Returns
+        -------
+        VariantTemplate | None
+        """
+        key = tuple(names)
+        if key not in self._templates:
+            raw, xml = self.base
+            try:
+                self._templates[key] = VariantTemplate.create(raw, xml.copy(), key)
+            except VariantError:
+                logger.debug('template 생성 실패', names=key, exc_info=True)
+                self._templates[key] = None
+
+        return self._templates[key]
+
+    def write(self, params: Mapping[str, Value], path: str | Path) -> None:
+        """
+        변형 파일 저장. 수정하지 않은 영역은 기준 파일 bytes를 그대로 사용.
+
+        Parameters
+        ----------
+        params : Mapping[str, Value]
+        path : str | Path
+        """
+        if self.template and (template := self.variant_template(params)):
+            template.write(params, path)
+            return
+
+        raw = self.base[0]
+        self.variant(params).write_eco2(path, raw.header, source=raw)
+
+    def _write(self, path: Path, params: Params) -> Variant:
+        error = parallel.attempt(functools.partial(self.write, params, path), path)
+        return Variant(path, params, error)
+
+    def paths(self, directory: Path, count: int) -> list[Path]:
+        """
+        변형 파일 경로 (`{기준 파일 이름}_{번호}{확장자}`).
+
+        Parameters
+        ----------
+        directory : Path
+        count : int
+
+        Returns
+        -------
+        list[Path]
+        """
+        src = Path(self.src)
+        suffix = f'.{self.suffix.removeprefix(".")}' if self.suffix else src.suffix
+        width = len(str(count - 1))
+        return [directory / f'{src.stem}_{i:0{width}d}{suffix}' for i in range(count)]
+
+    def generate(
+        self,
+        variants: Iterable[Mapping[str, Value]],
+        directory: str | Path,
+        *,
+        workers: int | None = None,
+    ) -> list[Variant]:
+        """
+        변형 파일과 `manifest.csv` 생성.
+
+        Parameters
+        ----------
+        variants : Iterable[Mapping[str, Value]]
+            변형별 변수 (`grid`, `lhs` 또는 직접 지정한 목록).
+        directory : str | Path
+            저장 폴더.
+        workers : int | None, optional
+            Process 수. 1이면 현재 process에서 생성, `None`이면 CPU 수.
+
+        Returns
+        -------
+        list[Variant]
+        """
+        params = [dict(x) for x in variants]
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        paths = self.paths(directory, len(params))
+
+        result = list(
+            parallel.run(
+                VariantGenerator._write,
+                self,
+                list(zip(paths, params, strict=True)),
+                workers=workers,
+                factory=functools.partial(
+                    _generator, self.src, self.suffix, self.template
+                ),
+            )
+        )
+
+        self.write_manifest(result, directory / self.MANIFEST)
+        return result
+
+    @staticmethod
+    def write_manifest(variants: Sequence[Variant], path: Path) -> None:
+        """
+        변형 파일별 변수 값 목록 저장 (csv).
+
+        Parameters
+        ----------
+        variants : Sequence[Variant]
+        path : Path
+        """
+        names = list(dict.fromkeys(k for x in variants for k in x.params))
+
+        with path.open('w', encoding='UTF-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['path', *names, 'error'])
+            for v in variants:
+                writer.writerow([
+                    v.path.relative_to(path.parent).as_posix(),
+                    *(v.params.get(x, '') for x in names),
+                    v.error or '',
+                ])
+
+
+def _generator(
+    src: str | Path,
+    suffix: str | None,
+    template: bool,  # ruff: ignore[boolean-type-hint-positional-argument]
+) -> VariantGenerator:
+    # worker process마다 기준 파일을 한 번 해석
+    generator = VariantGenerator(src, suffix=suffix, template=template)
+    _ = generator.base
+    return generator
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import csv
+import json
+import shutil
+from typing import TYPE_CHECKING
+
+import pytest
+
+from eco2.batch import EditSpec, EditSpecError, edit_files
+from eco2.cli import app
+from eco2.core import Header
+from eco2.editor import Eco2Editor
+from tests.data import ECO2, ROOT
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SPEC = """
+[[operations]]
+op = "set_walls"
+uvalue = 0.15
+
+[[operations]]
+op = "set_windows"
+uvalue = 1.2
+shgc = 0.4
+surface_type = "외부창"
+
+[[operations]]
+op = "set_elements"
+path = "tbl_zone/침기율"
+value = "0.5"
+edit_none = true
+"""
+
+
+def _expected(src: Path, dst: Path) -> bytes:
+    editor = Eco2Editor(src)
+    (
+        editor.xml
+        .set_walls(0.15)
+        .set_windows(uvalue=1.2, shgc=0.4, surface_type='외부창')
+        .set_elements('tbl_zone/침기율', '0.5', edit_none=True)
+    )
+    editor.write(dst)
+    return dst.read_bytes()
+
+
+def test_edit_spec(tmp_path: Path):
+    toml = tmp_path / 'spec.toml'
+    toml.write_text(SPEC, encoding='UTF-8')
+    spec = EditSpec.read(toml)
+    assert [x.op for x in spec.operations] == [
+        'set_walls',
+        'set_windows',
+        'set_elements',
+    ]
+
+    data = {'operations': [{'op': x.op, **x.kwargs} for x in spec.operations]}
+    (path := tmp_path / 'spec.json').write_text(
+        json.dumps(data, ensure_ascii=False), encoding='UTF-8'
+    )
+    assert EditSpec.read(path) == spec
+
+    src = ROOT / 'test_tpl.tpl'
+    spec.edit(src, dst := tmp_path / 'edited.tpl')
+    assert dst.read_bytes() == _expected(src, tmp_path / 'expected.tpl')
+
+
+@pytest.mark.parametrize(
+    ('data', 'match'),
+    [
+        ({'operations': [{'op': 'remove'}]}, '지원하지 않는 작업'),
+        ({'operations': [{'op': 'set_walls'}]}, '인자 오류'),
+        ({'operations': [{'op': 'set_walls', 'u': 1}]}, '인자 오류'),
+        ({'operations': []}, '수정 작업'),
+        ({'operations': [{'op': 'set_walls', 'uvalue': 1}], 'x': 1}, '명세 항목'),
+    ],
+)
+def test_edit_spec_error(data: dict, match: str):
+    with pytest.raises(EditSpecError, match=match):
+        EditSpec.create(data)
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_edit_files(workers: int, tmp_path: Path):
+    spec = EditSpec.create({
+        'operations': [{'op': 'set_windows', 'uvalue': 1.2, 'if_empty': 'raise'}]
+    })
+    files = [(ROOT / x, tmp_path / x) for x in ECO2]
+    results = list(edit_files(spec, files, workers=workers))
+
+    assert [x.src for x in results] == [x[0] for x in files]
+    for result in results:
+        # 외부창이 없는 파일은 실패
+        assert (result.error is None) is result.dst.exists()
+
+    assert any(x.error is None for x in results)
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_edit_files_corrupt(workers: int, tmp_path: Path):
+    # header는 정상이고 DS가 손상된 파일
+    raw = (ROOT / 'test_tpl.tpl').read_bytes()
+    (corrupt := tmp_path / 'corrupt.tpl').write_bytes(raw[: Header.SIZE] + bytes(1000))
+
+    spec = EditSpec.create({'operations': [{'op': 'set_walls', 'uvalue': 0.2}]})
+    files = [
+        (corrupt, tmp_path / 'output' / 'corrupt.tpl'),
+        (ROOT / 'test_tpl.tpl', tmp_path / 'output' / 'test_tpl.tpl'),
+    ]
+    results = list(edit_files(spec, files, workers=workers))
+
+    assert results[0].error is not None
+    assert results[0].error.startswith('XMLSyntaxError')
+    assert not results[0].dst.exists()
+    assert results[1].error is None
+
+
+def test_cli_edit(tmp_path: Path):
+    src = tmp_path / 'src'
+    (src / 'sub').mkdir(parents=True)
+    shutil.copy(ROOT / 'test_tpl.tpl', src / 'a.tpl')
+    shutil.copy(ROOT / 'test_tpl.tpl', src / 'sub' / 'b.tpl')
+    (src / 'broken.tpl').write_bytes(b'broken')
+
+    (spec := tmp_path / 'spec.toml').write_text(SPEC, encoding='UTF-8')
+    output = tmp_path / 'output'
+
+    with pytest.raises(SystemExit) as e:
+        app(list(map(str, ['edit', spec, src, '--output', output, '--workers', 1])))
+    assert e.value.code == 1
+
+    expected = _expected(ROOT / 'test_tpl.tpl', tmp_path / 'expected.tpl')
+    assert (output / 'a.tpl').read_bytes() == expected
+    assert (output / 'sub' / 'b.tpl').read_bytes() == expected
+    assert not (output / 'broken.tpl').exists()
+
+    with (output / 'summary.csv').open(encoding='UTF-8', newline='') as f:
+        summary = {x['src'].rsplit('/', 1)[-1]: x['error'] for x in csv.DictReader(f)}
+    assert not summary['a.tpl']
+    assert not summary['b.tpl']
+    assert summary['broken.tpl']
+
+    # 점 없이 지정한 확장자
+    output = tmp_path / 'tplx'
+    args = ['edit', spec, src / 'a.tpl', '--output', output, '--suffix', 'tplx']
+    with pytest.raises(SystemExit) as e:
+        app(list(map(str, args)))
+    assert e.value.code == 0
+    assert (output / 'a.tplx').exists()
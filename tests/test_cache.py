@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import os
+import shutil
+from typing import TYPE_CHECKING
+
+import pytest
+
+from eco2 import Eco2Xml
+from eco2.core import TreeCache, set_tree_cache
+from eco2.core.lazy import is_deferred
+from eco2.editor import Eco2Editor
+from tests.data import ECO2, ROOT
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+
+@pytest.fixture
+def cache() -> Generator[TreeCache]:
+    yield set_tree_cache(TreeCache())  # type: ignore[misc]
+    set_tree_cache(None)
+
+
+@pytest.mark.parametrize('file', ECO2)
+def test_tree_cache(file: str, cache: TreeCache):
+    src = ROOT / file
+    expected = Eco2Xml.read(src).tostring()
+
+    first = Eco2Xml.read(src)
+    second = Eco2Xml.read(src)
+    assert (cache.stats.hits, cache.stats.misses) == (2, 1)
+    assert len(cache) == 1
+    assert cache.size > 0
+
+    # 복사본 수정이 cache에 영향을 주지 않음
+    assert first.ds is not second.ds
+    first.ds.clear()
+    assert Eco2Xml.read(src).tostring() == expected
+
+    # 영역별 cache
+    xml = Eco2Xml.read(src, sections=['DS'])
+    assert len(cache) == 2  # ruff: ignore[magic-value-comparison]
+    assert not is_deferred(xml, 'ds')
+    assert xml.tostring() == expected
+
+
+def test_tree_cache_invalidate(cache: TreeCache, tmp_path: Path):
+    src = tmp_path / 'test.tpl'
+    shutil.copy2(ROOT / 'test_tpl.tpl', src)
+
+    Eco2Xml.read(src)
+    stat = src.stat()
+    os.utime(src, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    Eco2Xml.read(src)
+
+    assert cache.stats.misses == 2  # ruff: ignore[magic-value-comparison]
+    assert len(cache) == 1
+
+
+def test_tree_cache_evict(cache: TreeCache):
+    Eco2Xml.read(ROOT / ECO2[0])
+    cache.budget = cache.size + 1
+
+    Eco2Xml.read(ROOT / ECO2[1])
+    assert cache.stats.evictions >= 1
+    assert cache.size <= cache.budget
+
+    cache.budget = 0
+    Eco2Xml.read(ROOT / ECO2[2])
+    assert len(cache) <= 1
+
+
+def test_tree_cache_editor(cache: TreeCache, tmp_path: Path):
+    src = ROOT / 'test_tpl.tpl'
+
+    for idx in range(2):
+        editor = Eco2Editor(src)
+        editor.xml.set_walls(uvalue=0.2)
+        editor.write(dst := tmp_path / f'{idx}.tpl')
+
+    assert cache.stats.hits == 1
+    assert (tmp_path / '0.tpl').read_bytes() == dst.read_bytes()
@@ -1,10 +1,11 @@
+import json
 import shutil
 from pathlib import Path
 
 import pytest
 
 from eco2.cli import app
-from tests.data import ECO2, ROOT
+from tests.data import ECO2, ECO2OD, ROOT
 
 EXTENSIONS = ('eco', 'ecox', 'tpl', 'tplx')
 
@@ -81,3 +82,65 @@ def test_cli_input_dir(tmp_path: Path):
     for file in ECO2:
         f = (tmp_path / file).with_suffix('.ecox')
         assert f.exists(), f
+
+
+@pytest.mark.parametrize('ext', ['eco', 'tplx'])
+def test_cli_stream(ext: str, tmp_path: Path):
+    src = ROOT / 'test_tplx.tplx'
+
+    args = ['decrypt', src, '--output', tmp_path, '--stream']
+    with pytest.raises(SystemExit):
+        app(list(map(str, args)))
+
+    xml = tmp_path / 'test_tplx.xml'
+    assert xml.exists()
+
+    args = ['encrypt', xml, '--output', tmp_path, '--extension', ext, '--stream']
+    with pytest.raises(SystemExit):
+        app(list(map(str, args)))
+
+    assert (tmp_path / f'test_tplx.{ext}').exists()
+
+
+def test_ls(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    output = tmp_path / 'headers.json'
+
+    with pytest.raises(SystemExit):
+        app(['ls', str(ROOT), '--output', str(output)])
+
+    data = json.loads(output.read_text('UTF-8'))
+    assert {Path(x['path']).name for x in data} == {*ECO2, *ECO2OD}
+    assert all(x['Name'] for x in data)
+
+    capsys.readouterr()
+    with pytest.raises(SystemExit):
+        app(['ls', str(ROOT), '--format', 'json'])
+    assert json.loads(capsys.readouterr().out) == data
+
+    with pytest.raises(SystemExit):
+        app(['ls', str(ROOT / ECO2[0])])
+
+    # `--output`에 `--format` 적용
+    table = tmp_path / 'headers.txt'
+    with pytest.raises(SystemExit):
+        app(['ls', str(ROOT), '--output', str(table), '--format', 'table'])
+    text = table.read_text('UTF-8')
+    assert 'Path' in text
+    assert all(x['Name'] in text for x in data)
+    assert '\x1b[' not in text
+
+
+@pytest.mark.parametrize('tags', [None, ['tbl_zone']])
+def test_prune(tmp_path: Path, tags: list[str] | None):
+    args = ['prune', ROOT, '--output', tmp_path]
+    if tags:
+        args.extend(['--tags', *tags])
+
+    with pytest.raises(SystemExit):
+        app(list(map(str, args)))
+
+    for file in ECO2:
+        text = (tmp_path / file).with_suffix('.xml').read_text('UTF-8')
+        assert text.startswith('<DS xmlns=')
+        assert ('<tbl_zone>' in text) is (tags is None)
+        assert ('<tbl_weather>' in text) is (tags is not None)
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from eco2 import Eco2, Eco2Xml
+from eco2.cli import app
+from eco2.core import DiskCache, set_disk_cache
+from tests.data import ECO2, ROOT
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Generator[DiskCache]:
+    yield set_disk_cache(DiskCache(tmp_path / 'cache'))  # type: ignore[misc]
+    set_disk_cache(None)
+
+
+@pytest.mark.parametrize('file', ECO2)
+def test_disk_cache(file: str, cache: DiskCache):
+    src = ROOT / file
+    set_disk_cache(None)
+    expected = Eco2.read(src)
+    set_disk_cache(cache)
+
+    first = Eco2.read(src)
+    encrypted = src.suffix != '.tpl'
+    key = cache.key(
+        src.read_bytes(),
+        xor=src.suffix.startswith('.eco'),
+        decompress=src.suffix.endswith('x'),
+    )
+    assert cache.path(key).exists() is encrypted
+    assert len(cache.entries()) == int(encrypted)
+
+    second = Eco2.read(src)
+    xml = Eco2Xml.read(src, sections=('DS', 'DSR'))
+
+    for eco in [first, second]:
+        assert eco.header == expected.header
+        assert eco.ds == expected.ds
+        assert eco.dsr == expected.dsr
+
+    assert xml.tostring() == Eco2Xml.create(expected).tostring()
+
+
+def test_disk_cache_key(tmp_path: Path, cache: DiskCache):
+    # 같은 bytes라도 복호화 방식이 다르면 다른 key
+    data = b'data'
+    keys = {
+        cache.key(data, xor=x, decompress=d)
+        for x in [False, True]
+        for d in [False, True]
+    }
+    assert len(keys) == 4  # ruff: ignore[magic-value-comparison]
+
+    raw = (ROOT / 'test_ecox.ecox').read_bytes()
+    (eco := tmp_path / 'a.ecox').write_bytes(raw)
+    (tpl := tmp_path / 'a.tplx').write_bytes(raw)
+    Eco2.read(eco)
+    with pytest.raises(ValueError):  # ruff: ignore[pytest-raises-too-broad]
+        Eco2.read(tpl)
+
+
+def test_disk_cache_prune(cache: DiskCache):
+    for file in ECO2:
+        Eco2.read(ROOT / file)
+
+    entries = cache.entries()
+    assert len(entries) == 3  # ruff: ignore[magic-value-comparison]
+
+    # 첫 파일을 가장 최근에 사용
+    for idx, entry in enumerate(entries):
+        os.utime(entry.path, (idx, idx))
+    with cache.open(entries[0].key) as view:
+        assert view is not None
+
+    size = cache.size()
+    removed = cache.prune(size - 1)
+    assert [x.key for x in removed] == [entries[1].key]
+    assert cache.size() == size - entries[1].size
+
+    cache.prune()
+    assert not cache.entries()
+
+
+def test_disk_cache_max_size(tmp_path: Path):
+    cache = DiskCache(tmp_path, max_size=4)
+    cache.put('aa', b'0123')
+    cache.put('bb', b'4567')
+
+    assert [x.key for x in cache.entries()] == ['bb']
+
+    with cache.open('aa') as view:
+        assert view is None
+    with cache.open('bb') as view:
+        assert view is not None
+        assert bytes(view) == b'4567'
+
+
+def test_disk_cache_put_size(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    cache = DiskCache(tmp_path, max_size=100)
+    calls = 0
+    entries = cache.entries
+
+    def count():
+        nonlocal calls
+        calls += 1
+        return entries()
+
+    monkeypatch.setattr(cache, 'entries', count)
+
+    # 추정 크기가 최대 크기를 넘을 때만 전체 목록 확인
+    for idx in range(9):
+        cache.put(f'{idx:02d}', b'0' * 10)
+    assert calls == 1
+
+    cache.put('10', b'0' * 20)
+    assert calls == 2  # ruff: ignore[magic-value-comparison]
+    assert cache.size() <= 100  # ruff: ignore[magic-value-comparison]
+
+
+def test_disk_cache_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv('ECO2_CACHE_DIR', raising=False)
+    assert DiskCache.from_env() is None
+
+    monkeypatch.setenv('ECO2_CACHE_DIR', str(tmp_path))
+    monkeypatch.setenv('ECO2_CACHE_SIZE', '1024')
+    cache = DiskCache.from_env()
+    assert cache is not None
+    assert cache.root == tmp_path
+    assert cache.max_size == 1024  # ruff: ignore[magic-value-comparison]
+
+
+def test_cli_cache(tmp_path: Path):
+    cache = DiskCache(tmp_path)
+    cache.put('aa', b'0' * 1024)
+    cache.put('bb', b'1' * 1024)
+
+    with pytest.raises(SystemExit):
+        app(['cache', '--dir', str(tmp_path)])
+
+    with pytest.raises(SystemExit):
+        app(['cache', 'prune', '--dir', str(tmp_path), '--max-size', '1'])
+    assert len(cache.entries()) == 2  # ruff: ignore[magic-value-comparison]
+
+    with pytest.raises(SystemExit):
+        app(['cache', 'clear', '--dir', str(tmp_path)])
+    assert not cache.entries()
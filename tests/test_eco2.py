@@ -1,10 +1,47 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from lxml.etree import _Element  # ruff: ignore[import-private-name]
 
-from eco2 import Eco2, Eco2Xml
+from eco2 import Eco2, Eco2Bytes, Eco2Xml, Header
+from eco2.core import (
+    Eco2Writer,
+    decrypt_xml,
+    encrypt_xml,
+    iter_tables,
+    read_header,
+    transcode,
+)
+from eco2.core.lazy import is_deferred
 from tests.data import ECO2, ECO2OD, ROOT
 
 
+@pytest.mark.parametrize('size', [0, 1, 7, 4096, 12345])
+@pytest.mark.parametrize('offset', [0, 1, 2, 3, 5])
+def test_xor(size: int, offset: int):
+    data = bytes(range(256)) * (size // 256 + 1)
+    data = data[:size]
+    expected = Eco2.xor_reference(data, offset)
+
+    assert Eco2.xor(data, offset) == expected
+
+    buffer = bytearray(data)
+    Eco2.xor_into(memoryview(buffer), offset)
+    assert buffer == expected
+
+
+def test_xor_chunks(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr('eco2.core.data.XOR_BLOCK', 64)
+
+    data = (ROOT / 'test_eco.eco').read_bytes()[:1000]
+    chunks = [data[:3], data[3:250], data[250:]]
+    offsets = [0, 3, 250]
+
+    xored = b''.join(map(Eco2.xor, chunks, offsets))
+    assert xored == Eco2.xor_reference(data)
+
+
 @pytest.mark.parametrize('file', ECO2)
 def test_eco2(file: str):
     src = ROOT / file
@@ -14,6 +51,140 @@ def test_eco2(file: str):
         assert src.read_bytes() == eco.encrypt(xor=False, compress=False)
 
 
+@pytest.mark.parametrize('file', ECO2)
+def test_eco2_bytes(file: str, tmp_path):
+    path = ROOT / file
+    eco = Eco2.read(path)
+    raw = Eco2Bytes.read(path)
+
+    assert 'ds' not in raw.__dict__
+    assert raw.xml == eco.xml
+    assert raw.to_eco2() == eco
+    assert Eco2Bytes.from_eco2(eco).raw_ds == raw.raw_ds
+
+    for xor in [False, True]:
+        for compress in [False, True]:
+            assert raw.encrypt(xor=xor, compress=compress) == eco.encrypt(
+                xor=xor, compress=compress
+            )
+
+    # 수정하지 않은 DS, DSR은 그대로 저장
+    dst = tmp_path / path.name
+    raw.write(dst, dsr=True)
+    assert Eco2Bytes.read(dst).raw_ds == raw.raw_ds
+
+    # 지정한 DS, DSR은 encode해 저장
+    eco.ds = raw.ds = raw.ds.replace('<tbl_Desc>', '<tbl_Desc>\n', 1)
+    eco.dsr = raw.dsr = None
+    assert raw.encrypt(xor=False, compress=False) == eco.encrypt(
+        xor=False, compress=False
+    )
+    raw.write(dst, dsr=True)
+    written = Eco2Bytes.read(dst)
+    assert written.ds == eco.ds
+    assert written.raw_dsr == Eco2.EMPTY_DSR.encode()
+
+
+@pytest.mark.parametrize('file', ECO2)
+@pytest.mark.parametrize(
+    ('ext', 'dsr'), [('eco', None), ('tpl', False), ('ecox', True), ('tplx', None)]
+)
+def test_transcode(file: str, ext: str, dsr, tmp_path):
+    dst = tmp_path / f'dst.{ext}'
+    ref = tmp_path / f'ref.{ext}'
+
+    transcode(ROOT / file, dst, dsr=dsr)
+    Eco2.read(ROOT / file).write(ref, dsr=dsr)
+
+    assert dst.read_bytes() == ref.read_bytes()
+
+
+@pytest.mark.parametrize('file', ECO2)
+@pytest.mark.parametrize('section', ['DS', 'DSR'])
+def test_sections(file: str, section):
+    path = ROOT / file
+    other = {'DS': 'dsr', 'DSR': 'ds'}[section]
+
+    eco = Eco2.read(path)
+    partial = Eco2.read(path, sections=[section])
+    assert is_deferred(partial, other) == (getattr(eco, other) is not None)
+    assert partial == eco
+    assert not is_deferred(partial, other)
+
+    xml = Eco2Xml.read(path)
+    partial_xml = Eco2Xml.read(path, sections=[section])
+    assert is_deferred(partial_xml, other) == (getattr(xml, other) is not None)
+    assert partial_xml.tostring() == xml.tostring()
+
+    partial_xml = Eco2Xml.create(Eco2Bytes.read(path), sections=[section])
+    assert partial_xml.tostring() == xml.tostring()
+
+
+def test_parse():
+    path = ROOT / 'test_tpl.tpl'
+    raw = path.read_bytes()
+    expected = Eco2.parse(raw)
+    assert expected[2] is not None
+
+    with path.open('rb') as f:
+        assert Eco2.parse(f) == expected
+
+    assert Eco2.parse(io.BytesIO(raw)) == expected
+    assert Eco2.parse(memoryview(bytearray(raw))) == expected
+
+    # DSR 없이 DS만 있는 경우
+    _, ds, _ = Eco2.split(raw)
+    end = bytes(ds.obj).index(b'</DS>') + len(b'</DS>')
+    assert Eco2.parse(raw[:end])[2] is None
+
+    with pytest.raises(ValueError, match='DS length'):
+        Eco2.parse(raw[: Header.SIZE] + b'\xff' * 16)
+
+
+@pytest.mark.parametrize('file', [*ECO2, *ECO2OD])
+@pytest.mark.parametrize('ext', ['eco', 'ecox', 'tpl', 'tplx'])
+def test_stream(file: str, ext: str, tmp_path):
+    eco = Eco2.read(ROOT / file)
+
+    xml = tmp_path / 'eco.xml'
+    header = decrypt_xml(ROOT / file, xml, chunk_size=4096)
+    assert header == eco.header
+    assert xml.read_text('UTF-8') == eco.xml
+
+    assert read_header(ROOT / file) == eco.header
+
+    dst = tmp_path / f'eco.{ext}'
+    encrypt_xml(xml, dst, header, dsr=True, chunk_size=4096)
+    encrypted = Eco2.read(dst)
+    assert encrypted.ds == eco.ds
+    assert encrypted.dsr == (eco.dsr or Eco2.EMPTY_DSR)
+
+    if not ext.endswith('x'):
+        ref = tmp_path / f'ref.{ext}'
+        eco.write(ref, dsr=True)
+        assert dst.read_bytes() == ref.read_bytes()
+
+
+@pytest.mark.parametrize('ext', ['eco', 'ecox', 'tpl', 'tplx'])
+def test_stream_writer_error(ext: str, tmp_path):
+    header = Eco2.read(ROOT / ECO2[0]).header
+    dst = tmp_path / f'eco.{ext}'
+
+    # 저장하지 않은 영역이 남은 경우 불완전한 파일 삭제
+    writer = Eco2Writer(dst, header, (5, 5))
+    writer.write_section([b'abcde'])
+    with pytest.raises(ValueError, match='not written'):
+        writer.close()
+    assert not dst.exists()
+
+    with (
+        pytest.raises(ValueError, match='length mismatch'),
+        Eco2Writer(dst, header, (5,)) as writer,
+    ):
+        writer.write_section([b'abc'])
+    assert not dst.exists()
+
+
 @pytest.mark.parametrize('file', ECO2)
 def test_eco2xml(file: str):
     eco = Eco2.read(ROOT / file)
@@ -34,7 +205,121 @@ def test_eco2xml(file: str):
         assert '<DS xmlns="http://tempuri.org/DS.xsd">' in xml.tostring()
 
 
+@pytest.mark.parametrize('file', [*ECO2, *ECO2OD])
+@pytest.mark.parametrize(('ext', 'dsr'), [('eco', None), ('tpl', True), ('tplx', None)])
+def test_eco2xml_write_eco2(file: str, ext: str, dsr, tmp_path):
+    xml = Eco2Xml.read(ROOT / file)
+    header = read_header(ROOT / file)
+
+    dst = tmp_path / f'dst.{ext}'
+    ref = tmp_path / f'ref.{ext}'
+
+    xml.write_eco2(dst, header, dsr=dsr)
+    eco = Eco2(header=header, ds=xml.tostring('DS'), dsr=xml.tostring('DSR'))
+    eco.write(ref, dsr=dsr)
+
+    assert dst.read_bytes() == ref.read_bytes()
+
+
+def test_eco2xml_threads():
+    path = ROOT / 'test_tpl.tpl'
+    expected = Eco2Xml.read(path).tostring()
+
+    with ThreadPoolExecutor(4) as executor:
+        results = executor.map(lambda _: Eco2Xml.read(path).tostring(), range(8))
+        assert all(x == expected for x in results)
+
+
+def test_eco2xml_parse_error(monkeypatch: pytest.MonkeyPatch):
+    import eco2.core.xml  # ruff: ignore[import-outside-top-level]
+
+    def strip_namespace(*_args):
+        yield b'<DS><broken attr='
+        raise OSError
+
+    # 해석 중 오류 후 같은 thread에서 다시 해석
+    with monkeypatch.context() as m:
+        m.setattr(eco2.core.xml, '_strip_namespace', strip_namespace)
+        with pytest.raises(OSError):  # ruff: ignore[pytest-raises-too-broad]
+            Eco2Xml._parse(b'', 'DS')  # ruff: ignore[private-member-access]
+
+    data = f'<DS xmlns="{Eco2Xml.URI.format("DS")}"><a/></DS>'.encode()
+    element = Eco2Xml._parse(data, 'DS')  # ruff: ignore[private-member-access]
+    assert [x.tag for x in element.iter()] == ['DS', 'a']
+
+
 @pytest.mark.parametrize('file', ECO2OD)
 def test_eco2xml_eco2od(file: str):
     eco = Eco2Xml.read(ROOT / file)
     assert next(eco.iterfind('tbl_profile_od')) is not None
+
+
+@pytest.mark.parametrize('file', [*ECO2, *ECO2OD])
+@pytest.mark.parametrize('chunk_size', [1000, 1 << 16])
+def test_iter_tables(file: str, chunk_size: int):
+    src = ROOT / file
+    tables = ['tbl_Desc', 'tbl_zone', 'tbl_yk']
+    xml = Eco2Xml.read(src)
+
+    expected = [
+        (str(e.tag), {str(x.tag): x.text for x in e})
+        for e in xml.iterfind('*')
+        if e.tag in tables
+    ]
+    rows = list(iter_tables(src, tables, chunk_size=chunk_size))
+    assert rows
+    assert rows == expected
+
+    ds = list(iter_tables(src, tables, sections=['DS'], chunk_size=chunk_size))
+    assert ds == [
+        (str(e.tag), {str(x.tag): x.text for x in e}) for e in xml.ds if e.tag in tables
+    ]
+
+
+@pytest.mark.parametrize('file', ECO2)
+@pytest.mark.parametrize('chunk_size', [1000, 1 << 16])
+def test_iter_pruned(file: str, chunk_size: int):
+    src = ROOT / file
+    tags = {'tbl_weather', 'weather_cha', 'tbl_zone'}
+
+    xml = Eco2Xml.read(src, sections=['DS'])
+    for e in tuple(xml.ds):
+        if e.tag in tags:
+            xml.ds.remove(e)
+
+    pruned = Eco2Xml.iter_pruned(src, tags, chunk_size=chunk_size)
+    assert ''.join(pruned) == xml.tostring('DS')
+
+
+@pytest.mark.parametrize('file', ECO2)
+@pytest.mark.parametrize('name', ['tbl_zone', 'tbl_yk', 'tbl_ykdetail'])
+def test_table(file: str, name: str):
+    pl = pytest.importorskip('polars')
+
+    xml = Eco2Xml.read(ROOT / file)
+    text = xml.tostring()
+    rows = xml.ds.findall(name)
+
+    df = xml.table(name)
+    assert df.height == len(rows)
+    assert all(df.schema[x] == pl.String for x in df.columns)
+    assert df.to_dicts() == [
+        {c: None if (e := r.find(c)) is None else e.text for c in df.columns}
+        for r in rows
+    ]
+
+    # 수정하지 않은 DataFrame
+    xml.set_table(name, df)
+    assert xml.tostring() == text
+
+    if not rows:
+        return
+
+    # 열 단위 수정
+    xml.set_table(name, df.with_columns(pl.col('code').str.zfill(8)))
+    assert [r.findtext('code') for r in rows] == [
+        x.zfill(8) if x is not None else None for x in df['code']
+    ]
+
+    with pytest.raises(ValueError, match='행 수 불일치'):
+        xml.set_table(name, df.head(0))
@@ -4,7 +4,10 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from eco2.editor import Eco2Editor
+from eco2.core import Eco2, Eco2Bytes
+from eco2.core.lazy import is_deferred
+from eco2.core.xml import Eco2Xml
+from eco2.editor import Eco2Editor, EditorError, ElementIndex
 from tests.data import ECO2, ROOT
 
 if TYPE_CHECKING:
@@ -30,3 +33,249 @@ def test_editor(file: str, tmp_path: Path):
     raw = src.read_bytes()
     edited = dst.read_bytes()
     assert raw != edited
+
+
+@pytest.mark.parametrize('file', ECO2)
+def test_editor_modified(file: str, tmp_path: Path):
+    src = ROOT / file
+    dst = tmp_path / file
+
+    # 수정하지 않은 경우 원본 영역 그대로 저장
+    editor = Eco2Editor(src)
+    editor.write(dst, dsr=True)
+    written = Eco2Bytes.read(dst)
+    assert written.raw_ds == editor.raw.raw_ds
+    assert editor.raw.raw_dsr is None or is_deferred(editor.xml, 'dsr')
+
+    # DS만 수정
+    (
+        editor.xml
+        .set_walls(uvalue=42.0)
+        .set_windows(uvalue=42.0, shgc=42.0)
+        .set_elements('tbl_zone/침기율', '42.0', edit_none=True)
+    )
+    assert set(editor.xml.changes) == {'DS'}
+    assert 'tbl_zone' in editor.xml.changes['DS']
+    assert editor.xml.modified('DS')
+    assert not editor.xml.modified('DSR')
+
+    editor.write(dst, dsr=True)
+    written = Eco2Bytes.read(dst)
+    assert written.raw_ds != editor.raw.raw_ds
+    assert written.raw_dsr == (editor.raw.raw_dsr or Eco2.EMPTY_DSR.encode())
+    assert written.ds == Eco2Xml.create(editor.xml.tostring()).tostring('DS')
+
+
+@pytest.mark.parametrize('file', ['test_tpl.tpl', 'test_tplx.tplx'])
+def test_editor_modified_lxml(file: str, tmp_path: Path):
+    dst = tmp_path / file
+    editor = Eco2Editor(ROOT / file)
+    xml = editor.xml
+
+    # 편집 method를 거치지 않은 수정
+    desc = xml.ds.find('tbl_Desc')
+    assert desc is not None
+    name = desc.find('buildname')
+    assert name is not None
+    name.text = 'edited'
+
+    window = next(iter(xml.surfaces_by_type('외부창')))
+    xml.set_window_uvalue(window, 1.2)
+
+    assert not xml.changes
+    assert xml.modified('DS')
+    assert not xml.modified('DSR')
+
+    editor.write(dst, dsr=True)
+    written = Eco2Editor(dst).xml
+    assert written.ds.findtext('tbl_Desc/buildname') == 'edited'
+    code = window.findtext('code')
+    assert {
+        x.findtext('창호열관류율')
+        for x in written.surfaces_by_type('외부창')
+        if x.findtext('code') == code
+    } == {'1.2'}
+
+    # 복사본은 원본 bytes 기준으로 판단
+    assert xml.copy().modified('DS')
+    assert not Eco2Editor(ROOT / file).xml.copy().modified('DS')
+
+
+def normalize_index(index: ElementIndex):
+    return {
+        name: {k: list(v) for k, v in getattr(index, name).items() if v}
+        for name in ['tags', 'keys', 'surfaces']
+    }
+
+
+@pytest.mark.parametrize('file', ECO2)
+def test_editor_index(file: str):
+    xml = Eco2Editor(ROOT / file).xml
+    xml.set_walls(uvalue=42.0).set_windows(uvalue=42.0, shgc=42.0)
+    xml.set_elements('tbl_yk/면형태', '0')
+
+    # 편집 후 색인과 새로 생성한 색인 비교
+    roots = [xml.ds] if xml.dsr is None else [xml.ds, xml.dsr]
+    assert normalize_index(xml.index) == normalize_index(ElementIndex.create(roots))
+    assert list(xml.surfaces_by_type(0)) == xml.ds.findall('tbl_yk')
+
+
+@pytest.mark.parametrize('file', ['test_tpl.tpl', 'test_tplx.tplx'])
+def test_editor_index_deferred(file: str):
+    xml = Eco2Editor(ROOT / file).xml
+    assert is_deferred(xml, 'dsr')
+
+    # 외피 수정에 DSR 해석 불필요
+    xml.set_walls(0.2).set_windows(uvalue=1.2)
+    _ = list(xml.surfaces_by_type('외벽(벽체)'))
+    assert is_deferred(xml, 'dsr')
+    assert not xml.modified('DSR')
+
+    # DSR은 해석 후 색인에 추가
+    assert xml.dsr is not None
+    assert xml.dsr in xml.index.roots
+    assert normalize_index(xml.index) == normalize_index(
+        ElementIndex.create([xml.ds, xml.dsr])
+    )
+
+
+def test_editor_set_table():
+    pl = pytest.importorskip('polars')
+
+    xml = Eco2Editor(ROOT / 'test_tpl.tpl').xml
+    walls = list(xml.surfaces_by_type('외벽(벽체)'))
+
+    df = xml.table('tbl_yk').with_columns(
+        pl
+        .when(pl.col('면형태') == '0')
+        .then(pl.lit('2'))
+        .otherwise(pl.col('면형태'))
+        .alias('면형태')
+    )
+    xml.set_table('tbl_yk', df)
+
+    assert xml.changes == {'DS': {'tbl_yk'}}
+    assert not list(xml.surfaces_by_type('외벽(벽체)'))
+    assert set(walls) <= set(xml.surfaces_by_type('외벽(바닥)'))
+
+
+def _surface_data(xml: Eco2Xml) -> dict[str, dict[str, float]]:
+    data: dict[str, dict[str, float]] = {}
+    for idx, surface in enumerate(xml.ds.iterfind('tbl_yk')):
+        if (code := surface.findtext('code')) == '0' or code is None:
+            continue
+
+        window = int(surface.findtext('면형태', -1)) in {7, 8}
+        data[code] = (
+            {'uvalue': 1.1 + idx / 100, 'shgc': 0.45}
+            if window
+            else {'uvalue': 0.2 + idx / 100}
+        )
+
+    return data
+
+
+@pytest.mark.parametrize('file', ECO2)
+def test_editor_set_surfaces(file: str):
+    xml = Eco2Editor(ROOT / file).xml
+    expected = Eco2Editor(ROOT / file).xml
+    data = _surface_data(xml)
+
+    edits = xml.set_surfaces({**data, '9999': {'uvalue': 1.0}})
+    assert edits.missing == ['9999']
+    assert edits.updated == list(data)
+
+    # 표면별로 수정한 결과와 동일
+    for code, values in data.items():
+        for surface in expected.index.find('tbl_yk', 'code', code):
+            if 'shgc' in values:
+                expected.set_window_uvalue(surface, values['uvalue'])
+                expected.set_window_shgc(surface, values['shgc'])
+            else:
+                expected.set_wall_uvalue(surface, values['uvalue'])
+
+    assert xml.tostring() == expected.tostring()
+    if data:
+        assert xml.changes['DS'] >= {'tbl_yk', 'tbl_ykdetail'}
+
+    roots = [xml.ds] if xml.dsr is None else [xml.ds, xml.dsr]
+    assert list(xml.index.tags.get('tbl_ykdetail', {})) == list(
+        ElementIndex.create(roots).tags.get('tbl_ykdetail', {})
+    )
+
+
+def test_editor_set_surfaces_frame():
+    pl = pytest.importorskip('polars')
+
+    xml = Eco2Editor(ROOT / 'test_tpl.tpl').xml
+    walls = [x.findtext('code', '') for x in xml.surfaces_by_type('외벽(벽체)')]
+    df = pl.DataFrame({
+        'code': [*walls, '9999'],
+        'uvalue': [0.15] * len(walls) + [1.0],
+        'shgc': [0.5] * len(walls) + [None],
+    })
+
+    edits = xml.set_surfaces(df)
+    assert edits.missing == ['9999']
+    assert edits.updated == walls
+    assert {x.findtext('열관류율') for x in xml.surfaces_by_type('외벽(벽체)')} == {
+        '0.15'
+    }
+
+    # 벽체의 SHGC만 지정한 경우
+    edits = xml.set_surfaces({walls[0]: {'shgc': 0.5}})
+    assert edits.skipped == walls[:1]
+
+    with pytest.raises(EditorError, match='알 수 없는 항목'):
+        xml.set_surfaces({walls[0]: {'u': 0.5}})
+
+
+@pytest.mark.parametrize('file', ECO2)
+def test_editor_low_memory(file: str, tmp_path: Path):
+    src = ROOT / file
+    editor = Eco2Editor(src)
+    _ = editor.eco2, editor.xml
+    low = Eco2Editor(src, low_memory=True)
+
+    before = editor.memory()
+    after = low.memory()
+    assert after.tree == 0
+    _ = low.xml
+    after = low.memory()
+
+    assert before.raw > 0
+    assert before.text > 0
+    assert not after.text
+    assert after.raw < before.raw
+    assert after.tree == before.tree
+    assert after.total == after.raw + after.tree
+    assert {'raw', 'eco2', '_cached'}.isdisjoint(vars(low))
+    assert low.header == editor.header
+
+    # 원본을 다시 읽음
+    assert low.raw.raw_ds == editor.raw.raw_ds
+
+    for e in [editor, low]:
+        e.xml.set_walls(uvalue=0.2).set_elements('tbl_zone/침기율', '1.0')
+        e.write(tmp_path / f'{id(e)}{src.suffix}')
+
+    # 수정하지 않은 DS도 tree에서 직렬화하므로 내용 비교
+    written = [Eco2.read(tmp_path / f'{id(e)}{src.suffix}') for e in [editor, low]]
+    assert Eco2Xml.create(written[0]).tostring() == (
+        Eco2Xml.create(written[1]).tostring()
+    )
+
+
+def test_editor_release(tmp_path: Path):
+    src = ROOT / 'test_tpl.tpl'
+    editor = Eco2Editor(src)
+    _ = editor.xml.dsr
+    editor.release()
+
+    assert editor.memory().raw == 0
+    assert editor.xml.modified('DS')
+    assert editor.xml.modified('DSR')
+
+    editor.write(dst := tmp_path / 'released.tpl')
+    expected = Eco2Xml.create(Eco2.read(src)).tostring()
+    assert Eco2Xml.create(Eco2.read(dst)).tostring() == expected
@@ -1,6 +1,11 @@
+import random
+import sys
+from pathlib import Path
+
 import pytest
 
-from eco2 import minilzo
+from eco2 import Eco2, minilzo
+from tests.data import ROOT
 
 
 @pytest.mark.parametrize(
@@ -11,7 +16,180 @@ from eco2 import minilzo
         b"I thought what I'd do was, I'd pretend I was one of those deaf-mutes.",
     ],
 )
-def test_compress(data):
-    compressed = minilzo.compress(data)
+@pytest.mark.parametrize('level', ['fast', 'best'])
+def test_compress(data, level):
+    compressed = minilzo.compress(data, level=level)
     decompressed = minilzo.decompress(compressed)
     assert data == decompressed
+
+
+def _check_first_literal(compressed: bytes) -> None:
+    # MiniLZO.cs는 1-3 bytes 첫 literal run 뒤의 match를 해제하지 못함
+    if 0x12 <= (first := compressed[4]) <= 0x14:  # ruff: ignore[magic-value-comparison]
+        assert compressed[5 + first - 17 :] == minilzo.lzo1x.EOF_MARKER
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        b'abc',
+        b'a' * 100,
+        b'ab' * 50,
+        b'abc' * 40 + b'xyz',
+        b'\x00\x01' + b'\x00' * 300,
+    ],
+)
+@pytest.mark.parametrize('level', ['fast', 'best'])
+def test_compress_first_literal(data: bytes, level: minilzo.Level):
+    compressed = minilzo.compress(data, level=level)
+    _check_first_literal(compressed)
+    assert minilzo.decompress(compressed) == data
+
+
+def test_compress_eco2():
+    data = minilzo.decompress(Eco2.xor((ROOT / 'test_ecox.ecox').read_bytes()))
+    data = data[: 1 << 18]
+
+    stats = {x.level: x for x in minilzo.measure(data)}
+    assert stats['best'].compressed <= stats['fast'].compressed < len(data)
+    assert stats['fast'].throughput > 0
+
+    levels: tuple[minilzo.Level, ...] = ('fast', 'best')
+    for level in levels:
+        compressed = minilzo.compress(data, level=level)
+        assert minilzo.decompress(compressed) == data
+
+
+@pytest.mark.parametrize('level', ['fast', 'best'])
+@pytest.mark.parametrize('chunk', [1000, 1 << 16])
+def test_compress_stream(level, chunk):
+    data = minilzo.decompress(Eco2.xor((ROOT / 'test_ecox.ecox').read_bytes()))
+    data = data[: 1 << 17]
+
+    compressor = minilzo.Compressor(len(data), level=level)
+    compressed = b''.join(
+        compressor.compress(data[i : i + chunk]) for i in range(0, len(data), chunk)
+    )
+    compressed += compressor.flush()
+    assert minilzo.decompress(compressed) == data
+
+    chunks = (compressed[i : i + 7] for i in range(0, len(compressed), 7))
+    assert b''.join(minilzo.iter_decompress(chunks)) == data
+
+    compressor = minilzo.Compressor(len(data) + 1, level=level)
+    compressor.compress(data)
+    with pytest.raises(ValueError, match='expected'):
+        compressor.flush()
+
+
+@pytest.mark.parametrize('level', ['fast', 'best'])
+def test_compress_stream_long_match(level: minilzo.Level):
+    # match 탐색 범위와 다음 chunk보다 긴 반복
+    rng = random.Random(42)  # ruff: ignore[suspicious-non-cryptographic-random-usage]
+    chunks = [rng.randbytes(100) + bytes(300000), rng.randbytes(1000)]
+    data = b''.join(chunks)
+
+    compressor = minilzo.Compressor(len(data), level=level)
+    compressed = b''.join(compressor.compress(x) for x in chunks) + compressor.flush()
+    assert minilzo.decompress(compressed) == data
+
+
+@pytest.mark.parametrize('file', ['test_ecox.ecox', 'test_tplx.tplx'])
+def test_decompress_python(file: str):
+    raw = (ROOT / file).read_bytes()
+    if file.endswith('.ecox'):
+        raw = Eco2.xor(raw)
+
+    data = minilzo.decompress(raw, backend='python')
+    assert len(data) == int.from_bytes(raw[:4], 'little')
+    assert b'<DS xmlns="http://tempuri.org/DS.xsd">' in data[:1024]
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        b'\x05\x00\x00\x00',
+        b'\x05\x00\x00\x00\x16abcde',
+        b'\x03\x00\x00\x00\x15abcd\x11\x00\x00',
+        b'\x05\x00\x00\x00\x16abcde\x11\x00\x00\x00',
+    ],
+)
+def test_decompress_error(data: bytes):
+    with pytest.raises(minilzo.MiniLzoDataError):
+        minilzo.decompress(data, backend='python')
+
+    with pytest.raises(minilzo.MiniLzoDataError):
+        b''.join(minilzo.iter_decompress([data[:3], data[3:]]))
+
+
+def test_backend(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv('ECO2_MINILZO_BACKEND', raising=False)
+    assert minilzo.get_backend() == 'python'
+    assert minilzo.get_backend('exe') == 'exe'
+
+    monkeypatch.setenv('ECO2_MINILZO_BACKEND', 'exe')
+    assert minilzo.get_backend() == 'exe'
+
+    with pytest.raises(ValueError, match='backend'):
+        minilzo.get_backend('dotnet')  # type: ignore[arg-type]
+
+
+SERVER = """\
+import struct
+import sys
+
+from eco2.minilzo import lzo1x
+
+stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+while head := stdin.read(5):
+    mode, length = struct.unpack('<ci', head)
+    data = stdin.read(length)
+    try:
+        fn = lzo1x.compress if mode == b'c' else lzo1x.decompress
+        status, result = 0, fn(data)
+    except ValueError as e:
+        status, result = 1, str(e).encode()
+    stdout.write(struct.pack('<Bi', status, len(result)) + result)
+    stdout.flush()
+"""
+
+
+@pytest.fixture
+def fake_minilzo(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    """`MiniLZO.exe serve`와 같은 frame 형식으로 응답하는 스크립트."""
+    if sys.platform == 'win32':
+        pytest.skip('shebang script')
+
+    script = tmp_path / 'MiniLZO'
+    script.write_text(f'#!{sys.executable}\n{SERVER}')
+    script.chmod(0o755)
+
+    monkeypatch.setattr(minilzo.minilzo, 'find_minilzo', lambda _: str(script))
+    monkeypatch.setenv('PYTHONPATH', str(Path(__file__).parents[1]))
+    return script
+
+
+def test_worker_pool(fake_minilzo):
+    data = b"I thought what I'd do was, I'd pretend I was one of those deaf-mutes."
+
+    with minilzo.MiniLzoWorkerPool(str(fake_minilzo), size=1) as pool:
+        for _ in range(3):
+            compressed = pool.request('compress', data)
+            assert pool.request('decompress', compressed) == data
+
+        with pool.worker() as worker:
+            pid = worker.process.pid
+
+        with pytest.raises(minilzo.MiniLzoDataError):
+            pool.request('decompress', b'\x05\x00\x00\x00')
+
+        with pool.worker() as worker:
+            assert worker.process.pid == pid  # 재사용
+
+        # 응답 도중 중단된 worker는 종료
+        with pytest.raises(KeyboardInterrupt), pool.worker() as worker:
+            raise KeyboardInterrupt
+
+        assert not worker.alive
+        with pool.worker() as worker:
+            assert worker.process.pid != pid
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import functools
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+from lxml import etree
+
+from eco2 import parallel
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _task(state: int, value: int) -> tuple[int, int]:
+    return os.getpid(), state * value
+
+
+def _factory(state: int) -> int:
+    return state + 1
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+@pytest.mark.parametrize('factory', [False, True])
+def test_run(workers: int, factory: bool):  # ruff: ignore[boolean-type-hint-positional-argument]
+    items = [(x,) for x in range(20)]
+    result = list(
+        parallel.run(
+            _task,
+            2,
+            items,
+            workers=workers,
+            factory=functools.partial(_factory, 2) if factory else None,
+        )
+    )
+
+    # 현재 process에서는 `state`, worker process에서는 `factory` 결과 사용
+    state = 3 if factory and workers > 1 else 2
+    assert [x[1] for x in result] == [state * x for x in range(20)]
+    assert (os.getpid() in {x[0] for x in result}) is (workers == 1)
+
+
+def test_chunksize():
+    assert parallel.chunksize(1, 8) == 1
+    assert parallel.chunksize(100, 2) == 12  # ruff: ignore[magic-value-comparison]
+    assert parallel.chunksize(10000, 2) == parallel.MAX_CHUNKSIZE
+
+
+@pytest.mark.parametrize(
+    'error', [ZeroDivisionError(), ValueError('value'), etree.LxmlError('xml')]
+)
+def test_attempt(error: Exception, tmp_path: Path):
+    dst = tmp_path / 'dst'
+
+    def write():
+        dst.write_text('partial')
+        raise error
+
+    message = parallel.attempt(write, dst)
+    assert message is not None
+    assert message.startswith(type(error).__name__)
+    assert not dst.exists()
+
+    assert parallel.attempt(lambda: dst.write_text('done'), dst) is None
+    assert dst.read_text() == 'done'
+
+
+def test_attempt_raise(tmp_path: Path):
+    def interrupt():
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        parallel.attempt(interrupt, tmp_path / 'dst')
@@ -0,0 +1,73 @@
+# ruff: file-ignore[suspicious-subprocess-import]
+from __future__ import annotations
+
+import subprocess as sp
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('polars')
+
+from eco2 import Eco2, Eco2Xml
+from eco2.snapshot import Snapshot
+from tests.data import ECO2, ECO2OD, ROOT
+
+
+@pytest.mark.parametrize('file', [*ECO2, *ECO2OD])
+def test_snapshot(file: str, tmp_path: Path):
+    src = ROOT / file
+    eco = Eco2.read(src)
+
+    snapshot = Snapshot.write(src, tmp_path / 'snapshot')
+    assert not snapshot.meta['sections']['DS']['raw']
+
+    restored = Snapshot(tmp_path / 'snapshot').to_eco2()
+    assert restored.header == eco.header
+    assert restored.ds == eco.ds
+    assert restored.dsr == eco.dsr
+
+    # ECO2 저장 파일 재현
+    eco.write(expected := tmp_path / f'expected{src.suffix}')
+    restored.write(actual := tmp_path / f'actual{src.suffix}')
+    assert actual.read_bytes() == expected.read_bytes()
+
+    # table
+    xml = Eco2Xml.create(eco)
+    assert 'tbl_Desc' in snapshot.tables()
+    for name in snapshot.tables()[:5]:
+        table = snapshot.table(name)
+        assert table.height == len(xml.ds.findall(name))
+
+    with pytest.raises(FileExistsError):
+        Snapshot.write(src, tmp_path / 'snapshot')
+
+
+def test_snapshot_raw(tmp_path: Path):
+    eco = Eco2.read(ROOT / 'test_tpl.tpl')
+    eco.ds = eco.ds.replace('<tbl_Desc>', '<tbl_Desc id="1">', 1)
+
+    snapshot = Snapshot.write(eco, tmp_path / 'snapshot')
+    assert snapshot.meta['sections']['DS']['raw']
+    assert not snapshot.meta['sections']['DSR']['raw']
+    assert snapshot.to_eco2().ds == eco.ds
+
+
+def test_snapshot_without_polars(tmp_path: Path):
+    # polars 없이 import, meta 읽기
+    Snapshot.write(ROOT / 'test_tpl.tpl', tmp_path / 'snapshot')
+    script = f"""
+import sys
+sys.modules['polars'] = None
+from eco2.snapshot import Snapshot
+snapshot = Snapshot({str(tmp_path / 'snapshot')!r})
+print(snapshot.header.Name, len(snapshot.tables()))
+"""
+    result = sp.run(  # ruff: ignore[subprocess-without-shell-equals-true]
+        [sys.executable, '-c', script],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parents[1],
+        text=True,
+    )
+    assert result.stdout.strip()
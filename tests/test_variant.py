@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import csv
+from typing import TYPE_CHECKING
+
+import pytest
+
+from eco2.cli import app
+from eco2.core import Eco2Bytes
+from eco2.editor import Eco2Editor
+from eco2.variant import VariantError, VariantGenerator, VariantTemplate, grid, lhs
+from tests.data import ECO2, ROOT
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SRC = ROOT / 'test_tpl.tpl'
+
+
+def _manifest(path: Path) -> list[dict[str, str]]:
+    with path.open(encoding='UTF-8', newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def test_grid():
+    space = grid({'a': [1, 2, 3], 'b': ['x', 'y']})
+    assert len(space) == 6  # ruff: ignore[magic-value-comparison]
+    assert space[0] == {'a': 1, 'b': 'x'}
+    assert space[-1] == {'a': 3, 'b': 'y'}
+
+
+def test_lhs():
+    n = 10
+    space = lhs({'a': (0.0, 1.0), 'b': (10.0, 20.0)}, n, seed=42, ndigits=None)
+    assert len(space) == n
+    assert space == lhs({'a': (0.0, 1.0), 'b': (10.0, 20.0)}, n, seed=42, ndigits=None)
+
+    # 변수별로 구간마다 하나씩 추출
+    for name, (lower, upper) in {'a': (0.0, 1.0), 'b': (10.0, 20.0)}.items():
+        strata = sorted(int((x[name] - lower) / (upper - lower) * n) for x in space)  # type: ignore[operator]
+        assert strata == list(range(n))
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_variant_generator(workers: int, tmp_path: Path):
+    space = grid({
+        'wall_uvalue': [0.15, 0.2],
+        'window_shgc': [0.4],
+        'tbl_zone/침기율': [0.5, 1.0],
+    })
+    generator = VariantGenerator(SRC, template=False)
+    result = generator.generate(space, tmp_path, workers=workers)
+
+    assert [x.params for x in result] == space
+    assert all(x.error is None for x in result)
+
+    manifest = _manifest(tmp_path / VariantGenerator.MANIFEST)
+    assert [x['path'] for x in manifest] == [x.path.name for x in result]
+    assert manifest[-1]['tbl_zone/침기율'] == '1.0'
+
+    # Eco2Editor로 직접 수정한 결과와 동일
+    for variant in result:
+        params = variant.params
+        editor = Eco2Editor(SRC)
+        (
+            editor.xml
+            .set_walls(float(params['wall_uvalue']))
+            .set_windows(shgc=float(params['window_shgc']))
+            .set_elements(
+                'tbl_zone/침기율', str(params['tbl_zone/침기율']), edit_none=True
+            )
+        )
+        editor.write(expected := tmp_path / 'expected.tpl')
+        assert variant.path.read_bytes() == expected.read_bytes()
+
+    # 기준 파일은 수정되지 않음
+    assert not generator.base[1].changes
+
+
+def test_variant_copy():
+    generator = VariantGenerator(SRC)
+    base = generator.base[1]
+    a = generator.variant({'tbl_zone/침기율': 42})
+    b = generator.variant({})
+
+    assert a.ds is not base.ds
+    assert {x.text for x in a.iterfind('tbl_zone/침기율')} == {'42'}
+    assert '42' not in {x.text for x in b.iterfind('tbl_zone/침기율')}
+    assert not b.changes
+    assert not b.modified('DSR')
+
+
+@pytest.mark.parametrize(
+    ('file', 'suffix'), [*((x, None) for x in ECO2), ('test_tpl.tpl', '.ecox')]
+)
+def test_variant_template(file: str, suffix: str | None, tmp_path: Path):
+    space = grid({
+        'wall_uvalue': [0.15, 0.2],
+        'roof_uvalue': [0.1],
+        'window_uvalue': [1.2],
+        'window_shgc': [0.4],
+        'tbl_zone/침기율': [0.5, 'a&b'],
+    })
+    tree = VariantGenerator(ROOT / file, suffix=suffix, template=False)
+    template = VariantGenerator(ROOT / file, suffix=suffix)
+    expected = tree.generate(space, tmp_path / 'tree', workers=1)
+    result = template.generate(space, tmp_path / 'template', workers=1)
+
+    assert template.variant_template(space[0]) is not None
+    for e, r in zip(expected, result, strict=True):
+        assert r.path.read_bytes() == e.path.read_bytes()
+
+
+def test_variant_template_fallback(tmp_path: Path):
+    generator = VariantGenerator(SRC)
+
+    # 기존 값에 따라 수정 대상이 달라지는 조합
+    with pytest.raises(VariantError):
+        VariantTemplate.create(
+            generator.base[0],
+            generator.base[1].copy(),
+            ['tbl_yk/일사에너지투과율', 'window_shgc'],
+        )
+
+    params = {'window_shgc': 0.4, 'tbl_myoun/투과율': 0.5}
+    generator.write(params, tmp_path / 'a.tpl')
+    VariantGenerator(SRC, template=False).write(params, tmp_path / 'b.tpl')
+    assert (tmp_path / 'a.tpl').read_bytes() == (tmp_path / 'b.tpl').read_bytes()
+
+
+@pytest.mark.parametrize(('template', 'workers'), [(False, 1), (False, 2), (True, 1)])
+def test_variant_error(template: bool, workers: int, tmp_path: Path):  # ruff: ignore[boolean-type-hint-positional-argument]
+    result = VariantGenerator(SRC, suffix='tplx', template=template).generate(
+        [
+            {'wall_uvalue': 0.2},
+            {'unknown': 1},
+            {'wall_uvalue': 'abc'},
+            {'wall_uvalue': 0},
+        ],
+        tmp_path,
+        workers=workers,
+    )
+
+    assert result[0].error is None
+    assert result[0].path.suffix == '.tplx'
+    Eco2Bytes.read(result[0].path)
+
+    # 알 수 없는 변수, float로 변환할 수 없는 값, 계산할 수 없는 값
+    for variant in result[1:]:
+        assert variant.error is not None
+        assert not variant.path.exists()
+
+    manifest = _manifest(tmp_path / VariantGenerator.MANIFEST)
+    assert all(x['error'].startswith('VariantError') for x in manifest[1:3])
+    assert manifest[3]['error']
+
+
+def test_cli_variant(tmp_path: Path):
+    output = tmp_path / 'grid'
+    args = [
+        'variant',
+        SRC,
+        '--param',
+        'wall_uvalue=0.15,0.2',
+        '--param',
+        'tbl_zone/침기율=0.5,1.0',
+        '--output',
+        output,
+        '--workers',
+        1,
+    ]
+    with pytest.raises(SystemExit):
+        app(list(map(str, args)))
+    assert len(_manifest(output / VariantGenerator.MANIFEST)) == 4  # ruff: ignore[magic-value-comparison]
+
+    output = tmp_path / 'lhs'
+    args = [
+        'variant',
+        SRC,
+        '--param',
+        'wall_uvalue=0.1:0.3',
+        '--samples',
+        3,
+        '--seed',
+        0,
+        '--output',
+        output,
+        '--workers',
+        1,
+    ]
+    with pytest.raises(SystemExit):
+        app(list(map(str, args)))
+    manifest = _manifest(output / VariantGenerator.MANIFEST)
+    assert len(manifest) == 3  # ruff: ignore[magic-value-comparison]
+    assert all(0.1 <= float(x['wall_uvalue']) <= 0.3 for x in manifest)  # ruff: ignore[magic-value-comparison]
+
+    table = tmp_path / 'variants.csv'
+    table.write_text('wall_uvalue,window_uvalue\n0.2,1.5\n', encoding='UTF-8')
+    output = tmp_path / 'table'
+    args = ['variant', SRC, '--table', table, '--output', output]
+    with pytest.raises(SystemExit):
+        app(list(map(str, args)))
+    manifest = _manifest(output / VariantGenerator.MANIFEST)
+    assert manifest == [
+        {
+            'path': 'test_tpl_0.tpl',
+            'wall_uvalue': '0.2',
+            'window_uvalue': '1.5',
+            'error': '',
+        }
+    ]